@@ -6,12 +6,19 @@ from mmap import ACCESS_READ
 from datetime import datetime
 from datetime import timedelta
 import uuid
-from typing import NamedTuple, List, Dict, Union
+from typing import NamedTuple, List, Dict, Union, Iterator, Tuple
 from dataclasses import dataclass
 
 import numpy as np
 
 from seiscore.binaryfile.resampling.wrap import resampling
+from seiscore.binaryfile.resampling.parallel import parallel_resampling
+from seiscore.binaryfile.resampling.decimation import decimation
+from seiscore.binaryfile.resampling.decimation import MEAN_MODE
+from seiscore.binaryfile.resampling.decimation import RESAMPLE_MODES
+from seiscore.binaryfile.cache import SignalCache
+from seiscore.binaryfile.cache import create_cache_key
+from seiscore.binaryfile.cache import get_default_cache
 
 
 class TypeClass(NamedTuple):
@@ -27,6 +34,11 @@ class FileHeader(NamedTuple):
     latitude: float
 
 
+class SignalChunk(NamedTuple):
+    datetime_start: datetime
+    signal: np.ndarray
+
+
 def format_duration(days: int, hours: int, minutes: int,
                     seconds: float) -> str:
     hours_fmt = str(hours).zfill(2)
@@ -81,7 +93,37 @@ BINARY_FILE_FORMATS = {BAIKAL7_FMT: BAIKAL7_EXTENSION,
                        SIGMA_FMT: SIGMA_EXTENSION}
 
 SIGMA_SECONDS_OFFSET = 2
+HEADER_BLOCK_SIZE = 120
+
+# headers fields layout (little-endian, offsets in bytes)
+BAIKAL7_HEADER_DTYPE = np.dtype({
+    'names': ['channel_count', 'frequency', 'latitude', 'longitude',
+              'time_begin'],
+    'formats': ['<u2', '<u2', '<f8', '<f8', '<u8'],
+    'offsets': [0, 22, 72, 80, 104]})
+BAIKAL8_HEADER_DTYPE = np.dtype({
+    'names': ['channel_count', 'day', 'month', 'year', 'dt', 'seconds',
+              'latitude', 'longitude'],
+    'formats': ['<u2', '<u2', '<u2', '<u2', '<f8', '<f8', '<f8', '<f8'],
+    'offsets': [0, 6, 8, 10, 48, 56, 72, 80]})
+SIGMA_HEADER_DTYPE = np.dtype({
+    'names': ['channel_count', 'frequency', 'latitude', 'longitude', 'date',
+              'time'],
+    'formats': ['<u4', '<u4', 'S8', 'S9', '<u4', '<u4'],
+    'offsets': [12, 24, 40, 48, 60, 64]})
+HEADER_DTYPES = {BAIKAL7_FMT: BAIKAL7_HEADER_DTYPE,
+                 BAIKAL8_FMT: BAIKAL8_HEADER_DTYPE,
+                 SIGMA_FMT: SIGMA_HEADER_DTYPE}
+
+# decoded headers of several files
+FILE_HEADERS_DTYPE = np.dtype([
+    ('format_type', 'U7'), ('channel_count', np.uint32),
+    ('frequency', np.uint32), ('datetime_start', 'datetime64[us]'),
+    ('longitude', np.float64), ('latitude', np.float64),
+    ('is_valid', np.bool_), ('error', 'U64')])
 COMPONENTS_ORDER = 'ZXY'
+# discretes count of one de-interleaving block
+DEINTERLEAVE_BLOCK_SIZE = 2 ** 16
 
 
 class BadHeaderData(ValueError):
@@ -100,10 +142,18 @@ class InvalidResampleFrequency(ValueError):
     pass
 
 
+class InvalidResampleMode(ValueError):
+    pass
+
+
 class InvalidDateTimeValue(ValueError):
     pass
 
 
+class InvalidChunkSize(ValueError):
+    pass
+
+
 def is_binary_file_path(path) -> bool:
     if os.path.isfile(path):
         extension = os.path.basename(path).split('.')[-1]
@@ -143,79 +193,324 @@ def binary_read(bin_data, x_type: TypeClass, count: int, skipping_bytes=0) \
     return result
 
 
+def read_header_block(file_path: str) -> bytes:
+    """
+    Reading of file header block with single read() call
+    :param file_path: path to file
+    :return: header block bytes
+    """
+    with open(file_path, 'rb') as f:
+        return f.read(HEADER_BLOCK_SIZE)
+
+
 def get_datetime_start_baikal7(time_begin: int) -> datetime:
     const_datetime = datetime(1980, 1, 1, 0, 0, 0)
     seconds = time_begin / 256_000_000
     return const_datetime + timedelta(seconds=seconds)
 
 
-def read_baikal7_header(file_path: str) -> FileHeader:
+def seconds_to_timedelta64(seconds: np.ndarray) -> np.ndarray:
+    # the same rounding as timedelta(seconds=...): whole seconds and
+    # round-half-even microseconds
+    whole_seconds = np.floor(seconds)
+    microseconds = np.round((seconds - whole_seconds) * 1e6)
+    return (whole_seconds.astype(np.int64) * 1_000_000 +
+            microseconds.astype(np.int64)).astype('timedelta64[us]')
+
+
+def dates_to_datetime64(years: np.ndarray, months: np.ndarray,
+                        days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized creation of dates
+    :return: array of dates and mask of valid dates
+    """
+    years, months, days = (np.asarray(x, dtype=np.int64)
+                           for x in (years, months, days))
+    year_months = (years - 1970) * 12 + months - 1
+    dates = year_months.astype('datetime64[M]').astype('datetime64[D]') + \
+        (days - 1).astype('timedelta64[D]')
+    is_valid = (months >= 1) & (months <= 12) & (days >= 1) & \
+        (dates.astype('datetime64[M]') ==
+         year_months.astype('datetime64[M]'))
+    return dates.astype('datetime64[us]'), is_valid
+
+
+def check_record_parameters(headers: np.ndarray) -> np.ndarray:
+    """
+    Checking of channels count and frequency (zero-filled headers of
+    preallocated files are decoded without errors)
+    :param headers: array with FILE_HEADERS_DTYPE (error field is filled
+    for invalid headers)
+    :return: mask of valid headers
+    """
+    is_valid = (headers['channel_count'] >= 1) & (headers['frequency'] >= 1)
+    headers['error'][~is_valid] = 'invalid channel count/frequency'
+    return is_valid
+
+
+def decode_baikal7_headers(records: np.ndarray) -> np.ndarray:
     """
     Details: http://www.gsras.ru/unu/uploads/files/Dataloggers/Baikal-7HR.pdf
     """
-    with open(file_path, 'rb') as f:
-        channel_count = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 0)
-        frequency = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 22)
-        latitude = binary_read(f, DOUBLE_CTYPE, 1, 72)
-        longitude = binary_read(f, DOUBLE_CTYPE, 1, 80)
-        time_begin = binary_read(f, UNSIGNED_LONG_LONG_CTYPE, 1, 104)
+    headers = np.zeros(records.shape[0], dtype=FILE_HEADERS_DTYPE)
+    headers['format_type'] = BAIKAL7_FMT
+    headers['channel_count'] = records['channel_count']
+    headers['frequency'] = records['frequency']
+    headers['latitude'] = records['latitude']
+    headers['longitude'] = records['longitude']
+    # time_begin values exceed float64 precision, datetimes are created
+    # one by one for the same rounding as get_datetime_start_baikal7
+    headers['datetime_start'] = [get_datetime_start_baikal7(int(x))
+                                 for x in records['time_begin']]
+    headers['is_valid'] = check_record_parameters(headers)
+    return headers
+
+
+def decode_baikal8_headers(records: np.ndarray) -> np.ndarray:
+    headers = np.zeros(records.shape[0], dtype=FILE_HEADERS_DTYPE)
+    headers['format_type'] = BAIKAL8_FMT
+    headers['channel_count'] = records['channel_count']
+    headers['latitude'] = records['latitude']
+    headers['longitude'] = records['longitude']
+
+    dates, is_valid_dates = dates_to_datetime64(
+        records['year'], records['month'], records['day'])
+    headers['datetime_start'] = dates + \
+        seconds_to_timedelta64(records['seconds'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frequency = 1 / records['dt']
+    is_valid_frequency = np.isfinite(frequency) & (frequency >= 1)
+    headers['frequency'] = np.where(is_valid_frequency, frequency, 0)
+
+    is_valid_parameters = check_record_parameters(headers)
+    headers['is_valid'] = is_valid_dates & is_valid_frequency & \
+        is_valid_parameters
+    headers['error'][~is_valid_dates] = 'invalid date values'
+    headers['error'][~is_valid_frequency] = 'invalid frequency'
+    return headers
+
+
+def parse_sigma_coordinate(src: bytes, degrees_length: int) -> float:
+    src = src.decode('utf-8')
+    return round(int(src[:degrees_length]) +
+                 float(src[degrees_length:-1]) / 60, 2)
+
+
+def decode_sigma_headers(records: np.ndarray) -> np.ndarray:
+    headers = np.zeros(records.shape[0], dtype=FILE_HEADERS_DTYPE)
+    headers['format_type'] = SIGMA_FMT
+    headers['channel_count'] = records['channel_count']
+    headers['frequency'] = records['frequency']
+
+    date_src = records['date'].astype(np.int64)
+    time_src = records['time'].astype(np.int64)
+    dates, is_valid_datetime = dates_to_datetime64(
+        2000 + date_src // 10_000, date_src // 100 % 100, date_src % 100)
+    hours, minutes = time_src // 10_000, time_src // 100 % 100
+    seconds = time_src % 100
+    is_valid_datetime &= (date_src < 1_000_000) & (hours < 24) & \
+        (minutes < 60) & (seconds < 60)
+    headers['datetime_start'] = dates + (
+        hours * 3600 + minutes * 60 + seconds).astype('timedelta64[s]')
+    headers['error'][~is_valid_datetime] = 'invalid date/time values'
+
+    is_valid_coordinates = np.ones(records.shape[0], dtype=np.bool_)
+    for i, record in enumerate(records):
+        try:
+            headers['longitude'][i] = parse_sigma_coordinate(
+                record['longitude'], 3)
+            headers['latitude'][i] = parse_sigma_coordinate(
+                record['latitude'], 2)
+        except ValueError:
+            is_valid_coordinates[i] = False
+    headers['error'][~is_valid_coordinates] = 'invalid longitude/latitude'
+
+    headers['is_valid'] = is_valid_datetime & is_valid_coordinates & \
+        check_record_parameters(headers)
+    return headers
+
+
+HEADER_DECODERS = {BAIKAL7_FMT: decode_baikal7_headers,
+                   BAIKAL8_FMT: decode_baikal8_headers,
+                   SIGMA_FMT: decode_sigma_headers}
+
+
+def decode_header_block(header_block: bytes, format_type: str) -> np.ndarray:
+    """
+    Decoding of one header block
+    :param header_block: header block bytes
+    :param format_type: file format
+    :return: 1-element array with FILE_HEADERS_DTYPE
+    """
+    dtype = HEADER_DTYPES[format_type]
+    if len(header_block) < dtype.itemsize:
+        raise BadHeaderData('header block is too short')
+    records = np.frombuffer(header_block, dtype=dtype, count=1)
+    return HEADER_DECODERS[format_type](records)
+
+
+def create_file_header(headers: np.ndarray) -> FileHeader:
+    header = headers[0]
+    if not header['is_valid']:
+        raise BadHeaderData(str(header['error']))
+    return FileHeader(int(header['channel_count']), int(header['frequency']),
+                      header['datetime_start'].item(),
+                      float(header['longitude']), float(header['latitude']))
 
-    datetime_start = get_datetime_start_baikal7(time_begin)
-    return FileHeader(channel_count, frequency, datetime_start, longitude,
-                      latitude)
+
+def read_baikal7_header(file_path: str) -> FileHeader:
+    header_block = read_header_block(file_path)
+    return create_file_header(decode_header_block(header_block, BAIKAL7_FMT))
 
 
 def read_baikal8_header(file_path: str) -> FileHeader:
-    with open(file_path, 'rb') as f:
-        channel_count = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 0)
-        day = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 6)
-        month = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 8)
-        year = binary_read(f, UNSIGNED_SHORT_CTYPE, 1, 10)
-        dt = binary_read(f, DOUBLE_CTYPE, 1, 48)
-        seconds = binary_read(f, DOUBLE_CTYPE, 1, 56)
-        latitude = binary_read(f, DOUBLE_CTYPE, 1, 72)
-        longitude = binary_read(f, DOUBLE_CTYPE, 1, 80)
-    datetime_start = datetime(year, month, day, 0, 0, 0) + timedelta(
-        seconds=seconds)
-    frequency = int(1 / dt)
-    return FileHeader(channel_count, frequency, datetime_start, longitude,
-                      latitude)
+    header_block = read_header_block(file_path)
+    return create_file_header(decode_header_block(header_block, BAIKAL8_FMT))
 
 
 def read_sigma_header(file_path: str) -> FileHeader:
-    with open(file_path, 'rb') as f:
-        channel_count = binary_read(f, UNSIGNED_INT_CTYPE, 1, 12)
-        frequency = binary_read(f, UNSIGNED_INT_CTYPE, 1, 24)
-        latitude_src = binary_read(f, CHAR_CTYPE, 8, 40)
-        longitude_src = binary_read(f, CHAR_CTYPE, 9, 48)
-        date_src = str(binary_read(f, UNSIGNED_INT_CTYPE, 1, 60))
-        time_src = str(binary_read(f, UNSIGNED_INT_CTYPE, 1, 64))
-
-    date_src = date_src.zfill(6)
-    time_src = time_src.zfill(6)
-    year = 2000 + int(date_src[:2])
-    month, day = int(date_src[2:4]), int(date_src[4:])
-    hours, minutes = int(time_src[:2]), int(time_src[2:4])
-    seconds = int(time_src[4:])
-    try:
-        datetime_start = datetime(year, month, day, hours, minutes, seconds)
-    except ValueError:
-        raise BadHeaderData('invalid date/time values')
-
-    try:
-        longitude = round(int(longitude_src[:3]) +
-                          float(longitude_src[3:-1]) / 60, 2)
-        latitude = round(int(latitude_src[:2]) +
-                         float(latitude_src[2:-1]) / 60, 2)
-    except ValueError:
-        raise BadHeaderData('invalid longitude/latitude')
-    return FileHeader(channel_count, frequency, datetime_start, longitude,
-                      latitude)
+    header_block = read_header_block(file_path)
+    return create_file_header(decode_header_block(header_block, SIGMA_FMT))
+
+
+def read_headers(file_paths: List[str]) -> np.ndarray:
+    """
+    Batch reading of files headers (one read() call for each file, fields
+    are decoded for all files of same format at once)
+    :param file_paths: list of files paths
+    :return: array with FILE_HEADERS_DTYPE (in order of file_paths), for
+    unreadable files is_valid field is False and error field has description
+    """
+    headers = np.zeros(len(file_paths), dtype=FILE_HEADERS_DTYPE)
+    format_types = [get_format_type(x) for x in file_paths]
+    for i, format_type in enumerate(format_types):
+        if format_type is None:
+            headers['error'][i] = 'unknown file format'
+
+    for format_type, dtype in HEADER_DTYPES.items():
+        indexes = [i for i, x in enumerate(format_types) if x == format_type]
+        if not indexes:
+            continue
+
+        records = np.zeros(len(indexes), dtype=dtype)
+        records_bytes = records.view(np.uint8).reshape(len(indexes),
+                                                       dtype.itemsize)
+        errors = [''] * len(indexes)
+        for j, file_index in enumerate(indexes):
+            try:
+                header_block = read_header_block(file_paths[file_index])
+            except OSError as e:
+                errors[j] = f'reading error: {e.strerror}'
+                continue
+            if len(header_block) < dtype.itemsize:
+                errors[j] = 'header block is too short'
+                continue
+            records_bytes[j] = np.frombuffer(header_block, dtype=np.uint8,
+                                             count=dtype.itemsize)
+
+        format_headers = HEADER_DECODERS[format_type](records)
+        for j, error in enumerate(errors):
+            if error:
+                format_headers[j] = np.zeros(1, dtype=FILE_HEADERS_DTYPE)[0]
+                format_headers['format_type'][j] = format_type
+                format_headers['error'][j] = error
+        headers[indexes] = format_headers
+    return headers
+
+
+def get_format_type(file_path: str) -> Union[str, None]:
+    extension = os.path.basename(file_path).split('.')[-1]
+    for format_type, format_extension in BINARY_FILE_FORMATS.items():
+        if extension == format_extension:
+            return format_type
+
+
+def read_file_header(file_path: str,
+                     format_type: str) -> Union[FileHeader, None]:
+    if format_type == BAIKAL7_FMT:
+        return read_baikal7_header(file_path)
+    elif format_type == BAIKAL8_FMT:
+        return read_baikal8_header(file_path)
+    elif format_type == SIGMA_FMT:
+        return read_sigma_header(file_path)
+    else:
+        return
+
+
+def get_header_memory_size(channel_count: int) -> int:
+    return HEADER_BLOCK_SIZE + 72 * channel_count
+
+
+def get_discrete_amount(file_size: int, channel_count: int) -> int:
+    return int((file_size - get_header_memory_size(channel_count)) / (
+            channel_count * UNSIGNED_INT_CTYPE.byte_size))
+
+
+def get_seconds_duration(discrete_amount: int, frequency: int) -> float:
+    accuracy = int(math.log10(frequency))
+    return round(discrete_amount / frequency, accuracy)
+
+
+def get_datetime_start(origin_datetime_start: datetime,
+                       format_type: str) -> datetime:
+    if format_type == SIGMA_FMT:
+        time_diff = timedelta(seconds=SIGMA_SECONDS_OFFSET)
+    else:
+        time_diff = timedelta(seconds=0)
+    return origin_datetime_start + time_diff
+
+
+def get_discrete_index(datetime_start: datetime, moment: datetime,
+                       frequency: int) -> int:
+    dt_seconds = (moment - datetime_start).total_seconds()
+    return int(round(dt_seconds * frequency))
+
+
+def get_end_discrete_index(datetime_start: datetime, moment: datetime,
+                           frequency: int, start_index: int,
+                           resample_parameter: int) -> int:
+    # signal length is aligned by resample parameter
+    discreet_index = get_discrete_index(datetime_start, moment, frequency)
+    signal_length = discreet_index - start_index
+    signal_length -= signal_length % resample_parameter
+    return start_index + signal_length
+
+
+def deinterleave(records: np.ndarray, column_indexes: List[int],
+                 block_size=DEINTERLEAVE_BLOCK_SIZE) -> np.ndarray:
+    """
+    Converting interleaved records into channel-major array. Records are
+    read sequentially by blocks, so only one block of source records is
+    touched at a time
+    :param records: 2D array (discretes x channels)
+    :param column_indexes: indexes of selected channels
+    :param block_size: discretes count of one block
+    :return: 2D array (selected channels x discretes)
+    """
+    discrete_amount = records.shape[0]
+    signals = np.empty((len(column_indexes), discrete_amount),
+                       dtype=records.dtype)
+    for left_edge in range(0, discrete_amount, block_size):
+        right_edge = min(left_edge + block_size, discrete_amount)
+        block = records[left_edge:right_edge]
+        for i, column_index in enumerate(column_indexes):
+            signals[i, left_edge:right_edge] = block[:, column_index]
+    return signals
+
+
+def get_signal_dtype(resample_parameter: int, resample_mode: str) -> np.dtype:
+    # integer signal is kept by mean resampling, decimation filters return
+    # float values
+    if resample_parameter == 1 or resample_mode == MEAN_MODE:
+        return np.dtype(np.int32)
+    return np.dtype(np.float64)
 
 
 class BinaryFile:
     def __init__(self, file_path: str,
-                 resample_frequency=0, is_use_avg_values=False):
+                 resample_frequency=0, is_use_avg_values=False,
+                 resample_mode=MEAN_MODE,
+                 signal_cache: Union[SignalCache, None] = None):
         is_path_correct = is_binary_file_path(path=file_path)
         if not is_path_correct:
             raise BadFilePath(f'Invalid path - {file_path}')
@@ -223,6 +518,17 @@ class BinaryFile:
         # full file path
         self.__path = file_path
 
+        # cached values (file parameters are calculated once)
+        self.__format_type = None
+        self.__discrete_amount = None
+        self.__seconds_duration = None
+        self.__datetime_start = None
+        self.__datetime_stop = None
+        self.__components_index = None
+        # cached reading interval (reset by reading datetime changing)
+        self.__start_moment = None
+        self.__end_moment = None
+
         # header file data
         self.__file_header = self.__get_file_header()
 
@@ -235,6 +541,19 @@ class BinaryFile:
         else:
             raise InvalidResampleFrequency()
 
+        # resampling mode: mean (average by resample interval), fir or iir
+        # (anti-aliased decimation)
+        if resample_mode not in RESAMPLE_MODES:
+            raise InvalidResampleMode(f'Unknown resample mode - '
+                                      f'{resample_mode}')
+        self.__resample_mode = resample_mode
+
+        # cache of converted signals (by default - directory from
+        # SEISCORE_CACHE_DIR environment variable, if it is set)
+        if signal_cache is None:
+            signal_cache = get_default_cache()
+        self.__signal_cache = signal_cache
+
         self.__unique_file_name = self.__create_unique_file_name()
         # date and time for start signal reading
         self.__read_date_time_start = None
@@ -263,6 +582,14 @@ class BinaryFile:
             self.__resample_frequency = self.origin_frequency
         return self.__resample_frequency
 
+    @property
+    def resample_mode(self) -> str:
+        return self.__resample_mode
+
+    @property
+    def signal_cache(self) -> Union[SignalCache, None]:
+        return self.__signal_cache
+
     @property
     def file_extension(self) -> str:
         return os.path.basename(self.path).split('.')[-1]
@@ -273,9 +600,9 @@ class BinaryFile:
 
     @property
     def format_type(self) -> str:
-        for format_type, extension in BINARY_FILE_FORMATS.items():
-            if self.file_extension == extension:
-                return format_type
+        if self.__format_type is None:
+            self.__format_type = get_format_type(self.path)
+        return self.__format_type
 
     @property
     def origin_datetime_start(self) -> datetime:
@@ -287,24 +614,22 @@ class BinaryFile:
 
     @property
     def header_memory_size(self) -> int:
-        channel_count = self.channels_count
-        return 120 + 72 * channel_count
+        return get_header_memory_size(self.channels_count)
 
     @property
     def discrete_amount(self) -> int:
-        file_size = os.path.getsize(self.path)
-        discrete_amount = int((file_size - self.header_memory_size) / (
-                self.file_header.channel_count * UNSIGNED_INT_CTYPE.byte_size))
-        return discrete_amount
+        if self.__discrete_amount is None:
+            file_size = os.path.getsize(self.path)
+            self.__discrete_amount = get_discrete_amount(
+                file_size, self.file_header.channel_count)
+        return self.__discrete_amount
 
     @property
     def seconds_duration(self) -> float:
-        discrete_count = self.discrete_amount
-        freq = self.origin_frequency
-
-        accuracy = int(math.log10(freq))
-        delta_seconds = round(discrete_count / freq, accuracy)
-        return delta_seconds
+        if self.__seconds_duration is None:
+            self.__seconds_duration = get_seconds_duration(
+                self.discrete_amount, self.origin_frequency)
+        return self.__seconds_duration
 
     @property
     def origin_datetime_stop(self) -> datetime:
@@ -313,16 +638,17 @@ class BinaryFile:
 
     @property
     def datetime_start(self) -> datetime:
-        if self.format_type == SIGMA_FMT:
-            time_diff = timedelta(seconds=SIGMA_SECONDS_OFFSET)
-        else:
-            time_diff = timedelta(seconds=0)
-        return self.origin_datetime_start + time_diff
+        if self.__datetime_start is None:
+            self.__datetime_start = get_datetime_start(
+                self.origin_datetime_start, self.format_type)
+        return self.__datetime_start
 
     @property
     def datetime_stop(self) -> datetime:
-        time_diff = timedelta(seconds=self.seconds_duration)
-        return self.datetime_start + time_diff
+        if self.__datetime_stop is None:
+            time_diff = timedelta(seconds=self.seconds_duration)
+            self.__datetime_stop = self.datetime_start + time_diff
+        return self.__datetime_stop
 
     @property
     def longitude(self) -> float:
@@ -344,6 +670,7 @@ class BinaryFile:
         dt2 = (self.datetime_stop - value).total_seconds()
         if dt1 >= 0 and dt2 > 0:
             self.__read_date_time_start = value
+            self.__start_moment, self.__end_moment = None, None
         else:
             raise InvalidDateTimeValue('Invalid start reading datetime ')
 
@@ -359,23 +686,26 @@ class BinaryFile:
         dt2 = (self.datetime_stop - value).total_seconds()
         if dt1 > 0 and dt2 >= 0:
             self.__read_date_time_stop = value
+            self.__end_moment = None
         else:
             raise InvalidDateTimeValue('Invalid stop reading datetime')
 
     @property
     def start_moment(self) -> int:
-        dt_diff = self.read_date_time_start - self.datetime_start
-        dt_seconds = dt_diff.total_seconds()
-        return int(round(dt_seconds * self.origin_frequency))
+        if self.__start_moment is None:
+            self.__start_moment = get_discrete_index(
+                self.datetime_start, self.read_date_time_start,
+                self.origin_frequency)
+        return self.__start_moment
 
     @property
     def end_moment(self) -> int:
-        dt = (self.read_date_time_stop - self.datetime_start).total_seconds()
-        discreet_index = int(round(dt * self.origin_frequency))
-        signal_length = discreet_index - self.start_moment
-        signal_length -= signal_length % self.resample_parameter
-        discreet_index = self.start_moment + signal_length
-        return discreet_index
+        if self.__end_moment is None:
+            self.__end_moment = get_end_discrete_index(
+                self.datetime_start, self.read_date_time_stop,
+                self.origin_frequency, self.start_moment,
+                self.resample_parameter)
+        return self.__end_moment
 
     @property
     def resample_parameter(self) -> int:
@@ -387,10 +717,12 @@ class BinaryFile:
 
     @property
     def components_index(self) -> Dict[str, int]:
-        indexes = {}
-        for index, component in enumerate(self.record_type):
-            indexes[component] = index
-        return indexes
+        if self.__components_index is None:
+            indexes = {}
+            for index, component in enumerate(self.record_type):
+                indexes[component] = index
+            self.__components_index = indexes
+        return self.__components_index
 
     @property
     def short_file_info(self) -> FileInfo:
@@ -398,16 +730,32 @@ class BinaryFile:
                         self.datetime_start, self.datetime_stop,
                         self.longitude, self.latitude)
 
+    @staticmethod
+    def peek(file_path: str) -> FileInfo:
+        """
+        Fast getting of file info (without BinaryFile object creation)
+        :param file_path: path to file
+        :return: short file info
+        """
+        if not is_binary_file_path(path=file_path):
+            raise BadFilePath(f'Invalid path - {file_path}')
+
+        format_type = get_format_type(file_path)
+        file_header = read_file_header(file_path, format_type)
+        discrete_amount = get_discrete_amount(os.path.getsize(file_path),
+                                              file_header.channel_count)
+        seconds_duration = get_seconds_duration(discrete_amount,
+                                                file_header.frequency)
+        datetime_start = get_datetime_start(file_header.datetime_start,
+                                            format_type)
+        datetime_stop = datetime_start + timedelta(seconds=seconds_duration)
+        return FileInfo(file_path, format_type, file_header.frequency,
+                        datetime_start, datetime_stop,
+                        round(file_header.longitude, 6),
+                        round(file_header.latitude, 6))
+
     def __get_file_header(self) -> Union[FileHeader, None]:
-        format_type = self.format_type
-        if format_type == BAIKAL7_FMT:
-            return read_baikal7_header(self.path)
-        elif format_type == BAIKAL8_FMT:
-            return read_baikal8_header(self.path)
-        elif format_type == SIGMA_FMT:
-            return read_sigma_header(self.path)
-        else:
-            return
+        return read_file_header(self.path, self.format_type)
 
     def __is_correct_resample_frequency(self, value: int) -> bool:
         if value < 0:
@@ -420,38 +768,251 @@ class BinaryFile:
     def __create_unique_file_name(self) -> str:
         return '{}.{}'.format(uuid.uuid4().hex, self.file_extension)
 
-    def _get_component_signal(self, component_name='Z') -> np.ndarray:
+    def __get_column_index(self, component_name: str) -> int:
         if self.channels_count == 3:
-            column_index = self.components_index[component_name]
-        else:
-            column_index = 3 + self.components_index[component_name]
-
+            return self.components_index[component_name]
+        return 3 + self.components_index[component_name]
+
+    def __check_components(self, components: str) -> str:
+        components = components.upper()
+        for component in components:
+            if component not in self.components_index:
+                raise InvalidComponentName(f'{component} not found')
+        if len(set(components)) != len(components):
+            raise InvalidComponentName(f'{components} has duplicates')
+        return components
+
+    def _map_records(self) -> np.ndarray:
+        """
+        Read-only 2D view (discretes x channels) of the reading interval.
+        The memory map stays opened while the view (or any view derived from
+        it) is alive
+        """
         skip_data_size = UNSIGNED_INT_CTYPE.byte_size * \
             self.channels_count * self.start_moment
-        offset_size = self.header_memory_size + skip_data_size + \
-            column_index * UNSIGNED_INT_CTYPE.byte_size
-        strides_size = UNSIGNED_INT_CTYPE.byte_size * self.channels_count
+        offset_size = self.header_memory_size + skip_data_size
         signal_size = self.end_moment - self.start_moment
-        with open(self.path, 'rb') as f, \
-                mmap(f.fileno(), length=0, access=ACCESS_READ) as mm:
-            signal_array = np.ndarray(signal_size, buffer=mm, dtype=np.int32,
-                                      offset=offset_size,
-                                      strides=strides_size).copy()
+        with open(self.path, 'rb') as f:
+            mm = mmap(f.fileno(), length=0, access=ACCESS_READ)
+        return np.ndarray((signal_size, self.channels_count), buffer=mm,
+                          dtype=np.int32, offset=offset_size)
+
+    def _get_component_signal(self, component_name='Z',
+                              copy=True) -> np.ndarray:
+        column_index = self.__get_column_index(component_name)
+        signal_array = self._map_records()[:, column_index]
+        if copy:
+            return signal_array.copy()
         return signal_array
 
-    def _resample_signal(self, src_signal: np.ndarray) -> np.ndarray:
+    def _get_components_signals(self, components='ZXY',
+                                copy=True) -> np.ndarray:
+        # copy is channel-major (columns of returned array are contiguous)
+        column_indexes = [self.__get_column_index(x) for x in components]
+        records = self._map_records()
+
+        first_index = column_indexes[0]
+        if copy or column_indexes != list(
+                range(first_index, first_index + len(components))):
+            return deinterleave(records, column_indexes).T
+        return records[:, first_index:first_index + len(components)]
+
+    def _resample_range(self, src_signal: np.ndarray, left_edge: int,
+                        right_edge: int) -> np.ndarray:
+        # resampling of src_signal[left_edge:right_edge], decimation
+        # filters use neighbouring discretes of src_signal
+        if self.resample_parameter == 1:
+            return src_signal[left_edge:right_edge]
+        if self.resample_mode == MEAN_MODE:
+            return resampling(src_signal[left_edge:right_edge],
+                              self.resample_parameter)
+        return decimation(src_signal, self.resample_parameter,
+                          self.resample_mode,
+                          left_edge // self.resample_parameter,
+                          right_edge // self.resample_parameter)
+
+    def _resample_signal(self, src_signal: np.ndarray,
+                         workers=None) -> np.ndarray:
         if self.resample_parameter == 1:
             return src_signal
-        return resampling(src_signal, self.resample_parameter)
-
-    def read_signal(self, component='Z') -> np.ndarray:
+        if self.resample_mode == MEAN_MODE:
+            return parallel_resampling(src_signal, self.resample_parameter,
+                                       workers)
+        if src_signal.ndim == 1:
+            return self._resample_range(src_signal, 0, src_signal.shape[0])
+
+        columns = [self._resample_range(src_signal[:, i], 0,
+                                        src_signal.shape[0])
+                   for i in range(src_signal.shape[1])]
+        return np.stack(columns).T
+
+    def _subtract_average(self, signal: np.ndarray) -> np.ndarray:
+        if not self.is_use_avg_values:
+            return signal
+        if signal.ndim == 1:
+            average_values = np.average(signal)
+        else:
+            # averaging by columns gives the same values as for 1D signals
+            average_values = np.array([np.average(signal[:, i])
+                                       for i in range(signal.shape[1])])
+        if np.issubdtype(signal.dtype, np.integer):
+            # integer signal keeps integer type
+            average_values = average_values.astype(signal.dtype)
+        return signal - average_values
+
+    def __is_copy_required(self, copy: bool) -> bool:
+        # resampling and average subtraction create new arrays anyway,
+        # resampling kernels accept strided read-only views
+        return copy and self.resample_parameter == 1 and \
+            not self.is_use_avg_values
+
+    def read_signal(self, component='Z', copy=True,
+                    workers=None) -> np.ndarray:
+        """
+        Reading one component signal
+        :param component: component name
+        :param copy: if False and no resampling or average subtraction is
+        required (or signal cache is used), a read-only view over the file
+        memory map is returned
+        :param workers: resampling threads count (by default - CPU count)
+        :return: 1D array of signal
+        """
+        component = component.upper()
+        if component not in self.components_index:
+            raise InvalidComponentName(f'{component} not found')
+        if self.__is_cache_used():
+            signal_array = self.__get_cached_signals(workers)[
+                self.components_index[component]]
+            if copy:
+                return signal_array.copy()
+            return np.asarray(signal_array)
+        return self.__read_signal(component, copy, workers)
+
+    def __read_signal(self, component: str, copy: bool,
+                      workers=None) -> np.ndarray:
+        signal_array = self._get_component_signal(
+            component_name=component, copy=self.__is_copy_required(copy))
+
+        resample_signal = self._resample_signal(src_signal=signal_array,
+                                                workers=workers)
+        return self._subtract_average(resample_signal)
+
+    def __is_cache_used(self) -> bool:
+        # signal without resampling and average subtraction is read from
+        # file memory map without conversion
+        return self.signal_cache is not None and \
+            (self.resample_parameter != 1 or self.is_use_avg_values)
+
+    def __get_cached_signals(self, workers=None) -> np.ndarray:
+        key = create_cache_key(self.path, self.resample_frequency,
+                               self.resample_mode, self.is_use_avg_values,
+                               self.start_moment, self.end_moment)
+        signals = self.signal_cache.get(key)
+        if signals is None:
+            # components are converted separately for results to be equal
+            # to reading without cache
+            signals = np.stack([self.__read_signal(x, False, workers)
+                                for x in self.record_type])
+            signals = self.signal_cache.put(key, signals)
+        return signals
+
+    def read_signals(self, components=COMPONENTS_ORDER, as_dict=False,
+                     copy=True) -> Union[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Reading several components with a single file mapping
+        :param components: components names (for example, 'ZXY' or 'XY')
+        :param as_dict: return dictionary {component: 1D array} instead of
+        2D array
+        :param copy: if False and no resampling or average subtraction is
+        required, read-only views over the file memory map are returned
+        (only for components stored in file order)
+        :return: 2D array (signal length x components count, columns are
+        contiguous) or dictionary
+        """
+        components = self.__check_components(components)
+        # de-interleaved copy is used for any signal conversion
+        is_view_allowed = not copy and self.resample_parameter == 1 and \
+            not self.is_use_avg_values
+        signals_array = self._get_components_signals(
+            components=components, copy=not is_view_allowed)
+
+        resample_signals = self._resample_signal(src_signal=signals_array)
+        resample_signals = self._subtract_average(resample_signals)
+        if not as_dict:
+            return resample_signals
+        return {component: resample_signals[:, i]
+                for i, component in enumerate(components)}
+
+    def __discrete_datetime(self, discrete_index: int) -> datetime:
+        seconds = discrete_index / self.origin_frequency
+        return self.datetime_start + timedelta(seconds=seconds)
+
+    def __get_chunk_size(self, seconds: float) -> int:
+        chunk_size = int(round(seconds * self.origin_frequency))
+        return chunk_size - chunk_size % self.resample_parameter
+
+    def iter_chunks(self, component='Z', chunk_seconds=60.0,
+                    overlap_seconds=0.0) -> Iterator[SignalChunk]:
+        """
+        Reading signal of the reading interval by chunks (memory usage does
+        not depend on file size)
+        :param component: component name
+        :param chunk_seconds: chunk duration (seconds)
+        :param overlap_seconds: overlap of neighbouring chunks (seconds)
+        :return: iterator of chunks with datetime of the first discrete.
+        Chunk sizes are aligned by resample parameter, so joined
+        non-overlapping chunks are equal to read_signal result
+        """
         component = component.upper()
         if component not in self.components_index:
             raise InvalidComponentName(f'{component} not found')
-        signal_array = self._get_component_signal(component_name=component)
-
-        resample_signal = self._resample_signal(src_signal=signal_array)
-        if not self.is_use_avg_values:
-            return resample_signal
 
-        return resample_signal - int(np.average(resample_signal))
+        chunk_size = self.__get_chunk_size(chunk_seconds)
+        overlap_size = self.__get_chunk_size(overlap_seconds)
+        if chunk_size <= 0:
+            raise InvalidChunkSize('Chunk is shorter than resample interval')
+        if not 0 <= overlap_size < chunk_size:
+            raise InvalidChunkSize('Invalid chunks overlap')
+
+        src_signal = self._get_component_signal(component_name=component,
+                                                copy=False)
+        average_value = 0
+        if self.is_use_avg_values:
+            average_value = self.__get_average_by_chunks(src_signal,
+                                                         chunk_size)
+
+        step = chunk_size - overlap_size
+        signal_size = src_signal.shape[0]
+        for left_edge in range(0, signal_size, step):
+            right_edge = min(left_edge + chunk_size, signal_size)
+            chunk = self._resample_range(src_signal, left_edge, right_edge)
+            if self.resample_parameter == 1:
+                chunk = chunk.copy()
+            if average_value:
+                chunk -= average_value
+            yield SignalChunk(
+                self.__discrete_datetime(self.start_moment + left_edge),
+                chunk)
+            if right_edge == signal_size:
+                break
+
+    def __get_average_by_chunks(self, src_signal: np.ndarray,
+                                chunk_size: int) -> Union[int, float]:
+        resample_discrete_amount = \
+            src_signal.shape[0] // self.resample_parameter
+        if not resample_discrete_amount:
+            return 0
+
+        total_sum = 0
+        for left_edge in range(0, src_signal.shape[0], chunk_size):
+            right_edge = min(left_edge + chunk_size, src_signal.shape[0])
+            chunk = self._resample_range(src_signal, left_edge, right_edge)
+            if np.issubdtype(chunk.dtype, np.integer):
+                total_sum += int(np.sum(chunk, dtype=np.int64))
+            else:
+                total_sum += float(np.sum(chunk))
+
+        average_value = total_sum / resample_discrete_amount
+        if isinstance(total_sum, int):
+            return int(average_value)
+        return average_value
@@ -0,0 +1,123 @@
+import os
+import hashlib
+import tempfile
+from typing import Union
+
+import numpy as np
+
+
+CACHE_DIR_ENV_VARIABLE = 'SEISCORE_CACHE_DIR'
+CACHE_SIZE_ENV_VARIABLE = 'SEISCORE_CACHE_SIZE'
+DEFAULT_CACHE_SIZE = 2 ** 30
+CACHE_FILE_EXTENSION = 'npy'
+
+
+def create_cache_key(file_path: str, *parameters) -> str:
+    """
+    Key of converted signals: source file path, modification time, size and
+    reading parameters (resampling, average subtraction, reading interval)
+    :param file_path: source file path
+    :param parameters: reading parameters
+    :return: hex digest
+    """
+    stat = os.stat(file_path)
+    key_parts = [os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                 *parameters]
+    return hashlib.sha1(repr(key_parts).encode('utf-8')).hexdigest()
+
+
+class SignalCache:
+    """
+    Directory of converted signals (.npy files with channels x discretes
+    arrays). Least recently used files are removed if total size exceeds
+    max_size
+    """
+    def __init__(self, cache_dir: str, max_size=DEFAULT_CACHE_SIZE):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.__cache_dir = cache_dir
+        self.__max_size = max_size
+
+    @property
+    def cache_dir(self) -> str:
+        return self.__cache_dir
+
+    @property
+    def max_size(self) -> int:
+        return self.__max_size
+
+    @property
+    def size(self) -> int:
+        return sum(os.path.getsize(x) for x in self.__get_cache_files())
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.{CACHE_FILE_EXTENSION}')
+
+    def __get_cache_files(self):
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(f'.{CACHE_FILE_EXTENSION}'):
+                yield os.path.join(self.cache_dir, file_name)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self.__get_path(key))
+
+    def get(self, key: str) -> Union[np.ndarray, None]:
+        """
+        Loading of converted signals
+        :param key: cache key
+        :return: read-only memory mapped array or None (if key not found)
+        """
+        path = self.__get_path(key)
+        try:
+            signals = np.load(path, mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        # modification time is used as last access time for eviction
+        os.utime(path)
+        return signals
+
+    def put(self, key: str, signals: np.ndarray) -> np.ndarray:
+        """
+        Saving of converted signals
+        :param key: cache key
+        :param signals: 2D array (channels x discretes)
+        :return: read-only memory mapped array
+        """
+        # writing to temporary file prevents reading of incomplete arrays by
+        # concurrent processes
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.cache_dir,
+                                                     suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as f:
+            np.save(f, np.ascontiguousarray(signals))
+        path = self.__get_path(key)
+        os.replace(tmp_path, path)
+        self.__evict(keep_path=path)
+        return np.load(path, mmap_mode='r')
+
+    def __evict(self, keep_path: str):
+        files = sorted(self.__get_cache_files(), key=os.path.getmtime)
+        total_size = sum(os.path.getsize(x) for x in files)
+        for path in files:
+            if total_size <= self.max_size:
+                break
+            if path == keep_path:
+                continue
+            file_size = os.path.getsize(path)
+            try:
+                os.remove(path)
+            except OSError:
+                # file can be mapped by another reader
+                continue
+            total_size -= file_size
+
+    def clear(self):
+        for path in self.__get_cache_files():
+            os.remove(path)
+
+
+def get_default_cache() -> Union[SignalCache, None]:
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VARIABLE)
+    if not cache_dir:
+        return None
+    max_size = int(os.environ.get(CACHE_SIZE_ENV_VARIABLE,
+                                  DEFAULT_CACHE_SIZE))
+    return SignalCache(cache_dir, max_size)
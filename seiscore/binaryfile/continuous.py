@@ -0,0 +1,239 @@
+from datetime import datetime
+from datetime import timedelta
+from typing import List, NamedTuple
+
+import numpy as np
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.binaryfile import InvalidComponentName
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.binaryfile.binaryfile import InvalidDateTimeValue
+from seiscore.binaryfile.binaryfile import get_discrete_index
+from seiscore.binaryfile.binaryfile import get_signal_dtype
+from seiscore.binaryfile.resampling.decimation import MEAN_MODE
+
+
+class Discontinuity(NamedTuple):
+    # file before and after discontinuity
+    previous_path: str
+    next_path: str
+    # end of previous file
+    datetime_start: datetime
+    # start of next file
+    datetime_stop: datetime
+
+    @property
+    def seconds(self) -> float:
+        # positive value - gap, negative value - overlap
+        return (self.datetime_stop - self.datetime_start).total_seconds()
+
+    @property
+    def is_gap(self) -> bool:
+        return self.seconds > 0
+
+
+class ContinuousRecording:
+    """
+    Consecutive files of one station presented as one continuous stream.
+    In overlapping intervals data of earlier file is used, gaps are filled
+    by fill value
+    """
+    def __init__(self, file_paths: List[str], resample_frequency=0,
+                 is_use_avg_values=False, resample_mode=MEAN_MODE):
+        if not file_paths:
+            raise ValueError('Empty files list')
+        # average values are subtracted from whole stream, not per file
+        binary_files = [
+            BinaryFile(x, resample_frequency, False, resample_mode)
+            for x in file_paths]
+        self.__binary_files = sorted(binary_files,
+                                     key=lambda x: x.datetime_start)
+        self.__is_use_avg_values = is_use_avg_values
+
+        frequencies = {x.resample_frequency for x in self.__binary_files}
+        if len(frequencies) > 1:
+            raise InvalidResampleFrequency(
+                f'Files have different frequencies: {frequencies}')
+        self.__discontinuities = self.__find_discontinuities()
+
+        self.__read_date_time_start = None
+        self.__read_date_time_stop = None
+
+    @property
+    def binary_files(self) -> List[BinaryFile]:
+        return self.__binary_files
+
+    @property
+    def paths(self) -> List[str]:
+        return [x.path for x in self.__binary_files]
+
+    @property
+    def is_use_avg_values(self) -> bool:
+        return self.__is_use_avg_values
+
+    @property
+    def resample_frequency(self) -> int:
+        return self.__binary_files[0].resample_frequency
+
+    @property
+    def datetime_start(self) -> datetime:
+        return self.__binary_files[0].datetime_start
+
+    @property
+    def datetime_stop(self) -> datetime:
+        return max(x.datetime_stop for x in self.__binary_files)
+
+    @property
+    def discontinuities(self) -> List[Discontinuity]:
+        return self.__discontinuities
+
+    @property
+    def gaps(self) -> List[Discontinuity]:
+        return [x for x in self.__discontinuities if x.is_gap]
+
+    @property
+    def overlaps(self) -> List[Discontinuity]:
+        return [x for x in self.__discontinuities if not x.is_gap]
+
+    @property
+    def read_date_time_start(self) -> datetime:
+        if self.__read_date_time_start is None:
+            self.__read_date_time_start = self.datetime_start
+        return self.__read_date_time_start
+
+    @read_date_time_start.setter
+    def read_date_time_start(self, value: datetime):
+        if self.datetime_start <= value < self.datetime_stop:
+            self.__read_date_time_start = value
+        else:
+            raise InvalidDateTimeValue('Invalid start reading datetime')
+
+    @property
+    def read_date_time_stop(self) -> datetime:
+        if self.__read_date_time_stop is None:
+            self.__read_date_time_stop = self.datetime_stop
+        return self.__read_date_time_stop
+
+    @read_date_time_stop.setter
+    def read_date_time_stop(self, value: datetime):
+        if self.datetime_start < value <= self.datetime_stop:
+            self.__read_date_time_stop = value
+        else:
+            raise InvalidDateTimeValue('Invalid stop reading datetime')
+
+    def __find_discontinuities(self) -> List[Discontinuity]:
+        # time shifts less than one origin discrete are rounding errors
+        discontinuities = []
+        for previous, current in zip(self.__binary_files[:-1],
+                                     self.__binary_files[1:]):
+            tolerance = 1 / previous.origin_frequency
+            time_diff = current.datetime_start - previous.datetime_stop
+            if abs(time_diff.total_seconds()) < tolerance:
+                continue
+            discontinuities.append(
+                Discontinuity(previous.path, current.path,
+                              previous.datetime_stop, current.datetime_start))
+        return discontinuities
+
+    def __read_file_piece(self, bin_data: BinaryFile, component: str,
+                          time_start: datetime,
+                          time_stop: datetime) -> np.ndarray:
+        # origin discretes of the piece (resampling is done by caller,
+        # BinaryFile cuts reading interval by resample parameter).
+        # Reading interval is set from file bounds to avoid checking of
+        # new interval against previous one
+        origin_file = bin_data
+        if bin_data.resample_parameter != 1:
+            origin_file = BinaryFile(bin_data.path, 0, False,
+                                     bin_data.resample_mode)
+        origin_file.read_date_time_start = origin_file.datetime_start
+        origin_file.read_date_time_stop = time_stop
+        origin_file.read_date_time_start = time_start
+        return origin_file.read_signal(component, copy=False)
+
+    def __resample_piece(self, bin_data: BinaryFile,
+                         src_signal: np.ndarray) -> np.ndarray:
+        signal_size = src_signal.shape[0]
+        signal_size -= signal_size % bin_data.resample_parameter
+        return bin_data._resample_range(src_signal, 0, signal_size)
+
+    def read_signal(self, component='Z', fill_value=0) -> np.ndarray:
+        """
+        Reading one component signal of reading interval. Origin discretes
+        of contiguous files are resampled as one stream, so file joints
+        don't make holes in resampled signal
+        :param component: component name
+        :param fill_value: value for discretes inside gaps
+        :return: 1D array of signal
+        """
+        component = component.upper()
+        first_file = self.__binary_files[0]
+        if component not in first_file.components_index:
+            raise InvalidComponentName(f'{component} not found')
+
+        time_start = self.read_date_time_start
+        time_stop = self.read_date_time_stop
+        if time_start >= time_stop:
+            raise InvalidDateTimeValue('Reading start is later than stop')
+
+        frequency = self.resample_frequency
+        resample_parameter = first_file.resample_parameter
+        # incomplete last resampled discrete is dropped as by BinaryFile
+        discrete_amount = get_discrete_index(
+            time_start, time_stop,
+            first_file.origin_frequency) // resample_parameter
+        signal = np.full(discrete_amount, fill_value,
+                         dtype=get_signal_dtype(resample_parameter,
+                                                first_file.resample_mode))
+        is_filled = np.zeros(discrete_amount, dtype=bool)
+        discontinuous_paths = {x.next_path for x in self.__discontinuities}
+
+        # first not filled discrete
+        next_index = 0
+        # origin discretes of previous file after its last resampled
+        # discrete (None - previous file is not read up to the end)
+        remainder = None
+        for bin_data in self.__binary_files:
+            piece_stop = min(time_stop, bin_data.datetime_stop)
+            is_contiguous = remainder is not None and \
+                bin_data.path not in discontinuous_paths
+            if is_contiguous:
+                # joint of files is inside one resampled discrete
+                piece_start = bin_data.datetime_start
+                left_edge = next_index
+            else:
+                remainder = None
+                # first not filled discrete of file
+                left_edge = max(next_index, get_discrete_index(
+                    time_start, bin_data.datetime_start, frequency))
+                piece_start = max(
+                    bin_data.datetime_start,
+                    time_start + timedelta(seconds=left_edge / frequency))
+            if piece_stop - piece_start < \
+                    timedelta(seconds=1 / bin_data.origin_frequency):
+                remainder = None
+                continue
+
+            piece = self.__read_file_piece(bin_data, component, piece_start,
+                                           piece_stop)
+            if remainder is not None and remainder.shape[0]:
+                piece = np.concatenate([remainder, piece])
+            resampled_piece = self.__resample_piece(bin_data, piece)
+            remainder = None
+            if piece_stop == bin_data.datetime_stop:
+                remainder = piece[resampled_piece.shape[0] *
+                                  resample_parameter:].copy()
+
+            resampled_piece = resampled_piece[:discrete_amount - left_edge]
+            right_edge = left_edge + resampled_piece.shape[0]
+            signal[left_edge:right_edge] = resampled_piece
+            is_filled[left_edge:right_edge] = True
+            next_index = max(next_index, right_edge)
+
+        if self.is_use_avg_values and is_filled.any():
+            average_value = np.average(signal[is_filled])
+            if np.issubdtype(signal.dtype, np.integer):
+                # integer signal keeps integer type
+                average_value = int(average_value)
+            signal[is_filled] -= average_value
+        return signal
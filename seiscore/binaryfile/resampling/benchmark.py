@@ -0,0 +1,82 @@
+"""
+Resampling backends benchmark (with previous cython kernel, if it is built:
+SEISCORE_BUILD_LEGACY_RESAMPLING=1 python setup.py build_ext --inplace in
+resampling folder).
+Run: python -m seiscore.binaryfile.resampling.benchmark
+"""
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Union
+
+import numpy as np
+
+from seiscore.binaryfile.resampling.wrap import BACKENDS, PYTHON_BACKEND
+
+
+# one hour of 1000 Hz signal
+SIGNAL_SIZE = 3_600_000
+RESAMPLE_PARAMETERS = (4, 100, 1000)
+REPEATS_COUNT = 3
+THREADS_COUNT = 4
+
+
+def import_legacy_function() -> Union[Callable, None]:
+    try:
+        from seiscore.binaryfile.resampling import legacy_resampling
+        return legacy_resampling.resampling
+    except ImportError:
+        return None
+
+
+def measure(function, repeats_count=REPEATS_COUNT) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeats_count))
+
+
+def run_threads(function, signal: np.ndarray, resample_parameter: int,
+                threads_count: int):
+    parts = np.array_split(signal, threads_count)
+    with ThreadPoolExecutor(max_workers=threads_count) as executor:
+        list(executor.map(lambda x: function(x, resample_parameter), parts))
+
+
+def main():
+    # 24-bit ADC amplitudes
+    records = np.random.randint(-2 ** 23, 2 ** 23, size=(SIGNAL_SIZE, 3),
+                                dtype=np.int32)
+    # strided component as returned by BinaryFile views
+    signal = records[:, 0]
+
+    legacy_function = import_legacy_function()
+    print(f'signal size: {SIGNAL_SIZE} discretes (strided int32 view)')
+    if legacy_function is None:
+        print('legacy kernel is not built (see module docstring)')
+    for resample_parameter in RESAMPLE_PARAMETERS:
+        print(f'resample parameter: {resample_parameter}')
+        for backend_name, function in BACKENDS.items():
+            if backend_name == PYTHON_BACKEND:
+                # prototype version is too slow for full signal
+                part = signal[:SIGNAL_SIZE // 100]
+                seconds = measure(
+                    lambda: function(part, resample_parameter), 1) * 100
+            else:
+                seconds = measure(
+                    lambda: function(signal, resample_parameter))
+            print(f'    {backend_name:>8}: {seconds:.4f} s')
+
+            if backend_name != PYTHON_BACKEND:
+                seconds = measure(
+                    lambda: run_threads(function, signal,
+                                        resample_parameter, THREADS_COUNT))
+                print(f'    {backend_name:>8} ({THREADS_COUNT} threads): '
+                      f'{seconds:.4f} s')
+
+        if legacy_function is not None:
+            # previous kernel accepts contiguous writeable arrays only, so
+            # the component copy is a part of reading cost
+            seconds = measure(
+                lambda: legacy_function(signal.copy(), resample_parameter))
+            print(f'    {"legacy":>8}: {seconds:.4f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy.signal import firwin, cheby1, upfirdn, sosfiltfilt
+
+
+MEAN_MODE, FIR_MODE, IIR_MODE = 'mean', 'fir', 'iir'
+RESAMPLE_MODES = (MEAN_MODE, FIR_MODE, IIR_MODE)
+
+# output discretes count computing for one block
+DEFAULT_BLOCK_SIZE = 2 ** 16
+# half length of FIR filter in resample intervals (as scipy resample_poly)
+FIR_HALF_LENGTH = 10
+# IIR transient margin in resample intervals and minimal margin (discretes)
+IIR_MARGIN, IIR_MIN_MARGIN = 100, 2000
+
+
+@lru_cache(maxsize=None)
+def get_fir_coefficients(resample_parameter: int) -> np.ndarray:
+    """
+    Low-pass FIR filter for decimation (same design as in
+    scipy.signal.resample_poly)
+    :param resample_parameter: resample factor
+    :return: 1D array of filter coefficients
+    """
+    half_length = FIR_HALF_LENGTH * resample_parameter
+    coefficients = firwin(2 * half_length + 1, 1 / resample_parameter,
+                          window=('kaiser', 5.0))
+    return coefficients
+
+
+@lru_cache(maxsize=None)
+def get_iir_sos(resample_parameter: int) -> np.ndarray:
+    """
+    Low-pass Chebyshev I filter for decimation (same design as in
+    scipy.signal.decimate)
+    :param resample_parameter: resample factor
+    :return: second-order sections of filter
+    """
+    sos = cheby1(8, 0.05, 0.8 / resample_parameter, output='sos')
+    return sos
+
+
+def _select_input(signal: np.ndarray, left_edge: int,
+                  right_edge: int) -> np.ndarray:
+    # part of signal as float array, zeros out of signal limits
+    selection = np.zeros(right_edge - left_edge, dtype=np.float64)
+    src_left, src_right = max(left_edge, 0), min(right_edge, signal.shape[0])
+    if src_left < src_right:
+        selection[src_left - left_edge:src_right - left_edge] = \
+            signal[src_left:src_right]
+    return selection
+
+
+def _fir_block(signal: np.ndarray, resample_parameter: int,
+               first_index: int, last_index: int) -> np.ndarray:
+    coefficients = get_fir_coefficients(resample_parameter)
+    half_length = FIR_HALF_LENGTH * resample_parameter
+    left_edge = first_index * resample_parameter - half_length
+    right_edge = (last_index - 1) * resample_parameter + half_length + 1
+    selection = _select_input(signal, left_edge, right_edge)
+    filtered = upfirdn(coefficients, selection, up=1,
+                       down=resample_parameter)
+    skip_count = 2 * FIR_HALF_LENGTH
+    return filtered[skip_count:skip_count + last_index - first_index]
+
+
+def _iir_block(signal: np.ndarray, resample_parameter: int,
+               first_index: int, last_index: int) -> np.ndarray:
+    margin = max(IIR_MARGIN * resample_parameter, IIR_MIN_MARGIN)
+    left_edge = max(first_index * resample_parameter - margin, 0)
+    right_edge = min(last_index * resample_parameter + margin,
+                     signal.shape[0])
+    selection = np.asarray(signal[left_edge:right_edge], dtype=np.float64)
+    filtered = sosfiltfilt(get_iir_sos(resample_parameter), selection)
+    start = first_index * resample_parameter - left_edge
+    stop = start + (last_index - first_index) * resample_parameter
+    return filtered[start:stop:resample_parameter]
+
+
+def decimation(signal: np.ndarray, resample_parameter: int, mode=FIR_MODE,
+               first_index=0, last_index=None,
+               block_size=DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Anti-aliased signal decimation. Calculation is done by blocks, so signal
+    can be a strided view over memory map
+    :param signal: 1D array of signal
+    :param resample_parameter: resample factor
+    :param mode: fir - FIR low-pass filter (polyphase), iir - zero-phase
+    Chebyshev filter
+    :param first_index: first index of output signal
+    :param last_index: last index (exclusive) of output signal, by default -
+    all full resample intervals
+    :param block_size: output discretes count computing at once
+    :return: 1D array of resample signal (float values)
+    """
+    if mode == FIR_MODE:
+        block_function = _fir_block
+    elif mode == IIR_MODE:
+        block_function = _iir_block
+    else:
+        raise ValueError(f'Unknown decimation mode - {mode}')
+
+    if last_index is None:
+        last_index = signal.shape[0] // resample_parameter
+
+    resample_signal = np.empty(max(last_index - first_index, 0),
+                               dtype=np.float64)
+    for left_index in range(first_index, last_index, block_size):
+        right_index = min(left_index + block_size, last_index)
+        resample_signal[left_index - first_index:right_index - first_index] = \
+            block_function(signal, resample_parameter, left_index,
+                           right_index)
+    return resample_signal
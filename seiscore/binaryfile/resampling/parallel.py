@@ -0,0 +1,73 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import numpy as np
+
+from seiscore.binaryfile.resampling.wrap import resampling
+
+
+# output discretes count of one block
+DEFAULT_BLOCK_SIZE = 2 ** 18
+
+
+def split_blocks(resample_discrete_amount: int,
+                 block_size: int) -> List[Tuple[int, int]]:
+    """
+    Splitting output signal into blocks
+    :param resample_discrete_amount: output signal size
+    :param block_size: output discretes count of one block
+    :return: list of (first index, last index) pairs in output discretes
+    """
+    return [(left_index, min(left_index + block_size,
+                             resample_discrete_amount))
+            for left_index in range(0, resample_discrete_amount, block_size)]
+
+
+def parallel_resampling(signal: np.ndarray, resample_parameter: int,
+                        workers=None,
+                        block_size=DEFAULT_BLOCK_SIZE) -> np.ndarray:
+    """
+    Multi-threaded signal resampling. Signal is split into blocks aligned by
+    resample parameter (and by channels for 2D signal), blocks are resampled
+    in thread pool by active resampling backend (cython kernel works without
+    GIL)
+    :param signal: 1D array of signal or 2D array (discretes x channels)
+    :param resample_parameter: resample factor
+    :param workers: threads count (by default - CPU count)
+    :param block_size: output discretes count of one block
+    :return: array of resample signal
+    """
+    resample_discrete_amount = signal.shape[0] // resample_parameter
+    # channels of 2D output signal are contiguous
+    resample_signal = np.empty(
+        (resample_discrete_amount,) + signal.shape[1:], dtype=np.int32,
+        order='F')
+    if signal.ndim == 1:
+        channels = [(signal, resample_signal)]
+    else:
+        channels = [(signal[:, i], resample_signal[:, i])
+                    for i in range(signal.shape[1])]
+
+    def resample_block(task):
+        src_signal, dst_signal, left_index, right_index = task
+        dst_signal[left_index:right_index] = resampling(
+            src_signal[left_index * resample_parameter:
+                       right_index * resample_parameter],
+            resample_parameter)
+
+    tasks = [(src_signal, dst_signal, left_index, right_index)
+             for src_signal, dst_signal in channels
+             for left_index, right_index in split_blocks(
+                resample_discrete_amount, block_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        for task in tasks:
+            resample_block(task)
+        return resample_signal
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() propagates exceptions from threads
+        list(executor.map(resample_block, tasks))
+    return resample_signal
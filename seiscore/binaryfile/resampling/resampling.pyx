@@ -5,35 +5,44 @@ cimport cython
 
 @cython.boundscheck(False)  # Deactivate bounds checking
 @cython.wraparound(False)   # Deactivate negative indexing.
-def resampling(np.ndarray[np.int32_t, ndim=1] signal,
-               int resample_parameter):
+@cython.cdivision(True)     # Floor division is corrected manually
+def resampling(const np.int32_t[:] signal, int resample_parameter):
     """
     Method for signal resampling
-    :param signal: 1D array of signal
+    :param signal: 1D array of signal (strided and read-only arrays are
+    accepted without copying)
     :param resample_parameter: resample factor
     :return: 1D array of resample signal
     """
     cdef:
         # Origin signal size
-        int discrete_amount
+        Py_ssize_t discrete_amount
         # Resample signal size
-        int resample_discrete_amount
+        Py_ssize_t resample_discrete_amount
         # Iteration variables
-        int i, j, k
-        int sum_a, sum_b, sum_c
-        int value_a, value_b, value_c
+        Py_ssize_t i, j, k
+        # 64-bit accumulator: window sum can't overflow
+        long long sum_val, value
         # Output array
-        np.ndarray[np.int32_t, ndim = 1] resample_signal
+        np.int32_t[:] resample_view
+
+    if resample_parameter <= 0:
+        raise ValueError('Resample parameter must be positive')
 
     discrete_amount = signal.shape[0]
     resample_discrete_amount = discrete_amount // resample_parameter
 
     resample_signal = np.zeros(shape=resample_discrete_amount, dtype=np.int32)
-    for i in range(resample_discrete_amount):
-        sum_val = 0
-        for j in range(resample_parameter):
-            k = i * resample_parameter + j
-            sum_val += signal[k]
-        value = sum_val // resample_parameter
-        resample_signal[i] = value
+    resample_view = resample_signal
+    with nogil:
+        for i in range(resample_discrete_amount):
+            sum_val = 0
+            k = i * resample_parameter
+            for j in range(resample_parameter):
+                sum_val += signal[k + j]
+            value = sum_val / resample_parameter
+            # C division truncates towards zero, python floors
+            if value * resample_parameter != sum_val and sum_val < 0:
+                value -= 1
+            resample_view[i] = <np.int32_t>value
     return resample_signal
@@ -1,11 +1,22 @@
+import os
 from distutils.core import setup
 from distutils.extension import Extension
 from Cython.Distutils import build_ext
 import numpy
 
 
+# previous kernel for benchmark comparison is not a part of the package,
+# it is built only if the variable is set
+BUILD_LEGACY_ENV_VARIABLE = 'SEISCORE_BUILD_LEGACY_RESAMPLING'
+
+ext_modules = [Extension("resampling", ["resampling.pyx"],
+                         include_dirs=[numpy.get_include()])]
+if os.environ.get(BUILD_LEGACY_ENV_VARIABLE):
+    ext_modules.append(Extension("legacy_resampling",
+                                 ["legacy_resampling.pyx"],
+                                 include_dirs=[numpy.get_include()]))
+
 setup(
     cmdclass={'build_ext': build_ext},
-    ext_modules=[Extension("resampling", ["resampling.pyx"],
-                 include_dirs=[numpy.get_include()])]
+    ext_modules=ext_modules
 )
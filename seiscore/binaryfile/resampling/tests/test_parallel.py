@@ -0,0 +1,38 @@
+import pytest
+from hamcrest import assert_that, equal_to
+
+import numpy as np
+
+from seiscore.binaryfile.resampling.wrap import resampling
+from seiscore.binaryfile.resampling.parallel import split_blocks
+from seiscore.binaryfile.resampling.parallel import parallel_resampling
+
+
+@pytest.mark.parametrize('size, block_size, expected',
+                         [(0, 3, []), (3, 3, [(0, 3)]),
+                          (7, 3, [(0, 3), (3, 6), (6, 7)])])
+def test_split_blocks(size, block_size, expected):
+    assert_that(split_blocks(size, block_size), equal_to(expected))
+
+
+@pytest.mark.parametrize('workers', [1, 4, None])
+@pytest.mark.parametrize('resample_param, block_size',
+                         [(1, 100), (4, 7), (10, 1000), (100, 3)])
+def test_parallel_resampling_1d(resample_param, block_size, workers):
+    signal = np.random.randint(-1000, 1000, size=10_007, dtype=np.int32)
+    fact = parallel_resampling(signal, resample_param, workers, block_size)
+    expected = resampling(signal, resample_param)
+    assert_that(np.array_equal(fact, expected), equal_to(True))
+
+
+@pytest.mark.parametrize('resample_param, block_size',
+                         [(1, 100), (4, 7), (10, 1000)])
+def test_parallel_resampling_2d(resample_param, block_size):
+    records = np.random.randint(-1000, 1000, size=(10_007, 6),
+                                dtype=np.int32)
+    signal = records[:, 3:]
+    fact = parallel_resampling(signal, resample_param, 4, block_size)
+    assert_that(fact.shape, equal_to((10_007 // resample_param, 3)))
+    for i in range(3):
+        expected = resampling(signal[:, i], resample_param)
+        assert_that(np.array_equal(fact[:, i], expected), equal_to(True))
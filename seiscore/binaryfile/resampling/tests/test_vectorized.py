@@ -0,0 +1,65 @@
+import pytest
+from hamcrest import assert_that, equal_to
+
+import numpy as np
+
+from seiscore.binaryfile.resampling.prototype import resampling as slow_vers
+from seiscore.binaryfile.resampling.vectorized import resampling
+
+
+RESAMPLE_PARAMETERS = [1, 2, 3, 4, 5, 7, 10, 25, 100, 1000]
+
+
+@pytest.fixture()
+def fast_resampling_function():
+    try:
+        from seiscore.binaryfile.resampling import resampling as resample_core
+    except ImportError:
+        pytest.skip('cython extension is not built')
+    return resample_core.resampling
+
+
+@pytest.mark.parametrize(
+    'signal, resample_param, expected',
+    [(np.array([1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], dtype=np.int32), 4,
+      np.array([1, 1, 1], dtype=np.int32)),
+     (np.array([], dtype=np.int32), 4, np.array([], dtype=np.int32)),
+     (np.array([1, 2, 3, 4, 5], dtype=np.int32), 1,
+      np.array([1, 2, 3, 4, 5], dtype=np.int32)),
+     (np.array([2, 4, 4, 6, 6, 8], dtype=np.int32), 2,
+      np.array([3, 5, 7], dtype=np.int32)),
+     (np.array([1, 4, 3, 6, 5, 8], dtype=np.int32), 2,
+      np.array([2, 4, 6], dtype=np.int32)),
+     (np.array([-1, -2, -3, -5, 1], dtype=np.int32), 2,
+      np.array([-2, -4], dtype=np.int32))
+     ])
+def test_resampling(signal, resample_param, expected):
+    fact = resampling(signal, resample_param)
+    assert_that(fact.dtype, equal_to(np.int32))
+    assert_that(np.array_equal(fact, expected), equal_to(True))
+
+
+@pytest.mark.parametrize('resample_param', RESAMPLE_PARAMETERS)
+def test_parity_with_prototype(generate_signal, resample_param):
+    expected = slow_vers(generate_signal, resample_param)
+    fact = resampling(generate_signal, resample_param)
+    assert_that(np.array_equal(fact, expected), equal_to(True))
+
+
+@pytest.mark.parametrize('resample_param', RESAMPLE_PARAMETERS)
+def test_parity_with_cython(resample_param, fast_resampling_function):
+    info = np.iinfo(np.int32)
+    signal = np.random.randint(info.min, info.max, size=5003,
+                               dtype=np.int32)
+    expected = fast_resampling_function(signal, resample_param)
+    fact = resampling(signal, resample_param)
+    assert_that(np.array_equal(fact, expected), equal_to(True))
+
+
+@pytest.mark.parametrize('resample_param', RESAMPLE_PARAMETERS)
+def test_strided_2d_signal(resample_param):
+    records = np.random.randint(-1000, 1000, size=(3001, 6), dtype=np.int32)
+    fact = resampling(records[:, 3:], resample_param)
+    for i in range(3):
+        expected = slow_vers(records[:, 3 + i], resample_param)
+        assert_that(np.array_equal(fact[:, i], expected), equal_to(True))
@@ -5,6 +5,7 @@ from hamcrest import assert_that, equal_to
 import numpy as np
 
 from seiscore.binaryfile.resampling.prototype import resampling as slow_vers
+from seiscore.binaryfile.resampling import wrap
 
 
 @pytest.mark.parametrize(
@@ -32,3 +33,73 @@ def test_fast_with_low_resampling(generate_signal,
     expected = slow_vers(generate_signal, resample_parameter=4)
     fact = fast_function(generate_signal, resample_parameter=4)
     assert_that(all(fact == expected), equal_to(True))
+
+
+@pytest.fixture()
+def restore_backend():
+    backend_name = wrap.get_backend_name()
+    yield
+    wrap.set_backend(backend_name)
+
+
+@pytest.mark.parametrize('backend_name', [wrap.NUMPY_BACKEND,
+                                          wrap.PYTHON_BACKEND])
+def test_set_backend(backend_name, restore_backend):
+    wrap.set_backend(backend_name)
+    assert_that(wrap.get_backend_name(), equal_to(backend_name))
+
+    signal = np.array([2, 4, 4, 6, 6, 8], dtype=np.int32)
+    fact = wrap.resampling(signal, 2)
+    assert_that(all(fact == np.array([3, 5, 7])), equal_to(True))
+
+
+def test_set_invalid_backend(restore_backend):
+    with pytest.raises(wrap.InvalidResamplingBackend):
+        wrap.set_backend('qwerty')
+
+
+@pytest.mark.parametrize('env_value, expected',
+                         [('numpy', 'numpy'), ('PYTHON', 'python')])
+def test_backend_env_variable(monkeypatch, env_value, expected):
+    monkeypatch.setenv(wrap.BACKEND_ENV_VARIABLE, env_value)
+    assert_that(wrap.get_default_backend_name(), equal_to(expected))
+
+
+def test_invalid_backend_env_variable(monkeypatch):
+    monkeypatch.setenv(wrap.BACKEND_ENV_VARIABLE, 'qwerty')
+    with pytest.warns(UserWarning):
+        backend_name = wrap.get_default_backend_name()
+    assert_that(backend_name in wrap.BACKENDS, equal_to(True))
+
+
+@pytest.mark.parametrize('resample_param', [1, 3, 1000])
+def test_fast_resampling_strided_readonly(resample_param,
+                                          load_fast_resampling_function):
+    records = np.random.randint(-1000, 1000, size=(6000, 3), dtype=np.int32)
+    records.flags.writeable = False
+    signal = records[:, 1]
+
+    fact = load_fast_resampling_function(signal, resample_param)
+    expected = slow_vers(signal.copy(), resample_param)
+    assert_that(all(fact == expected), equal_to(True))
+
+
+def test_fast_resampling_accumulator_width(load_fast_resampling_function):
+    # window sums are out of int32 range: typed C accumulator of nogil loop
+    # must be 64-bit (previous kernel summed python integers, so it passes
+    # this test too - it guards the typed accumulator only)
+    info = np.iinfo(np.int32)
+    signal = np.array([info.max] * 1000 + [info.min] * 1000, dtype=np.int32)
+    fact = load_fast_resampling_function(signal, 1000)
+    assert_that(list(fact), equal_to([info.max, info.min]))
+
+
+@pytest.mark.parametrize('resample_param', [0, -1, -3])
+@pytest.mark.parametrize('size', [0, 12])
+def test_fast_resampling_invalid_parameter(resample_param, size,
+                                           load_fast_resampling_function):
+    # previous kernel raised ZeroDivisionError for zero factor and returned
+    # empty array for negative factor and empty signal
+    signal = np.arange(size, dtype=np.int32)
+    with pytest.raises(ValueError):
+        load_fast_resampling_function(signal, resample_param)
@@ -0,0 +1,16 @@
+import numpy as np
+
+
+def resampling(signal: np.ndarray, resample_parameter: int) -> np.ndarray:
+    """
+    Vectorized method for signal resampling (result is equal to cython
+    version: integer sum of each window with floor division)
+    :param signal: array of signal (resampling is done along first axis)
+    :param resample_parameter: resample factor
+    :return: array of resample signal
+    """
+    resample_discrete_amount = signal.shape[0] // resample_parameter
+    windows = signal[:resample_discrete_amount * resample_parameter].reshape(
+        (resample_discrete_amount, resample_parameter) + signal.shape[1:])
+    sum_values = np.sum(windows, axis=1, dtype=np.int64)
+    return (sum_values // resample_parameter).astype(np.int32)
@@ -1,21 +1,69 @@
 import os
-import sys
+import warnings
+from typing import Callable, Dict, Union
 
 import numpy as np
 
 from seiscore.binaryfile.resampling.prototype import resampling as slow_vers
+from seiscore.binaryfile.resampling.vectorized import resampling as numpy_vers
 
 
-def import_function():
+CYTHON_BACKEND, NUMPY_BACKEND, PYTHON_BACKEND = 'cython', 'numpy', 'python'
+BACKEND_ENV_VARIABLE = 'SEISCORE_RESAMPLING_BACKEND'
+
+
+class InvalidResamplingBackend(ValueError):
+    pass
+
+
+def import_function() -> Union[Callable, None]:
     try:
-        so_file_path = os.path.dirname(__file__)
-        sys.path.insert(0, so_file_path)
         from seiscore.binaryfile.resampling import resampling as resample_core
         return resample_core.resampling
     except ImportError:
-        return slow_vers
+        return None
+
+
+def create_backends() -> Dict[str, Callable]:
+    backends = {NUMPY_BACKEND: numpy_vers, PYTHON_BACKEND: slow_vers}
+    fast_function = import_function()
+    if fast_function is not None:
+        backends[CYTHON_BACKEND] = fast_function
+    return backends
+
+
+def get_default_backend_name() -> str:
+    backend_name = os.environ.get(BACKEND_ENV_VARIABLE, '').lower()
+    if backend_name in BACKENDS:
+        return backend_name
+    if backend_name:
+        warnings.warn(f'resampling backend "{backend_name}" is unavailable')
+
+    if CYTHON_BACKEND in BACKENDS:
+        return CYTHON_BACKEND
+    return NUMPY_BACKEND
+
+
+# backends are resolved once at module import
+BACKENDS = create_backends()
+_active_backend_name = get_default_backend_name()
+
+
+def get_backend_name() -> str:
+    return _active_backend_name
+
+
+def set_backend(backend_name: str):
+    """
+    Selecting resampling backend
+    :param backend_name: backend name (cython, numpy or python)
+    """
+    global _active_backend_name
+    if backend_name not in BACKENDS:
+        raise InvalidResamplingBackend(
+            f'{backend_name} not found (available: {", ".join(BACKENDS)})')
+    _active_backend_name = backend_name
 
 
 def resampling(arr: np.ndarray, resample_parameter: int) -> np.ndarray:
-    function = import_function()
-    return function(arr, resample_parameter)
+    return BACKENDS[_active_backend_name](arr, resample_parameter)
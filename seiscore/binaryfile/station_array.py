@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.binaryfile.binaryfile import InvalidDateTimeValue
+from seiscore.binaryfile.binaryfile import get_signal_dtype
+from seiscore.binaryfile.resampling.decimation import MEAN_MODE
+
+
+class StationArray:
+    """
+    Synchronized reading of several stations into one 2D array
+    (stations x discretes). Start datetimes of files are used with
+    format corrections (SIGMA_SECONDS_OFFSET for Sigma files)
+    """
+    def __init__(self, file_paths: List[str], resample_frequency=0,
+                 is_use_avg_values=False, resample_mode=MEAN_MODE):
+        self.__binary_files = [
+            BinaryFile(x, resample_frequency, is_use_avg_values,
+                       resample_mode) for x in file_paths]
+        frequencies = {x.resample_frequency for x in self.__binary_files}
+        if len(frequencies) > 1:
+            raise InvalidResampleFrequency(
+                f'Stations have different frequencies: {frequencies}')
+
+    @property
+    def binary_files(self) -> List[BinaryFile]:
+        return self.__binary_files
+
+    @property
+    def paths(self) -> List[str]:
+        return [x.path for x in self.__binary_files]
+
+    @property
+    def frequency(self) -> int:
+        return self.__binary_files[0].resample_frequency
+
+    @property
+    def common_window(self) -> Union[Tuple[datetime, datetime], None]:
+        time_start = max(x.datetime_start for x in self.__binary_files)
+        time_stop = min(x.datetime_stop for x in self.__binary_files)
+        if time_start >= time_stop:
+            return
+        return time_start, time_stop
+
+    def __set_reading_interval(self, time_start: Union[datetime, None],
+                               time_stop: Union[datetime, None]):
+        if time_start is None or time_stop is None:
+            common_window = self.common_window
+            if common_window is None:
+                raise InvalidDateTimeValue('Stations have not common '
+                                           'recording interval')
+            time_start = time_start or common_window[0]
+            time_stop = time_stop or common_window[1]
+
+        for bin_data in self.__binary_files:
+            bin_data.read_date_time_start = time_start
+            bin_data.read_date_time_stop = time_stop
+
+    def read(self, component='Z', time_start=None, time_stop=None,
+             workers=None) -> np.ndarray:
+        """
+        Reading of component signals of all stations
+        :param component: component name
+        :param time_start: start of reading interval (by default - start of
+        common recording interval)
+        :param time_stop: end of reading interval (by default - end of
+        common recording interval)
+        :param workers: reading threads count (by default - CPU count)
+        :return: 2D array (stations x discretes), signals length is cut to
+        the shortest one (rounding of files start times can differ by one
+        discrete)
+        """
+        self.__set_reading_interval(time_start, time_stop)
+        discrete_amount = min(
+            (x.end_moment - x.start_moment) // x.resample_parameter
+            for x in self.__binary_files)
+        bin_data = self.__binary_files[0]
+        signals = np.empty((len(self.__binary_files), discrete_amount),
+                           dtype=get_signal_dtype(bin_data.resample_parameter,
+                                                  bin_data.resample_mode))
+
+        if workers is None:
+            workers = min(os.cpu_count() or 1, len(self.__binary_files))
+        # stations are read concurrently, so resampling of each station
+        # is single-threaded (otherwise stations x CPU threads are started)
+        resampling_workers = 1 if workers > 1 else None
+
+        def read_station(station_index: int):
+            bin_data = self.__binary_files[station_index]
+            signal = bin_data.read_signal(component, copy=False,
+                                          workers=resampling_workers)
+            signals[station_index] = signal[:discrete_amount]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() propagates exceptions from threads
+            list(executor.map(read_station,
+                              range(len(self.__binary_files))))
+        return signals
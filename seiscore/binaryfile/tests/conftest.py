@@ -21,6 +21,7 @@ from seiscore.binaryfile.tests.helpers import create_latitude_str
 from seiscore.binaryfile.tests.helpers import create_longitude_str
 
 from seiscore.binaryfile.tests.helpers import add_microseconds
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
 
 
 def generate_word() -> str:
@@ -217,3 +218,11 @@ def generate_baikal7_file(generate_baikal7_header):
     values = np.random.randint(-1000, 1000, size=(10_000, 3), dtype=np.int32)
     bin_fmt = header_bin_fmt + channels_bin_fmt + values.tobytes()
     return file_header, values, bin_fmt
+
+
+@pytest.fixture
+def baikal7_file_path(tmp_path) -> Tuple[str, np.ndarray]:
+    path = os.path.join(tmp_path, 'record.00')
+    values = create_baikal7_file(path, datetime(1980, 1, 1, 1), 10, 48.7,
+                                 55.5, frequency=1000)
+    return path, values
@@ -1,7 +1,11 @@
+import os
 import math
+import struct
 from random import randint
 from datetime import datetime
 
+import numpy as np
+
 
 def create_latitude_str(val: float) -> str:
     degrees = int(val)
@@ -31,3 +35,26 @@ def add_microseconds(datetime_val: datetime, frequency=1000) -> datetime:
     return datetime_val.replace(microsecond=adding_microseconds)
 
 
+def create_baikal7_file(path: str, datetime_start: datetime, seconds: float,
+                        longitude: float, latitude: float,
+                        frequency=100) -> np.ndarray:
+    channel_count = 3
+    time_begin = int((datetime_start - datetime(1980, 1, 1)).total_seconds()
+                     * 256_000_000)
+
+    bin_fmt = struct.pack('H', channel_count)
+    bin_fmt += struct.pack('10H', *[0] * 10)
+    bin_fmt += struct.pack('H', frequency)
+    bin_fmt += struct.pack('24H', *[0] * 24)
+    bin_fmt += struct.pack('2d', latitude, longitude)
+    bin_fmt += struct.pack('8H', *[0] * 8)
+    bin_fmt += struct.pack('1Q', time_begin)
+    bin_fmt = bin_fmt.ljust(120 + 72 * channel_count, b'\x00')
+
+    values = np.random.randint(-1000, 1000,
+                               size=(int(seconds * frequency), channel_count),
+                               dtype=np.int32)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(bin_fmt + values.tobytes())
+    return values
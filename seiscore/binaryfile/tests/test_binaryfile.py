@@ -3,7 +3,9 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, PropertyMock, patch
 from io import BytesIO
 
+import numpy as np
 import pytest
+from scipy.signal import resample_poly
 from hamcrest import assert_that, equal_to
 from mock_open import MockOpen
 
@@ -15,16 +17,25 @@ from seiscore.binaryfile.binaryfile import get_datetime_start_baikal7
 from seiscore.binaryfile.binaryfile import read_baikal7_header
 from seiscore.binaryfile.binaryfile import read_baikal8_header
 from seiscore.binaryfile.binaryfile import read_sigma_header
+from seiscore.binaryfile.binaryfile import read_headers
+from seiscore.binaryfile.binaryfile import decode_baikal7_headers
+from seiscore.binaryfile.binaryfile import deinterleave
 
 from seiscore.binaryfile.binaryfile import BadFilePath
+from seiscore.binaryfile.binaryfile import BadHeaderData
 from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
 from seiscore.binaryfile.binaryfile import InvalidDateTimeValue
+from seiscore.binaryfile.binaryfile import InvalidComponentName
+from seiscore.binaryfile.binaryfile import InvalidChunkSize
+from seiscore.binaryfile.binaryfile import InvalidResampleMode
 from seiscore.binaryfile.binaryfile import BinaryFile
 
 from seiscore.binaryfile.binaryfile import (BAIKAL7_FMT, BAIKAL8_FMT,
                                             SIGMA_FMT, BINARY_FILE_FORMATS)
 from seiscore.binaryfile.binaryfile import SIGMA_SECONDS_OFFSET
 from seiscore.binaryfile.binaryfile import COMPONENTS_ORDER
+from seiscore.binaryfile.binaryfile import SIGMA_HEADER_DTYPE
+from seiscore.binaryfile.binaryfile import BAIKAL7_HEADER_DTYPE
 
 DEFAULT_PATH = '/some/path'
 
@@ -688,3 +699,268 @@ class TestBinaryFile:
             bin_data = BinaryFile(self.default_path)
             print(bin_data.file_header)
             print(bin_data._get_component_signal('X'))
+
+
+class TestBinaryFileReading:
+    @pytest.mark.parametrize('components', ['ZXY', 'XY', 'YZ', 'z'])
+    def test_read_signals(self, baikal7_file_path, components):
+        path, values = baikal7_file_path
+        bin_data = BinaryFile(path)
+
+        signals = bin_data.read_signals(components)
+        assert signals.shape == (values.shape[0], len(components))
+        for i, component in enumerate(components.upper()):
+            column = COMPONENTS_ORDER.index(component)
+            assert np.array_equal(signals[:, i], values[:, column])
+
+    @pytest.mark.parametrize('resample_frequency, is_use_avg_values',
+                             [(0, False), (250, False), (100, True),
+                              (1, True)])
+    def test_read_signals_as_read_signal(self, baikal7_file_path,
+                                         resample_frequency,
+                                         is_use_avg_values):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency, is_use_avg_values)
+        bin_data.read_date_time_start = \
+            bin_data.datetime_start + timedelta(seconds=1.5)
+
+        signals = bin_data.read_signals(as_dict=True)
+        for component in COMPONENTS_ORDER:
+            expected = bin_data.read_signal(component)
+            assert np.array_equal(signals[component], expected)
+
+    @pytest.mark.parametrize('resample_frequency, is_use_avg_values, mode',
+                             [(0, False, 'mean'), (250, False, 'mean'),
+                              (0, True, 'mean'), (100, True, 'fir')])
+    def test_read_signals_channel_major(self, baikal7_file_path,
+                                        resample_frequency,
+                                        is_use_avg_values, mode):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency, is_use_avg_values,
+                              mode)
+        signals = bin_data.read_signals('YZ')
+        assert signals.flags.f_contiguous
+        assert np.array_equal(signals[:, 0], bin_data.read_signal('Y'))
+
+    @pytest.mark.parametrize('components', ['ZZ', 'ZQ'])
+    def test_read_signals_invalid_components(self, baikal7_file_path,
+                                             components):
+        path, _ = baikal7_file_path
+        with pytest.raises(InvalidComponentName):
+            BinaryFile(path).read_signals(components)
+
+    @pytest.mark.parametrize('component', ['X', 'Y', 'Z'])
+    def test_read_signal_view(self, baikal7_file_path, component):
+        path, values = baikal7_file_path
+        signal = BinaryFile(path).read_signal(component, copy=False)
+
+        column = COMPONENTS_ORDER.index(component)
+        assert signal.flags.writeable is False
+        assert np.array_equal(signal, values[:, column])
+
+    def test_read_signals_view(self, baikal7_file_path):
+        path, values = baikal7_file_path
+        signals = BinaryFile(path).read_signals(copy=False)
+        assert signals.flags.writeable is False
+        assert np.array_equal(signals, values)
+
+    @pytest.mark.parametrize('resample_frequency, is_use_avg_values',
+                             [(250, False), (0, True)])
+    def test_read_signal_view_not_allowed(self, baikal7_file_path,
+                                          resample_frequency,
+                                          is_use_avg_values):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency, is_use_avg_values)
+        signal = bin_data.read_signal(copy=False)
+        assert signal.flags.writeable is True
+        assert np.array_equal(signal, bin_data.read_signal())
+
+    @pytest.mark.parametrize('resample_frequency, is_use_avg_values',
+                             [(0, False), (250, False), (100, True),
+                              (0, True)])
+    def test_iter_chunks(self, baikal7_file_path, resample_frequency,
+                         is_use_avg_values):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency, is_use_avg_values)
+        bin_data.read_date_time_start = \
+            bin_data.datetime_start + timedelta(seconds=0.5)
+
+        chunks = list(bin_data.iter_chunks('X', chunk_seconds=1.5))
+        assert chunks[0].datetime_start == bin_data.read_date_time_start
+        assert chunks[1].datetime_start == \
+            bin_data.read_date_time_start + timedelta(seconds=1.5)
+
+        signal = np.concatenate([x.signal for x in chunks])
+        assert np.array_equal(signal, bin_data.read_signal('X'))
+
+    def test_iter_chunks_overlap(self, baikal7_file_path):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path)
+        signal = bin_data.read_signal('Y')
+
+        chunks = list(bin_data.iter_chunks('Y', chunk_seconds=2,
+                                           overlap_seconds=0.5))
+        assert len(chunks) == 7
+        for i, chunk in enumerate(chunks):
+            assert np.array_equal(chunk.signal,
+                                  signal[i * 1500:i * 1500 + 2000])
+
+    @pytest.mark.parametrize('chunk_seconds, overlap_seconds',
+                             [(0, 0), (1, 1), (1, -0.5)])
+    def test_iter_chunks_invalid_size(self, baikal7_file_path, chunk_seconds,
+                                      overlap_seconds):
+        path, _ = baikal7_file_path
+        with pytest.raises(InvalidChunkSize):
+            next(BinaryFile(path).iter_chunks('Z', chunk_seconds,
+                                              overlap_seconds))
+
+    def test_invalid_resample_mode(self, baikal7_file_path):
+        path, _ = baikal7_file_path
+        with pytest.raises(InvalidResampleMode):
+            BinaryFile(path, resample_mode='qwerty')
+
+    @pytest.mark.parametrize('resample_frequency', [500, 100, 10])
+    def test_read_signal_fir_mode(self, baikal7_file_path,
+                                  resample_frequency):
+        path, values = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency, resample_mode='fir')
+
+        expected = resample_poly(values[:, 1].astype(np.float64), 1,
+                                 1000 // resample_frequency)
+        assert np.allclose(bin_data.read_signal('X'), expected)
+
+    @pytest.mark.parametrize('resample_mode', ['fir', 'iir'])
+    def test_read_signals_decimation(self, baikal7_file_path, resample_mode):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, 100, resample_mode=resample_mode)
+        signals = bin_data.read_signals('XY')
+        assert signals.shape == (1000, 2)
+        assert np.array_equal(signals[:, 1], bin_data.read_signal('Y'))
+
+    @pytest.mark.parametrize('resample_mode, is_use_avg_values',
+                             [('fir', False), ('iir', True)])
+    def test_iter_chunks_decimation(self, baikal7_file_path, resample_mode,
+                                    is_use_avg_values):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, 100, is_use_avg_values,
+                              resample_mode=resample_mode)
+        chunks = bin_data.iter_chunks('Z', chunk_seconds=3)
+        signal = np.concatenate([x.signal for x in chunks])
+        assert np.allclose(signal, bin_data.read_signal('Z'))
+
+    def test_peek(self, baikal7_file_path):
+        path, _ = baikal7_file_path
+        assert BinaryFile.peek(path) == BinaryFile(path).short_file_info
+
+    def test_peek_bad_path(self, tmp_path):
+        with pytest.raises(BadFilePath):
+            BinaryFile.peek(os.path.join(tmp_path, 'file.qwerty'))
+
+    def test_file_parameters_caching(self, baikal7_file_path):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path)
+        with patch('os.path.getsize', wraps=os.path.getsize) as getsize_mock:
+            for _ in range(3):
+                _ = bin_data.datetime_stop
+                _ = bin_data.end_moment
+            assert getsize_mock.call_count == 1
+
+    def test_reading_interval_cache_reset(self, baikal7_file_path):
+        path, _ = baikal7_file_path
+        bin_data = BinaryFile(path, resample_frequency=100)
+        assert (bin_data.start_moment, bin_data.end_moment) == (0, 10_000)
+
+        bin_data.read_date_time_start = \
+            bin_data.datetime_start + timedelta(seconds=1.005)
+        assert (bin_data.start_moment, bin_data.end_moment) == (1005, 9995)
+
+        bin_data.read_date_time_stop = \
+            bin_data.datetime_start + timedelta(seconds=5)
+        assert (bin_data.start_moment, bin_data.end_moment) == (1005, 4995)
+
+
+@pytest.mark.parametrize('column_indexes', [[0, 1, 2, 3, 4, 5], [5, 3],
+                                            [1]])
+@pytest.mark.parametrize('block_size', [7, 100, 1000])
+def test_deinterleave(column_indexes, block_size):
+    records = np.random.randint(-1000, 1000, size=(250, 6), dtype=np.int32)
+    signals = deinterleave(records, column_indexes, block_size)
+    assert signals.flags.c_contiguous
+    assert np.array_equal(signals, records[:, column_indexes].T)
+
+
+def test_read_headers(tmp_path, generate_baikal7_header,
+                      generate_baikal8_header, generate_sigma_header):
+    paths, expected_headers = [], []
+    for extension, (file_header, bin_fmt) in zip(
+            ('00', 'xx', 'bin'), (generate_baikal7_header,
+                                  generate_baikal8_header,
+                                  generate_sigma_header)):
+        path = os.path.join(tmp_path, f'file.{extension}')
+        with open(path, 'wb') as f:
+            f.write(bin_fmt)
+        paths.append(path)
+        expected_headers.append(file_header)
+    paths += [os.path.join(tmp_path, 'absent.xx'),
+              os.path.join(tmp_path, 'file.qwerty')]
+
+    headers = read_headers(paths)
+    assert list(headers['is_valid']) == [True, True, True, False, False]
+    assert list(headers['format_type'][:3]) == [BAIKAL7_FMT, BAIKAL8_FMT,
+                                                SIGMA_FMT]
+    readers = (read_baikal7_header, read_baikal8_header, read_sigma_header)
+    for path, header, reader in zip(paths, headers, readers):
+        file_header = reader(path)
+        assert file_header.channel_count == header['channel_count']
+        assert file_header.frequency == header['frequency']
+        assert file_header.datetime_start == header['datetime_start'].item()
+        assert file_header.longitude == header['longitude']
+        assert file_header.latitude == header['latitude']
+
+
+def test_read_headers_zero_filled_files(tmp_path):
+    # preallocated files without written header
+    paths = [os.path.join(tmp_path, f'zero.{x}') for x in ('00', 'xx', 'bin')]
+    for path in paths:
+        with open(path, 'wb') as f:
+            f.write(bytes(400))
+
+    headers = read_headers(paths)
+    assert not headers['is_valid'].any()
+    assert all(headers['error'])
+    assert headers['error'][0] == 'invalid channel count/frequency'
+    with pytest.raises(BadHeaderData):
+        read_baikal7_header(paths[0])
+
+
+def test_decode_baikal7_present_day_datetimes():
+    records = np.zeros(1000, dtype=BAIKAL7_HEADER_DTYPE)
+    records['channel_count'], records['frequency'] = 3, 1000
+    # random moments of 2010-2030 years
+    seconds_start = (datetime(2010, 1, 1) - datetime(1980, 1, 1)) \
+        .total_seconds()
+    seconds_stop = (datetime(2030, 1, 1) - datetime(1980, 1, 1)) \
+        .total_seconds()
+    records['time_begin'] = np.random.randint(
+        int(seconds_start * 256_000_000), int(seconds_stop * 256_000_000),
+        size=records.shape[0], dtype=np.uint64)
+
+    headers = decode_baikal7_headers(records)
+    for header, time_begin in zip(headers, records['time_begin']):
+        assert header['datetime_start'].item() == \
+            get_datetime_start_baikal7(int(time_begin))
+
+
+@pytest.mark.parametrize('field, value',
+                         [('date', 231340), ('time', 126000),
+                          ('latitude', b'55qq.000N')])
+def test_read_sigma_header_bad_data(generate_sigma_header, field, value):
+    _, bin_fmt = generate_sigma_header
+    records = np.frombuffer(bin_fmt, dtype=SIGMA_HEADER_DTYPE,
+                            count=1).copy()
+    records[field] = value
+
+    file_mock = MockOpen(read_data=records.tobytes())
+    with patch('builtins.open', file_mock):
+        with pytest.raises(BadHeaderData):
+            read_sigma_header(file_mock)
@@ -0,0 +1,108 @@
+import os
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.cache import SignalCache
+from seiscore.binaryfile.cache import CACHE_DIR_ENV_VARIABLE
+from seiscore.binaryfile.cache import create_cache_key
+
+
+@pytest.fixture
+def signal_cache(tmp_path) -> SignalCache:
+    return SignalCache(os.path.join(tmp_path, 'cache'))
+
+
+def test_put_and_get(signal_cache):
+    signals = np.arange(30, dtype=np.int32).reshape(3, 10)
+    assert signal_cache.get('key') is None
+
+    signal_cache.put('key', signals)
+    cached_signals = signal_cache.get('key')
+    assert 'key' in signal_cache
+    assert np.array_equal(cached_signals, signals)
+    assert not cached_signals.flags.writeable
+
+
+def test_eviction(tmp_path):
+    signals = np.zeros((3, 1000), dtype=np.int32)
+    signal_cache = SignalCache(tmp_path)
+    signal_cache.put('a', signals)
+    # cache for three files
+    signal_cache = SignalCache(tmp_path, max_size=3 * signal_cache.size)
+    for i, key in enumerate(['a', 'b', 'c']):
+        signal_cache.put(key, signals)
+        os.utime(os.path.join(tmp_path, f'{key}.npy'), (i, i))
+
+    # "a" becomes the most recently used
+    signal_cache.get('a')
+    signal_cache.put('d', signals)
+    assert [x in signal_cache for x in 'abcd'] == [True, False, True, True]
+    assert signal_cache.size <= signal_cache.max_size
+
+
+def test_cache_key(baikal7_file_path):
+    path, _ = baikal7_file_path
+    key = create_cache_key(path, 100, 'mean')
+    assert key == create_cache_key(path, 100, 'mean')
+    assert key != create_cache_key(path, 100, 'fir')
+
+    os.utime(path, ns=(0, 0))
+    assert key != create_cache_key(path, 100, 'mean')
+
+
+@pytest.mark.parametrize('resample_frequency, is_use_avg_values, mode',
+                         [(100, False, 'mean'), (1000, True, 'mean'),
+                          (100, True, 'fir'), (50, False, 'iir')])
+def test_read_signal(baikal7_file_path, signal_cache, resample_frequency,
+                     is_use_avg_values, mode):
+    path, _ = baikal7_file_path
+    bin_data = BinaryFile(path, resample_frequency, is_use_avg_values, mode)
+    cached_bin_data = BinaryFile(path, resample_frequency, is_use_avg_values,
+                                 mode, signal_cache=signal_cache)
+    for bin_file in (bin_data, cached_bin_data):
+        bin_file.read_date_time_start = \
+            bin_file.datetime_start + timedelta(seconds=1)
+
+    for component in 'ZXY':
+        expected = bin_data.read_signal(component)
+        signal = cached_bin_data.read_signal(component)
+        assert signal.dtype == expected.dtype
+        assert np.array_equal(signal, expected)
+        assert signal.flags.writeable
+        assert not cached_bin_data.read_signal(component,
+                                               copy=False).flags.writeable
+
+
+def test_read_signal_from_cache(baikal7_file_path, signal_cache):
+    path, _ = baikal7_file_path
+    expected = BinaryFile(path, 100, signal_cache=signal_cache).read_signal()
+    assert len(os.listdir(signal_cache.cache_dir)) == 1
+
+    with patch.object(BinaryFile, '_get_component_signal') as mock_reading:
+        signal = BinaryFile(path, 100, signal_cache=signal_cache).read_signal()
+    mock_reading.assert_not_called()
+    assert np.array_equal(signal, expected)
+
+
+def test_cache_is_not_used_without_conversion(baikal7_file_path,
+                                              signal_cache):
+    path, values = baikal7_file_path
+    signal = BinaryFile(path, signal_cache=signal_cache).read_signal('X')
+    assert np.array_equal(signal, values[:, 1])
+    assert signal_cache.size == 0
+
+
+def test_default_cache(baikal7_file_path, tmp_path, monkeypatch):
+    path, _ = baikal7_file_path
+    assert BinaryFile(path).signal_cache is None
+
+    cache_dir = os.path.join(tmp_path, 'default')
+    monkeypatch.setenv(CACHE_DIR_ENV_VARIABLE, cache_dir)
+    bin_data = BinaryFile(path, 100)
+    assert bin_data.signal_cache.cache_dir == cache_dir
+    bin_data.read_signal()
+    assert len(os.listdir(cache_dir)) == 1
@@ -0,0 +1,140 @@
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.binaryfile import InvalidDateTimeValue
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.binaryfile.continuous import ContinuousRecording
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+
+
+DATETIME_START = datetime(2026, 3, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    # two consecutive files, gap 10 seconds, overlap 10 seconds
+    paths, values = [], []
+    for i, (offset, seconds) in enumerate([(0, 60), (60, 60), (130, 30),
+                                           (150, 30)]):
+        path = os.path.join(tmp_path, f'file{i}.00')
+        values.append(create_baikal7_file(
+            path, DATETIME_START + timedelta(seconds=offset), seconds,
+            49, 55))
+        paths.append(path)
+    return paths, values
+
+
+def test_discontinuities(recording):
+    paths, _ = recording
+    # files order is restored by start datetime
+    stream = ContinuousRecording(paths[::-1])
+    assert stream.paths == paths
+    assert stream.datetime_start == DATETIME_START
+    assert stream.datetime_stop == DATETIME_START + timedelta(seconds=180)
+
+    gap, overlap = stream.discontinuities
+    assert stream.gaps == [gap]
+    assert stream.overlaps == [overlap]
+    assert (gap.previous_path, gap.next_path) == (paths[1], paths[2])
+    assert gap.seconds == 10
+    assert (overlap.previous_path, overlap.next_path) == (paths[2], paths[3])
+    assert overlap.seconds == -10
+
+
+def test_read_signal(recording):
+    paths, values = recording
+    stream = ContinuousRecording(paths)
+    signal = stream.read_signal('Y', fill_value=-1)
+
+    assert signal.shape == (18000,)
+    assert np.array_equal(signal[:6000], values[0][:, 2])
+    assert np.array_equal(signal[6000:12000], values[1][:, 2])
+    assert np.all(signal[12000:13000] == -1)
+    assert np.array_equal(signal[13000:16000], values[2][:, 2])
+    # overlapping part of last file is skipped
+    assert np.array_equal(signal[16000:], values[3][1000:, 2])
+
+
+def test_read_signal_interval(recording):
+    paths, values = recording
+    stream = ContinuousRecording(paths)
+    stream.read_date_time_start = DATETIME_START + timedelta(seconds=50)
+    stream.read_date_time_stop = DATETIME_START + timedelta(seconds=70)
+    signal = stream.read_signal('Z')
+
+    expected = np.concatenate([values[0][5000:, 0], values[1][:1000, 0]])
+    assert np.array_equal(signal, expected)
+
+
+def test_read_resampled_signal(recording):
+    paths, _ = recording
+    stream = ContinuousRecording(paths[:2], resample_frequency=20)
+    expected = np.concatenate(
+        [BinaryFile(x, 20).read_signal('X') for x in paths[:2]])
+    assert np.array_equal(stream.read_signal('X'), expected)
+
+
+def test_read_signal_with_average(recording):
+    paths, _ = recording
+    stream = ContinuousRecording(paths, is_use_avg_values=True)
+    src_signal = ContinuousRecording(paths).read_signal()
+    signal = stream.read_signal()
+
+    is_gap = np.zeros(signal.shape[0], dtype=bool)
+    is_gap[12000:13000] = True
+    average_value = int(np.average(src_signal[~is_gap]))
+    assert np.array_equal(signal[~is_gap], src_signal[~is_gap] - average_value)
+    assert np.all(signal[is_gap] == 0)
+
+
+def test_invalid_reading_interval(recording):
+    paths, _ = recording
+    stream = ContinuousRecording(paths)
+    with pytest.raises(InvalidDateTimeValue):
+        stream.read_date_time_start = DATETIME_START - timedelta(seconds=1)
+    with pytest.raises(InvalidDateTimeValue):
+        stream.read_date_time_stop = DATETIME_START + timedelta(seconds=181)
+
+
+def test_different_frequencies(recording, tmp_path):
+    paths, _ = recording
+    path = os.path.join(tmp_path, 'other.00')
+    create_baikal7_file(path, DATETIME_START + timedelta(seconds=180), 60,
+                        49, 55, frequency=200)
+    with pytest.raises(InvalidResampleFrequency):
+        ContinuousRecording(paths + [path])
+
+
+@pytest.mark.parametrize('discretes_counts', [
+    (2005, 2005, 2000), (1533, 3693, 3393, 3532), (2003, 7, 1999)])
+@pytest.mark.parametrize('resample_frequency', [100, 250])
+def test_read_resampled_contiguous_files(tmp_path, discretes_counts,
+                                         resample_frequency):
+    # file lengths are not multiples of resample parameter
+    paths, values = [], []
+    datetime_start = DATETIME_START
+    for i, discretes_count in enumerate(discretes_counts):
+        path = os.path.join(tmp_path, f'file{i}.00')
+        values.append(create_baikal7_file(
+            path, datetime_start, (discretes_count + 0.5) / 1000, 49, 55,
+            frequency=1000))
+        paths.append(path)
+        datetime_start += timedelta(milliseconds=discretes_count)
+
+    stream = ContinuousRecording(paths, resample_frequency)
+    assert stream.discontinuities == []
+    signal = stream.read_signal('Z', fill_value=-999_999)
+    assert not np.any(signal == -999_999)
+
+    # origin discretes of all files are resampled as one signal
+    resample_parameter = 1000 // resample_frequency
+    origin_signal = np.concatenate([x[:, 0] for x in values])
+    discrete_amount = origin_signal.shape[0] // resample_parameter
+    expected = np.sum(origin_signal[:discrete_amount * resample_parameter]
+                      .reshape(-1, resample_parameter), axis=1,
+                      dtype=np.int64) // resample_parameter
+    assert np.array_equal(signal, expected)
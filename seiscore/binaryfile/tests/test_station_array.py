@@ -0,0 +1,97 @@
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.binaryfile.binaryfile import InvalidDateTimeValue
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.station_array import StationArray
+from seiscore.binaryfile.resampling.parallel import parallel_resampling
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+
+
+DATETIME_START = datetime(2026, 3, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def stations(tmp_path):
+    paths, values, offsets = [], [], [0, 10, 5.5]
+    for i, offset in enumerate(offsets):
+        path = os.path.join(tmp_path, f'station{i}.00')
+        values.append(create_baikal7_file(
+            path, DATETIME_START + timedelta(seconds=offset), 60, 49, 55))
+        paths.append(path)
+    return paths, values
+
+
+def test_common_window(stations):
+    paths, _ = stations
+    assert StationArray(paths).common_window == (
+        DATETIME_START + timedelta(seconds=10),
+        DATETIME_START + timedelta(seconds=60))
+
+
+@pytest.mark.parametrize('workers', [1, 3, None])
+def test_read(stations, workers):
+    paths, values = stations
+    signals = StationArray(paths).read('X', workers=workers)
+
+    assert signals.shape == (3, 5000)
+    for signal, station_values, left_edge in zip(signals, values,
+                                                 [1000, 0, 450]):
+        expected = station_values[left_edge:left_edge + 5000, 1]
+        assert np.array_equal(signal, expected)
+
+
+@pytest.mark.parametrize('resample_frequency, resample_mode',
+                         [(20, 'mean'), (10, 'fir')])
+def test_read_as_binary_files(stations, resample_frequency, resample_mode):
+    paths, _ = stations
+    time_start = DATETIME_START + timedelta(seconds=15)
+    time_stop = DATETIME_START + timedelta(seconds=45)
+
+    array = StationArray(paths, resample_frequency, is_use_avg_values=True,
+                         resample_mode=resample_mode)
+    signals = array.read('Y', time_start, time_stop)
+    assert signals.shape == (3, 30 * resample_frequency)
+    for path, signal in zip(paths, signals):
+        bin_data = BinaryFile(path, resample_frequency, True, resample_mode)
+        bin_data.read_date_time_start = time_start
+        bin_data.read_date_time_stop = time_stop
+        assert np.array_equal(signal, bin_data.read_signal('Y'))
+
+
+def test_different_frequencies(stations, tmp_path):
+    paths, _ = stations
+    path = os.path.join(tmp_path, 'other.00')
+    create_baikal7_file(path, DATETIME_START, 60, 49, 55, frequency=200)
+    with pytest.raises(InvalidResampleFrequency):
+        StationArray(paths + [path])
+    assert StationArray(paths + [path], resample_frequency=50).frequency == 50
+
+
+def test_without_common_window(stations, tmp_path):
+    paths, _ = stations
+    path = os.path.join(tmp_path, 'other.00')
+    create_baikal7_file(path, DATETIME_START + timedelta(hours=1), 60, 49,
+                        55)
+    with pytest.raises(InvalidDateTimeValue):
+        StationArray(paths + [path]).read()
+
+
+@pytest.mark.parametrize('workers, expected_workers', [(3, 1), (1, None)])
+def test_nested_resampling_threads(stations, workers, expected_workers):
+    paths, _ = stations
+    resampling_workers = []
+
+    def resampling_mock(signal, resample_parameter, workers=None):
+        resampling_workers.append(workers)
+        return parallel_resampling(signal, resample_parameter, workers)
+
+    with patch('seiscore.binaryfile.binaryfile.parallel_resampling',
+               side_effect=resampling_mock):
+        StationArray(paths, 20).read('Z', workers=workers)
+    assert resampling_workers == [expected_workers] * len(paths)
@@ -0,0 +1,234 @@
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import NamedTuple, List, Tuple, Dict, Iterator, Union
+
+import numpy as np
+
+from seiscore.binaryfile.binaryfile import FileInfo
+from seiscore.binaryfile.binaryfile import is_binary_file_path
+from seiscore.binaryfile.binaryfile import read_headers
+from seiscore.binaryfile.binaryfile import get_discrete_amount
+from seiscore.binaryfile.binaryfile import get_seconds_duration
+from seiscore.binaryfile.binaryfile import get_datetime_start
+
+
+EPOCH = datetime(1970, 1, 1)
+# files count for one header reading task
+SCAN_BATCH_SIZE = 256
+
+CREATE_TABLE_QUERY = '''
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    format_type TEXT NOT NULL,
+    frequency INTEGER NOT NULL,
+    time_start INTEGER NOT NULL,
+    time_stop INTEGER NOT NULL,
+    longitude REAL NOT NULL,
+    latitude REAL NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+)
+'''
+CREATE_INDEXES_QUERIES = (
+    'CREATE INDEX IF NOT EXISTS files_time ON files (time_start, time_stop)',
+    'CREATE INDEX IF NOT EXISTS files_coordinates '
+    'ON files (longitude, latitude)'
+)
+FILE_INFO_COLUMNS = 'path, format_type, frequency, time_start, time_stop, ' \
+                    'longitude, latitude'
+
+
+class FileStat(NamedTuple):
+    path: str
+    mtime_ns: int
+    size: int
+
+
+class ScanResult(NamedTuple):
+    added: int
+    updated: int
+    removed: int
+    failed: List[Tuple[str, str]]
+
+
+def datetime_to_microseconds(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def microseconds_to_datetime(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+def walk_binary_files(root: str) -> Iterator[FileStat]:
+    for folder, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(folder, filename)
+            if not is_binary_file_path(path):
+                continue
+            stat = os.stat(path)
+            yield FileStat(path, stat.st_mtime_ns, stat.st_size)
+
+
+def create_record(file_stat: FileStat, header: np.void) -> tuple:
+    format_type = str(header['format_type'])
+    frequency = int(header['frequency'])
+    discrete_amount = get_discrete_amount(file_stat.size,
+                                          int(header['channel_count']))
+    datetime_start = get_datetime_start(header['datetime_start'].item(),
+                                        format_type)
+    datetime_stop = datetime_start + timedelta(
+        seconds=get_seconds_duration(discrete_amount, frequency))
+    return (file_stat.path, format_type, frequency,
+            datetime_to_microseconds(datetime_start),
+            datetime_to_microseconds(datetime_stop),
+            round(float(header['longitude']), 6),
+            round(float(header['latitude']), 6),
+            file_stat.mtime_ns, file_stat.size)
+
+
+def create_records(file_stats: List[FileStat]) -> \
+        Tuple[List[tuple], List[Tuple[str, str]]]:
+    """
+    Creating catalog records for files
+    :param file_stats: files for indexing
+    :return: records for files table and list of (path, error) pairs for
+    invalid files
+    """
+    headers = read_headers([x.path for x in file_stats])
+    records, failed = [], []
+    for file_stat, header in zip(file_stats, headers):
+        if not header['is_valid']:
+            failed.append((file_stat.path, str(header['error'])))
+            continue
+        try:
+            records.append(create_record(file_stat, header))
+        except (ArithmeticError, ValueError) as e:
+            # one broken file must not stop scanning
+            failed.append((file_stat.path, f'{type(e).__name__}: {e}'))
+    return records, failed
+
+
+class Catalog:
+    """
+    Persistent index of recording files (SQLite database)
+    """
+    def __init__(self, index_path: str):
+        self.__index_path = index_path
+        self.__connection = sqlite3.connect(index_path)
+        with self.__connection:
+            self.__connection.execute(CREATE_TABLE_QUERY)
+            for query in CREATE_INDEXES_QUERIES:
+                self.__connection.execute(query)
+
+    @property
+    def index_path(self) -> str:
+        return self.__index_path
+
+    def __enter__(self) -> 'Catalog':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.__connection.execute(
+            'SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def close(self):
+        self.__connection.close()
+
+    def __get_indexed_files(self, root: str) -> Dict[str, Tuple[int, int]]:
+        cursor = self.__connection.execute(
+            'SELECT path, mtime_ns, size FROM files')
+        root_prefix = os.path.join(root, '')
+        return {path: (mtime_ns, size) for path, mtime_ns, size in cursor
+                if path.startswith(root_prefix)}
+
+    def scan(self, root: str, workers=None) -> ScanResult:
+        """
+        Indexing of all recording files in folder tree. Rescan reads headers
+        only of new and changed (by mtime or size) files and removes records
+        of deleted files
+        :param root: root folder
+        :param workers: threads count for headers reading
+        :return: scan statistics and list of (path, error) for bad files
+        """
+        root = os.path.abspath(root)
+        indexed_files = self.__get_indexed_files(root)
+
+        new_files, changed_files = [], []
+        for file_stat in walk_binary_files(root):
+            indexed_stat = indexed_files.pop(file_stat.path, None)
+            if indexed_stat is None:
+                new_files.append(file_stat)
+            elif indexed_stat != (file_stat.mtime_ns, file_stat.size):
+                changed_files.append(file_stat)
+
+        file_stats = new_files + changed_files
+        batches = [file_stats[i:i + SCAN_BATCH_SIZE]
+                   for i in range(0, len(file_stats), SCAN_BATCH_SIZE)]
+        records, failed = [], []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_records, batch_failed in executor.map(create_records,
+                                                            batches):
+                records += batch_records
+                failed += batch_failed
+
+        failed_paths = {x[0] for x in failed}
+        with self.__connection:
+            self.__connection.executemany(
+                'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, '
+                '?, ?)', records)
+            # changed files that became unreadable are removed too
+            self.__connection.executemany(
+                'DELETE FROM files WHERE path = ?',
+                [(x,) for x in list(indexed_files) + list(failed_paths)])
+
+        updated_count = sum(1 for x in changed_files
+                            if x.path not in failed_paths)
+        return ScanResult(len(records) - updated_count, updated_count,
+                          len(indexed_files), failed)
+
+    def query(self, time_start: Union[datetime, None] = None,
+              time_stop: Union[datetime, None] = None,
+              bbox: Union[Tuple[float, float, float, float], None] = None) \
+            -> List[FileInfo]:
+        """
+        Searching files
+        :param time_start: start of time interval (files overlapping the
+        interval are selected)
+        :param time_stop: end of time interval
+        :param bbox: coordinates limits (min longitude, min latitude,
+        max longitude, max latitude)
+        :return: list of files info sorted by start time
+        """
+        conditions, parameters = [], []
+        if time_start is not None:
+            conditions.append('time_stop > ?')
+            parameters.append(datetime_to_microseconds(time_start))
+        if time_stop is not None:
+            conditions.append('time_start < ?')
+            parameters.append(datetime_to_microseconds(time_stop))
+        if bbox is not None:
+            conditions.append('longitude BETWEEN ? AND ? AND '
+                              'latitude BETWEEN ? AND ?')
+            min_longitude, min_latitude, max_longitude, max_latitude = bbox
+            parameters += [min_longitude, max_longitude, min_latitude,
+                           max_latitude]
+
+        query = f'SELECT {FILE_INFO_COLUMNS} FROM files'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY time_start, path'
+
+        files_info = []
+        for row in self.__connection.execute(query, parameters):
+            path, format_type, frequency, time_start_us, time_stop_us, \
+                longitude, latitude = row
+            files_info.append(FileInfo(
+                path, format_type, frequency,
+                microseconds_to_datetime(time_start_us),
+                microseconds_to_datetime(time_stop_us), longitude, latitude))
+        return files_info
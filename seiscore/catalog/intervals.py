@@ -0,0 +1,155 @@
+from datetime import datetime
+from typing import NamedTuple, List, Tuple, Union
+
+import numpy as np
+
+from seiscore.binaryfile.binaryfile import FileInfo
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.binaryfile.binaryfile import get_discrete_index
+from seiscore.binaryfile.binaryfile import get_end_discrete_index
+from seiscore.catalog.catalog import datetime_to_microseconds
+
+
+class ReadOffsets(NamedTuple):
+    file_info: FileInfo
+    start_moment: int
+    end_moment: int
+
+
+class DurationBucket(NamedTuple):
+    # indexes of files in start-sorted list
+    indexes: np.ndarray
+    starts: np.ndarray
+    stops: np.ndarray
+    max_duration: int
+
+
+def get_duration_bucket(duration: int) -> int:
+    # durations of one bucket differ less than twice
+    return int(duration).bit_length()
+
+
+class IntervalIndex:
+    """
+    Index of files time intervals based on sorted endpoints. Files are
+    split by duration buckets (durations of one bucket differ less than
+    twice), so searching in bucket takes O(log n) plus size of its files
+    subset starting inside (time_start - max bucket duration, time_stop),
+    which is comparable with result size. Long files do not widen
+    searching for short ones
+    """
+    def __init__(self, files_info: List[FileInfo]):
+        self.__files_info = sorted(files_info, key=lambda x: x.time_start)
+        starts = np.array([datetime_to_microseconds(x.time_start)
+                           for x in self.__files_info], dtype=np.int64)
+        stops = np.array([datetime_to_microseconds(x.time_stop)
+                          for x in self.__files_info], dtype=np.int64)
+        self.__stops = stops
+
+        bucket_numbers = np.array(
+            [get_duration_bucket(x) for x in stops - starts], dtype=np.int64)
+        self.__buckets = []
+        for bucket_number in np.unique(bucket_numbers):
+            indexes = np.flatnonzero(bucket_numbers == bucket_number)
+            self.__buckets.append(DurationBucket(
+                indexes, starts[indexes], stops[indexes],
+                int(np.max(stops[indexes] - starts[indexes]))))
+
+    def __len__(self) -> int:
+        return len(self.__files_info)
+
+    @property
+    def files_info(self) -> List[FileInfo]:
+        return self.__files_info
+
+    def _candidates(self, time_start: int, time_stop: int,
+                    is_stop_included=False) -> np.ndarray:
+        # sorted indexes of files which can cover [time_start, time_stop)
+        side = 'right' if is_stop_included else 'left'
+        candidates = [np.zeros(0, dtype=np.int64)]
+        for bucket in self.__buckets:
+            left_index = np.searchsorted(bucket.starts,
+                                         time_start - bucket.max_duration)
+            right_index = np.searchsorted(bucket.starts, time_stop,
+                                          side=side)
+            candidates.append(bucket.indexes[left_index:right_index])
+        return np.sort(np.concatenate(candidates))
+
+    def __select(self, indexes: np.ndarray) -> List[FileInfo]:
+        return [self.__files_info[i] for i in indexes]
+
+    def overlapping(self, time_start: datetime,
+                    time_stop: datetime) -> List[FileInfo]:
+        """
+        Files overlapping time interval
+        :return: list of files info sorted by start time
+        """
+        time_start = datetime_to_microseconds(time_start)
+        time_stop = datetime_to_microseconds(time_stop)
+        indexes = self._candidates(time_start, time_stop)
+        return self.__select(indexes[self.__stops[indexes] > time_start])
+
+    def containing(self, time_start: datetime,
+                   time_stop: datetime) -> List[FileInfo]:
+        """
+        Files containing whole time interval
+        :return: list of files info sorted by start time
+        """
+        time_start = datetime_to_microseconds(time_start)
+        time_stop = datetime_to_microseconds(time_stop)
+        indexes = self._candidates(time_start, time_start,
+                                    is_stop_included=True)
+        return self.__select(indexes[self.__stops[indexes] >= time_stop])
+
+    def active_at(self, moment: datetime) -> List[FileInfo]:
+        """
+        Files recording at moment
+        :return: list of files info sorted by start time
+        """
+        moment = datetime_to_microseconds(moment)
+        indexes = self._candidates(moment, moment, is_stop_included=True)
+        return self.__select(indexes[self.__stops[indexes] > moment])
+
+    def common_window(self) -> Union[Tuple[datetime, datetime], None]:
+        """
+        Time interval recorded by all files
+        :return: (start, stop) or None if files have not common interval
+        """
+        if not self.__files_info:
+            return
+        time_start = max(x.time_start for x in self.__files_info)
+        time_stop = min(x.time_stop for x in self.__files_info)
+        if time_start >= time_stop:
+            return
+        return time_start, time_stop
+
+    def read_offsets(self, time_start: datetime, time_stop: datetime,
+                     resample_frequency=0) -> List[ReadOffsets]:
+        """
+        Reading offsets (as BinaryFile start_moment/end_moment) of interval
+        for files containing it
+        :param time_start: start of reading interval
+        :param time_stop: end of reading interval
+        :param resample_frequency: resample frequency (0 - without
+        resampling)
+        :return: list of offsets sorted by file start time
+        """
+        offsets = []
+        for file_info in self.containing(time_start, time_stop):
+            frequency = file_info.frequency
+            if resample_frequency < 0 or (resample_frequency and
+                                          frequency % resample_frequency):
+                raise InvalidResampleFrequency(
+                    f'{resample_frequency} Hz can not be used for '
+                    f'{file_info.path} ({frequency} Hz)')
+            if resample_frequency:
+                resample_parameter = frequency // resample_frequency
+            else:
+                resample_parameter = 1
+            start_moment = get_discrete_index(file_info.time_start,
+                                              time_start, frequency)
+            end_moment = get_end_discrete_index(
+                file_info.time_start, time_stop, frequency, start_moment,
+                resample_parameter)
+            offsets.append(ReadOffsets(file_info, start_moment, end_moment))
+        return offsets
@@ -0,0 +1,23 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+
+
+@pytest.fixture
+def recordings_folder(tmp_path) -> str:
+    create_baikal7_file(os.path.join(tmp_path, 'day1', 'st1.00'),
+                        datetime(2026, 3, 1, 12, 0), 600, 49.1, 55.7)
+    create_baikal7_file(os.path.join(tmp_path, 'day1', 'st2.00'),
+                        datetime(2026, 3, 1, 12, 5), 600, 49.2, 55.8)
+    create_baikal7_file(os.path.join(tmp_path, 'day2', 'st1.00'),
+                        datetime(2026, 3, 2, 12, 0), 600, 49.1, 55.7)
+    create_baikal7_file(os.path.join(tmp_path, 'day2', 'far.00'),
+                        datetime(2026, 3, 2, 12, 0), 600, 60.0, 40.0)
+    with open(os.path.join(tmp_path, 'day2', 'notes.txt'), 'w') as f:
+        f.write('not a recording')
+    with open(os.path.join(tmp_path, 'day2', 'broken.00'), 'wb') as f:
+        f.write(b'\x00' * 10)
+    return str(tmp_path)
@@ -0,0 +1,113 @@
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.binaryfile import read_headers
+from seiscore.catalog.catalog import Catalog
+from seiscore.catalog.catalog import FileStat
+from seiscore.catalog.catalog import create_records
+from seiscore.catalog.catalog import datetime_to_microseconds
+from seiscore.catalog.catalog import microseconds_to_datetime
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with Catalog(os.path.join(tmp_path, 'index.sqlite')) as catalog:
+        yield catalog
+
+
+@pytest.mark.parametrize('value', [datetime(1970, 1, 1),
+                                   datetime(2026, 3, 1, 12, 0, 0, 123456),
+                                   datetime(1960, 5, 5, 1, 2, 3, 1)])
+def test_microseconds_conversion(value):
+    microseconds = datetime_to_microseconds(value)
+    assert_that(microseconds_to_datetime(microseconds), equal_to(value))
+
+
+def test_scan(catalog, recordings_folder):
+    result = catalog.scan(recordings_folder, workers=2)
+    assert_that((result.added, result.updated, result.removed),
+                equal_to((4, 0, 0)))
+    assert_that([os.path.basename(x[0]) for x in result.failed],
+                equal_to(['broken.00']))
+    assert_that(len(catalog), equal_to(4))
+
+    for file_info in catalog.query():
+        assert_that(file_info, equal_to(BinaryFile.peek(file_info.path)))
+
+
+def test_scan_zero_filled_file(catalog, recordings_folder):
+    with open(os.path.join(recordings_folder, 'day1', 'zero.00'), 'wb') as f:
+        f.write(bytes(400))
+
+    result = catalog.scan(recordings_folder, workers=2)
+    assert_that(result.added, equal_to(4))
+    assert_that(sorted(os.path.basename(x[0]) for x in result.failed),
+                equal_to(['broken.00', 'zero.00']))
+
+
+def test_create_records_isolates_failures(recordings_folder):
+    paths = [os.path.join(recordings_folder, 'day1', x)
+             for x in ('st1.00', 'st2.00')]
+    file_stats = [FileStat(x, 0, os.path.getsize(x)) for x in paths]
+    headers = read_headers(paths)
+    # header which passes validation, but can not be used for record
+    headers['channel_count'][0] = 0
+
+    with patch('seiscore.catalog.catalog.read_headers',
+               return_value=headers):
+        records, failed = create_records(file_stats)
+    assert_that([x[0] for x in records], equal_to(paths[1:]))
+    assert_that([x[0] for x in failed], equal_to(paths[:1]))
+
+
+def test_rescan(catalog, recordings_folder):
+    catalog.scan(recordings_folder)
+
+    os.remove(os.path.join(recordings_folder, 'day2', 'far.00'))
+    create_baikal7_file(os.path.join(recordings_folder, 'day1', 'st1.00'),
+                        datetime(2026, 3, 1, 12, 0), 1200, 49.1, 55.7)
+    create_baikal7_file(os.path.join(recordings_folder, 'day3', 'st1.00'),
+                        datetime(2026, 3, 3, 12, 0), 600, 49.1, 55.7)
+
+    result = catalog.scan(recordings_folder)
+    assert_that((result.added, result.updated, result.removed),
+                equal_to((1, 1, 1)))
+    assert_that(len(catalog), equal_to(4))
+
+    file_info = catalog.query(datetime(2026, 3, 1, 12, 0),
+                              datetime(2026, 3, 1, 12, 1))[0]
+    assert_that(file_info.duration_in_seconds, equal_to(1200))
+
+
+@pytest.mark.parametrize('time_start, time_stop, bbox, expected_count', [
+    (datetime(2026, 3, 1, 12, 0), datetime(2026, 3, 1, 13, 0), None, 2),
+    (datetime(2026, 3, 1, 12, 20), datetime(2026, 3, 1, 12, 30), None, 0),
+    (datetime(2026, 3, 2), datetime(2026, 3, 3), None, 2),
+    (datetime(2026, 3, 2), datetime(2026, 3, 3), (49, 55, 50, 56), 1),
+    (None, None, (49, 55, 50, 56), 3),
+    (datetime(2026, 3, 2, 12, 5), None, None, 2),
+])
+def test_query(catalog, recordings_folder, time_start, time_stop, bbox,
+               expected_count):
+    catalog.scan(recordings_folder)
+    files_info = catalog.query(time_start, time_stop, bbox)
+    assert_that(len(files_info), equal_to(expected_count))
+    assert_that(files_info, equal_to(sorted(files_info,
+                                            key=lambda x: x.time_start)))
+
+
+def test_index_persistence(tmp_path, recordings_folder):
+    index_path = os.path.join(tmp_path, 'index.sqlite')
+    with Catalog(index_path) as catalog:
+        catalog.scan(recordings_folder)
+    with Catalog(index_path) as catalog:
+        assert_that(len(catalog), equal_to(4))
+        result = catalog.scan(recordings_folder)
+        assert_that((result.added, result.updated, result.removed),
+                    equal_to((0, 0, 0)))
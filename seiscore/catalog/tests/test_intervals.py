@@ -0,0 +1,135 @@
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from seiscore.binaryfile.binaryfile import FileInfo, BinaryFile
+from seiscore.binaryfile.binaryfile import InvalidResampleFrequency
+from seiscore.catalog.intervals import IntervalIndex
+
+
+BASE_DATETIME = datetime(2026, 3, 1)
+
+
+def random_moment() -> datetime:
+    return BASE_DATETIME + timedelta(seconds=random.randint(0, 100_000))
+
+
+@pytest.fixture
+def files_info():
+    result = []
+    for i in range(300):
+        time_start = random_moment()
+        time_stop = time_start + timedelta(seconds=random.randint(1, 10_000))
+        result.append(FileInfo(f'/data/file{i}.00', 'Baikal7', 1000,
+                               time_start, time_stop, 0, 0))
+    return result
+
+
+@pytest.fixture
+def hourly_files_info():
+    # consecutive hourly files and one month-long file
+    result = [FileInfo(f'/data/hour{i}.00', 'Baikal7', 1000,
+                       BASE_DATETIME + timedelta(hours=i),
+                       BASE_DATETIME + timedelta(hours=i + 1), 0, 0)
+              for i in range(24 * 30)]
+    result.append(FileInfo('/data/month.00', 'Baikal7', 1000, BASE_DATETIME,
+                           BASE_DATETIME + timedelta(days=30), 0, 0))
+    return result
+
+
+def test_long_file_does_not_widen_search(hourly_files_info):
+    index = IntervalIndex(hourly_files_info)
+    moment = BASE_DATETIME + timedelta(days=20, minutes=30)
+    assert_that([x.path for x in index.active_at(moment)],
+                equal_to(['/data/month.00', '/data/hour480.00']))
+    assert_that([x.path for x in index.overlapping(
+        moment, moment + timedelta(hours=1))],
+        equal_to(['/data/month.00', '/data/hour480.00', '/data/hour481.00']))
+
+    microseconds = int((moment - datetime(1970, 1, 1)).total_seconds() * 1e6)
+    candidates = index._candidates(microseconds, microseconds,
+                                   is_stop_included=True)
+    assert len(candidates) <= 3
+
+
+def test_overlapping(files_info):
+    index = IntervalIndex(files_info)
+    for _ in range(200):
+        time_start = random_moment()
+        time_stop = time_start + timedelta(seconds=random.randint(1, 5000))
+        expected = [x for x in index.files_info
+                    if x.time_start < time_stop and x.time_stop > time_start]
+        assert_that(index.overlapping(time_start, time_stop),
+                    equal_to(expected))
+
+
+def test_containing(files_info):
+    index = IntervalIndex(files_info)
+    for _ in range(200):
+        time_start = random_moment()
+        time_stop = time_start + timedelta(seconds=random.randint(1, 5000))
+        expected = [x for x in index.files_info
+                    if x.time_start <= time_start and
+                    x.time_stop >= time_stop]
+        assert_that(index.containing(time_start, time_stop),
+                    equal_to(expected))
+
+
+def test_active_at(files_info):
+    index = IntervalIndex(files_info)
+    moments = [random_moment() for _ in range(200)]
+    moments += [x.time_start for x in files_info[:10]]
+    moments += [x.time_stop for x in files_info[:10]]
+    for moment in moments:
+        expected = [x for x in index.files_info
+                    if x.time_start <= moment < x.time_stop]
+        assert_that(index.active_at(moment), equal_to(expected))
+
+
+@pytest.mark.parametrize('intervals, expected', [
+    ([], None),
+    ([(0, 10), (5, 20), (3, 8)], (5, 8)),
+    ([(0, 10), (10, 20)], None)
+])
+def test_common_window(intervals, expected):
+    files_info = [FileInfo('/data/file.00', 'Baikal7', 1000,
+                           BASE_DATETIME + timedelta(seconds=x),
+                           BASE_DATETIME + timedelta(seconds=y), 0, 0)
+                  for x, y in intervals]
+    if expected is not None:
+        expected = tuple(BASE_DATETIME + timedelta(seconds=x)
+                         for x in expected)
+    assert_that(IntervalIndex(files_info).common_window(), equal_to(expected))
+
+
+@pytest.mark.parametrize('resample_frequency', [0, 20, 50])
+def test_read_offsets(recordings_folder, resample_frequency):
+    paths = [os.path.join(recordings_folder, 'day1', x)
+             for x in ('st1.00', 'st2.00')]
+    index = IntervalIndex([BinaryFile.peek(x) for x in paths])
+    time_start, time_stop = index.common_window()
+    time_start += timedelta(seconds=1.234)
+    time_stop -= timedelta(seconds=2.1)
+
+    offsets = index.read_offsets(time_start, time_stop, resample_frequency)
+    assert_that(len(offsets), equal_to(2))
+    for path, read_offsets in zip(paths, offsets):
+        bin_data = BinaryFile(path, resample_frequency)
+        bin_data.read_date_time_start = time_start
+        bin_data.read_date_time_stop = time_stop
+        assert_that(read_offsets.file_info.path, equal_to(path))
+        assert_that((read_offsets.start_moment, read_offsets.end_moment),
+                    equal_to((bin_data.start_moment, bin_data.end_moment)))
+
+
+@pytest.mark.parametrize('resample_frequency', [-1, 3, 2000])
+def test_read_offsets_invalid_frequency(recordings_folder,
+                                        resample_frequency):
+    path = os.path.join(recordings_folder, 'day1', 'st1.00')
+    index = IntervalIndex([BinaryFile.peek(path)])
+    time_start, time_stop = index.common_window()
+    with pytest.raises(InvalidResampleFrequency):
+        index.read_offsets(time_start, time_stop, resample_frequency)
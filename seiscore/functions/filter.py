@@ -1,46 +1,280 @@
+import math
+from functools import lru_cache
+from typing import List, NamedTuple, Union
+
 import numpy as np
 
 from scipy.fftpack import rfft, irfft, rfftfreq
+from scipy.ndimage import convolve1d
+from scipy.signal import butter, firwin, sosfiltfilt
+
+
+FFT_METHOD, IIR_METHOD, FIR_METHOD = 'fft', 'iir', 'fir'
+BAND_PASS_METHODS = (FFT_METHOD, IIR_METHOD, FIR_METHOD)
+# iir - butterworth filter order, fir - taps count
+DEFAULT_FILTER_ORDERS = {IIR_METHOD: 4, FIR_METHOD: 1025}
+
+
+@lru_cache(maxsize=256)
+def get_filter_design(frequency: int, f_min: float, f_max: float,
+                      filter_type: str,
+                      order: int) -> Union[np.ndarray, None]:
+    """
+    Band-pass filter design (low-pass or high-pass if one of limits is out
+    of frequency range)
+    :param frequency: signal frequency
+    :param f_min: minimal filtering frequency
+    :param f_max: maximal filtering frequency
+    :param filter_type: iir (second-order sections) or fir (taps)
+    :param order: iir filter order or fir taps count
+    :return: sos array, taps array or None (if filtration is not required)
+    """
+    nyquist_frequency = frequency / 2
+    if f_min <= 0 and f_max >= nyquist_frequency:
+        return None
+    if f_min <= 0:
+        cutoff, pass_type = f_max, 'lowpass'
+    elif f_max >= nyquist_frequency:
+        cutoff, pass_type = f_min, 'highpass'
+    else:
+        cutoff, pass_type = [f_min, f_max], 'bandpass'
+
+    if filter_type == IIR_METHOD:
+        return butter(order, cutoff, btype=pass_type, fs=frequency,
+                      output='sos')
+    if filter_type == FIR_METHOD:
+        # odd taps count for filter delay to be whole discretes count
+        taps_count = order + 1 - order % 2
+        return firwin(taps_count, cutoff, pass_zero=pass_type == 'lowpass',
+                      fs=frequency)
+    raise ValueError(f'Unknown filter type - {filter_type}')
+
+
+def get_fft_size(taps_count: int) -> int:
+    # power of two not less than 8 taps counts
+    return 1 << int(math.ceil(math.log2(8 * taps_count)))
+
+
+class FirFilterStream:
+    """
+    FIR filtration of unbounded signal processed by chunks (overlap-save
+    method). Only last taps count - 1 discretes are kept between chunks and
+    chunks are convolved by blocks of fft size, so memory does not depend
+    on signal length. Output is delayed by half of taps count: filtered
+    discretes are returned as soon as all their input discretes are received,
+    rest of them is returned by flush. Joined output is equal to
+    overlap_save_filter result for joined chunks
+    """
+    def __init__(self, taps: np.ndarray, fft_size=None):
+        taps_count = taps.shape[0]
+        if fft_size is None:
+            fft_size = get_fft_size(taps_count)
+        if fft_size < taps_count:
+            raise ValueError('FFT size is less than taps count')
+        self.__taps_count = taps_count
+        self.__fft_size = fft_size
+        self.__taps_spectrum = np.fft.rfft(taps, fft_size)
+        self.reset()
+
+    @property
+    def delay(self) -> int:
+        return (self.__taps_count - 1) // 2
+
+    @property
+    def processed_discretes(self) -> int:
+        # returned filtered discretes count
+        return self.__processed_discretes
+
+    def reset(self):
+        # signal before stream start is zero
+        self.__history = np.zeros(self.__taps_count - 1)
+        self.__input_discretes = 0
+        self.__processed_discretes = 0
+        # full convolution discretes to skip for delay compensation
+        self.__skip_count = self.delay
+
+    def __convolve(self, chunk: np.ndarray) -> np.ndarray:
+        # full convolution discretes of chunk
+        history_size = self.__taps_count - 1
+        step = self.__fft_size - history_size
+        result = np.empty(chunk.shape[0])
+        segment = np.empty(self.__fft_size)
+        segment[:history_size] = self.__history
+        for left_edge in range(0, chunk.shape[0], step):
+            piece = chunk[left_edge:left_edge + step]
+            piece_size = piece.shape[0]
+            segment[history_size:history_size + piece_size] = piece
+            segment[history_size + piece_size:] = 0
+            block = np.fft.irfft(np.fft.rfft(segment) * self.__taps_spectrum,
+                                 self.__fft_size)
+            result[left_edge:left_edge + piece_size] = \
+                block[history_size:history_size + piece_size]
+            # last discretes of segment are history of next piece
+            segment[:history_size] = \
+                segment[piece_size:piece_size + history_size]
+        self.__history = segment[:history_size].copy()
+        return result
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """
+        Processing of next signal chunk
+        :param chunk: 1-D array of signal
+        :return: 1-D array of filtered discretes (chunk size minus not
+        returned delay discretes)
+        """
+        result = self.__convolve(chunk)
+        self.__input_discretes += chunk.shape[0]
+        skip_count = min(self.__skip_count, result.shape[0])
+        self.__skip_count -= skip_count
+        result = result[skip_count:]
+        self.__processed_discretes += result.shape[0]
+        return result
+
+    def flush(self) -> np.ndarray:
+        """
+        Last filtered discretes (signal after stream end is zero). Stream is
+        reset after flush
+        :return: 1-D array of filtered discretes
+        """
+        remaining_count = self.__input_discretes - self.__processed_discretes
+        result = self.process(np.zeros(self.delay))[:remaining_count]
+        self.reset()
+        return result
+
+
+def overlap_save_filter(signal: np.ndarray, taps: np.ndarray,
+                        fft_size=None) -> np.ndarray:
+    """
+    FIR filtration by overlap-save method with delay compensation. Signal
+    is processed by blocks, only one block spectrum is kept in memory
+    :param signal: input 1-D array of signal
+    :param taps: 1-D array of fir filter taps (odd count)
+    :param fft_size: block fft size (by default - power of two not less
+    than 8 taps counts)
+    :return: output 1-D array of signal
+    """
+    stream = FirFilterStream(taps, fft_size)
+    return np.concatenate([stream.process(signal), stream.flush()])
 
 
 def band_pass_filter(signal: np.ndarray, frequency: int, f_min: float,
-                     f_max: float) -> np.ndarray:
+                     f_max: float, method=FFT_METHOD,
+                     order: Union[int, None] = None) -> np.ndarray:
     """
     Bandpass filtering
     :param signal: input 1-D array of signal
     :param frequency: signal frequency
     :param f_min: minimal filtering frequency
     :param f_max: maximal filtering frequency
+    :param method: fft (zeroing of spectrum), iir (zero-phase butterworth
+    filter, forward-backward pass requires whole signal) or fir (windowed
+    filter, overlap-save convolution, see FirFilterStream for chunks)
+    :param order: iir filter order or fir taps count (by default - from
+    DEFAULT_FILTER_ORDERS)
     :return: output 1-D array of signal
     """
-    frequency_array = rfftfreq(n=signal.shape[0], d=1.0 / frequency)
-    f_signal = rfft(signal)
-    f_signal[(frequency_array < f_min) + (frequency_array > f_max)] = 0
-    filtered_signal = irfft(f_signal)
-    return filtered_signal
+    if method == FFT_METHOD:
+        frequency_array = rfftfreq(n=signal.shape[0], d=1.0 / frequency)
+        f_signal = rfft(signal)
+        f_signal[(frequency_array < f_min) + (frequency_array > f_max)] = 0
+        filtered_signal = irfft(f_signal)
+        return filtered_signal
+    if method not in BAND_PASS_METHODS:
+        raise ValueError(f'Unknown filtration method - {method}')
+
+    if order is None:
+        order = DEFAULT_FILTER_ORDERS[method]
+    design = get_filter_design(frequency, f_min, f_max, method, order)
+    if design is None:
+        return signal.astype(np.float64)
+    if method == IIR_METHOD:
+        return sosfiltfilt(design, signal)
+    return overlap_save_filter(signal, design)
+
+
+# kernel of one marmett filter pass
+MARMETT_KERNEL = (0.25, 0.5, 0.25)
 
 
-def marmett(signal: np.ndarray, order: int) -> np.ndarray:
+@lru_cache(maxsize=None)
+def get_marmett_kernel(order: int) -> np.ndarray:
     """
-    Marmett filter
-    :param signal: input 1-D array of signal
+    Kernel of order marmett filter passes (binomial coefficients)
     :param order: filter order
-    :return: output 1-D array of signal
+    :return: 1D array of kernel (size 2 * order + 1)
+    """
+    kernel = np.ones(1)
+    for _ in range(order):
+        kernel = np.convolve(kernel, MARMETT_KERNEL)
+    return kernel
+
+
+def marmett(signal: np.ndarray, order: int, axis=-1) -> np.ndarray:
+    """
+    Marmett filter. Edge values are averaged with neighbour
+    ((s[0] + s[1]) / 2), it is equal to convolution with mirrored signal
+    :param signal: input array of signal
+    :param order: filter order
+    :param axis: filtration axis
+    :return: output array of signal
     """
     if order % 2 == 0:
         raise Exception('Invalid order parameter')
 
-    for i in range(order):
-        j = 1
-        recalculation_array = signal.copy()
-        while j < signal.shape[0] - 1:
-            recalculation_array[j] = \
-                (signal[j - 1] + signal[j + 1]) / 4 + signal[j] / 2
-            j += 1
-        recalculation_array[0] = (signal[0] + signal[1]) / 2
-        recalculation_array[-1] = (signal[-1] + signal[-2]) / 2
-        signal = recalculation_array.copy()
-    return signal
+    if np.issubdtype(signal.dtype, np.integer):
+        # integer signal is truncated after every pass
+        for _ in range(order):
+            signal = convolve1d(signal.astype(np.float64), MARMETT_KERNEL,
+                                axis=axis, mode='mirror').astype(signal.dtype)
+        return signal
+    return convolve1d(signal, get_marmett_kernel(order), axis=axis,
+                      mode='mirror')
+
+
+def get_window_sums(signal: np.ndarray, window: int,
+                    left_lim: int) -> np.ndarray:
+    """
+    Sums of signal windows [i - window, i) for i from left_lim to signal end
+    :param signal: 1D array of signal
+    :param window: window size (discretes)
+    :param left_lim: first window end index
+    :return: 1D array of sums
+    """
+    cumulative_sums = np.zeros(signal.shape[0] + 1)
+    np.cumsum(signal, out=cumulative_sums[1:])
+    window_ends = np.arange(left_lim, signal.shape[0])
+    return cumulative_sums[window_ends] - cumulative_sums[window_ends - window]
+
+
+def get_sl_coefficients(signal: np.ndarray, long_window: int,
+                        short_window: int, left_lim: int) -> np.ndarray:
+    """
+    Sta/lta coefficients of non-negative signal (zero before left_lim)
+    :param signal: 1D array of absolute signal values
+    :param long_window: long window (discretes)
+    :param short_window: short window (discretes)
+    :param left_lim: index of first coefficient
+    :return: 1D coefficient array
+    """
+    result = np.zeros_like(signal)
+    if left_lim >= signal.shape[0]:
+        return result
+
+    lta = get_window_sums(signal, long_window, left_lim) / long_window
+    sta = get_window_sums(signal, short_window, left_lim) / short_window
+    # windows of zero values are found by exact integer sums (cumulative
+    # sums of float values leave rounding residuals)
+    non_zero_signal = (signal != 0).astype(np.int64)
+    sta[get_window_sums(non_zero_signal, short_window, left_lim) == 0] = 0
+    is_zero_lta = get_window_sums(non_zero_signal, long_window, left_lim) == 0
+    # sums of tiny values after large ones can be lost by rounding (as in
+    # running sums), such windows are processed as zero ones
+    np.maximum(sta, 0, out=sta)
+    is_zero_lta |= lta <= 0
+
+    coefficients = result[left_lim:]
+    np.divide(sta, lta, out=coefficients, where=~is_zero_lta)
+    return result
 
 
 def sl_function(signal: np.ndarray, frequency: int, long_window=1.0,
@@ -59,25 +293,8 @@ def sl_function(signal: np.ndarray, frequency: int, long_window=1.0,
 
     signal = np.abs(signal - np.mean(signal))
 
-    result = np.zeros_like(signal)
-    lta_sum, sta_sum = 0, 0
-    left_lim = order * long_window
-    for i in range(left_lim, signal.shape[0]):
-        if i == left_lim:
-            lta_sum = np.sum(signal[i - long_window:i])
-            sta_sum = np.sum(signal[i - short_window:i])
-        else:
-            lta_sum = lta_sum - signal[i - long_window - 1] + signal[i - 1]
-            sta_sum = sta_sum - signal[i - short_window - 1] + signal[i - 1]
-        lta = lta_sum / long_window
-        sta = sta_sum / short_window
-
-        if lta == 0:
-            val = 0
-        else:
-            val = sta / lta
-        result[i] = val
-    return result
+    return get_sl_coefficients(signal, long_window, short_window,
+                               order * long_window)
 
 
 def sl_filter(signal, frequency, short_window=0.1, long_window=1.0,
@@ -99,3 +316,97 @@ def sl_filter(signal, frequency, short_window=0.1, long_window=1.0,
         signal = signal * coeffs
         signal = signal - np.mean(signal)
     return signal
+
+
+class TriggerEvent(NamedTuple):
+    # discrete index from stream start
+    index: int
+    # True - trigger on, False - trigger off
+    is_on: bool
+
+
+class StaLtaChunk(NamedTuple):
+    coefficients: np.ndarray
+    events: List[TriggerEvent]
+
+
+class StaLtaStream:
+    """
+    Sta/lta coefficients of unbounded signal processed by chunks. Last long
+    window of signal is kept between chunks, so coefficients are equal (up
+    to float rounding) to sl_function result for joined chunks if mean is
+    the whole signal average. Trigger is switched on by coefficient not less
+    than trigger_on and switched off by coefficient less than trigger_off
+    """
+    def __init__(self, frequency: int, long_window=1.0, short_window=0.1,
+                 order=1, mean=0.0, trigger_on: Union[float, None] = None,
+                 trigger_off: Union[float, None] = None):
+        self.__long_window = int(frequency * long_window)
+        self.__short_window = int(frequency * short_window)
+        self.__left_lim = order * self.__long_window
+        self.__mean = mean
+
+        if trigger_off is None:
+            trigger_off = trigger_on
+        if trigger_on is not None and trigger_off > trigger_on:
+            raise ValueError('Trigger off threshold is greater than trigger '
+                             'on threshold')
+        self.__trigger_on = trigger_on
+        self.__trigger_off = trigger_off
+        self.reset()
+
+    @property
+    def processed_discretes(self) -> int:
+        return self.__processed_discretes
+
+    @property
+    def is_triggered(self) -> bool:
+        return self.__is_triggered
+
+    def reset(self):
+        self.__tail = np.zeros(0)
+        self.__processed_discretes = 0
+        self.__is_triggered = False
+
+    def __find_events(self, coefficients: np.ndarray) -> List[TriggerEvent]:
+        events = []
+        if self.__trigger_on is None:
+            return events
+
+        is_on = coefficients >= self.__trigger_on
+        is_off = coefficients < self.__trigger_off
+        index = 0
+        while index < coefficients.shape[0]:
+            # searching of next switching of trigger state
+            switches = is_off[index:] if self.__is_triggered \
+                else is_on[index:]
+            switch_indexes = np.flatnonzero(switches)
+            if switch_indexes.shape[0] == 0:
+                break
+            index += int(switch_indexes[0])
+            self.__is_triggered = not self.__is_triggered
+            events.append(TriggerEvent(self.__processed_discretes + index,
+                                       self.__is_triggered))
+        return events
+
+    def process(self, chunk: np.ndarray) -> StaLtaChunk:
+        """
+        Processing of next signal chunk
+        :param chunk: 1D array of signal
+        :return: coefficients of chunk discretes and trigger events
+        """
+        signal = np.concatenate([self.__tail,
+                                 np.abs(chunk - self.__mean)])
+        tail_size = self.__tail.shape[0]
+        # stream index of first discrete of joined signal
+        first_index = self.__processed_discretes - tail_size
+        left_lim = max(tail_size, self.__left_lim - first_index)
+
+        coefficients = get_sl_coefficients(
+            signal, self.__long_window, self.__short_window,
+            left_lim)[tail_size:]
+        events = self.__find_events(coefficients)
+
+        self.__tail = signal[-self.__long_window:].copy()
+        self.__processed_discretes += coefficients.shape[0]
+        return StaLtaChunk(coefficients, events)
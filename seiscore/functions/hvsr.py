@@ -0,0 +1,138 @@
+from typing import NamedTuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.functions.filter import marmett
+from seiscore.functions.spectrum import DEFAULT_BLOCK_SIZE
+from seiscore.functions.spectrum import AverageSpectrumAccumulator
+from seiscore.functions.spectrum import CONSTANT_DETREND, AMPLITUDE_SCALING
+from seiscore.functions.spectrum import get_frequencies
+from seiscore.functions.spectrum import windows_power
+from seiscore.functions.spectrum import hv_ratio
+
+
+HVSR_COMPONENTS = 'XYZ'
+# chunk duration of hvsr_by_chunks (seconds)
+DEFAULT_CHUNK_SECONDS = 600.0
+
+
+class HvsrResult(NamedTuple):
+    # 1D array of frequencies
+    frequencies: np.ndarray
+    # 2D array (components XYZ x frequencies) of average spectra
+    average_spectra: np.ndarray
+    # 1D array of ratio of average spectra
+    average_ratio: np.ndarray
+    # 2D array (windows x frequencies) of ratios of window spectra (None if
+    # ratios of windows are not calculated)
+    windows_ratios: Union[np.ndarray, None]
+
+
+def hvsr(binary_file: BinaryFile, window: int, offset: int,
+         median_filter=-1, marmett_filter=-1, spectrum_type='HV',
+         block_size=DEFAULT_BLOCK_SIZE, taper=None, detrend=CONSTANT_DETREND,
+         scaling=AMPLITUDE_SCALING, workers=None) -> HvsrResult:
+    """
+    Nakamura (H/V) spectrum of recording. All components are read at once,
+    spectra of windows of all components are calculated by blocks. Average
+    ratio is equal to nakamura_spectrum of average_spectrum results of
+    components
+    :param binary_file: recording file (with reading interval and
+    resampling parameters)
+    :param window: window size (discreets)
+    :param offset: window offset (discreets)
+    :param median_filter: median filtration parameter
+    :param marmett_filter: marmett filtration parameter (for average and
+    window spectra)
+    :param spectrum_type: HV - horizontal/vertical ratio, VH -
+    vertical/horizontal ratio
+    :param block_size: discretes count of windows processed at once
+    :param taper: window taper (see average_spectrum)
+    :param detrend: detrend type of windows (constant or linear)
+    :param scaling: amplitude (squared amplitudes of spectrum) or density
+    :param workers: fft threads count
+    :return: HvsrResult
+    """
+    if median_filter % 2 == 0 or marmett_filter % 2 == 0:
+        raise Exception('Marmett and median filters must be odd')
+
+    frequency = binary_file.resample_frequency
+    signals = binary_file.read_signals(HVSR_COMPONENTS)
+    windows_count = (signals.shape[0] - window) // offset + 1
+    if windows_count < 1:
+        raise ValueError('Signal is shorter than window')
+    # windows x components x discretes
+    windows = sliding_window_view(signals, window, axis=0)[::offset]
+    windows = windows[:windows_count]
+
+    frequencies = get_frequencies(window, frequency).copy()
+    components_count = len(HVSR_COMPONENTS)
+    power_sum = np.zeros((components_count, frequencies.shape[0]))
+    windows_ratios = np.empty((windows_count, frequencies.shape[0]))
+    block_windows_count = max(1, block_size // (window * components_count))
+    for left_edge in range(0, windows_count, block_windows_count):
+        block = windows[left_edge:left_edge + block_windows_count]
+        block_windows = block.shape[0]
+        power = windows_power(block.reshape(-1, window), median_filter,
+                              frequency, taper, detrend, scaling, workers)
+        power = power.reshape(block_windows, components_count, -1)
+        power_sum += np.sum(power, axis=0)
+
+        if marmett_filter > 0:
+            power = marmett(power, marmett_filter, axis=-1)
+        windows_ratios[left_edge:left_edge + block_windows] = hv_ratio(
+            power[:, 0], power[:, 1], power[:, 2], spectrum_type)
+
+    # getting average spectrum for all windows
+    average_spectra = power_sum / windows_count
+    if marmett_filter > 0:
+        average_spectra = marmett(average_spectra, marmett_filter, axis=-1)
+    average_ratio = hv_ratio(*average_spectra, spectrum_type)
+    return HvsrResult(frequencies, average_spectra, average_ratio,
+                      windows_ratios)
+
+
+def hvsr_by_chunks(binary_file: BinaryFile, window: int, offset: int,
+                   median_filter=-1, marmett_filter=-1, spectrum_type='HV',
+                   chunk_seconds=DEFAULT_CHUNK_SECONDS,
+                   block_size=DEFAULT_BLOCK_SIZE, taper=None,
+                   detrend=CONSTANT_DETREND, scaling=AMPLITUDE_SCALING,
+                   workers=None) -> HvsrResult:
+    """
+    Average Nakamura (H/V) spectrum of recording read by chunks: components
+    are processed one by one with AverageSpectrumAccumulator, so memory
+    usage does not depend on recording duration. Ratios of windows are not
+    calculated, other results are equal to hvsr
+    :param binary_file: recording file (with reading interval and
+    resampling parameters)
+    :param window: window size (discreets)
+    :param offset: window offset (discreets)
+    :param median_filter: median filtration parameter
+    :param marmett_filter: marmett filtration parameter
+    :param spectrum_type: HV - horizontal/vertical ratio, VH -
+    vertical/horizontal ratio
+    :param chunk_seconds: duration of signal chunk (seconds)
+    :param block_size: discretes count of windows processed at once
+    :param taper: window taper (see average_spectrum)
+    :param detrend: detrend type of windows (constant or linear)
+    :param scaling: amplitude (squared amplitudes of spectrum) or density
+    :param workers: fft threads count
+    :return: HvsrResult without ratios of windows
+    """
+    frequencies = get_frequencies(window, binary_file.resample_frequency)
+    average_spectra = np.empty((len(HVSR_COMPONENTS), frequencies.shape[0]))
+    for i, component in enumerate(HVSR_COMPONENTS):
+        accumulator = AverageSpectrumAccumulator(
+            binary_file.resample_frequency, window, offset, median_filter,
+            marmett_filter, block_size, taper, detrend, scaling, workers)
+        for chunk in binary_file.iter_chunks(component, chunk_seconds):
+            accumulator.update(chunk.signal)
+        if accumulator.windows_count == 0:
+            raise ValueError('Signal is shorter than window')
+        average_spectra[i] = accumulator.result()[:, 1]
+
+    average_ratio = hv_ratio(*average_spectra, spectrum_type)
+    return HvsrResult(frequencies.copy(), average_spectra, average_ratio,
+                      None)
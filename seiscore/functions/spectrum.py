@@ -1,11 +1,23 @@
+from functools import lru_cache
 from math import inf
+from typing import Union
 
 import numpy as np
 from numpy.fft import rfft, rfftfreq
-from scipy.signal import medfilt
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft as sp_fft
+from scipy.signal import detrend as detrend_signal
+from scipy.signal import get_window
 from seiscore.functions.filter import marmett
 
 
+# discretes count of windows processed at once by average_spectrum
+DEFAULT_BLOCK_SIZE = 2 ** 20
+CONSTANT_DETREND, LINEAR_DETREND = 'constant', 'linear'
+AMPLITUDE_SCALING, DENSITY_SCALING = 'amplitude', 'density'
+DEFAULT_KAISER_BETA = 14
+
+
 def spectrum(signal: np.ndarray, frequency: int) -> np.ndarray:
     """
     Method for calculating simple Fourier spectrum of signal
@@ -15,15 +27,297 @@ def spectrum(signal: np.ndarray, frequency: int) -> np.ndarray:
     """
     signal_count = signal.shape[0]
     spectrum_data = rfft(signal-np.mean(signal))
-    res = np.empty((signal_count // 2 + 1, 2), dtype=np.float)
+    res = np.empty((signal_count // 2 + 1, 2), dtype=float)
     res[:, 0] = rfftfreq(signal_count, 1 / frequency)
     res[:, 1] = 2 * abs(spectrum_data) / signal_count
     return res
 
 
+def median_filter_rows(data: np.ndarray, kernel_size: int) -> np.ndarray:
+    """
+    Median filtration of every row of 2D array (the same as medfilt of row:
+    edges are padded by zeros)
+    :param data: 2D array
+    :param kernel_size: odd filter size
+    :return: 2D array of filtered rows
+    """
+    half_size = kernel_size // 2
+    padded_data = np.pad(data, ((0, 0), (half_size, half_size)))
+    neighbours = np.partition(
+        sliding_window_view(padded_data, kernel_size, axis=1), half_size,
+        axis=-1)
+    return neighbours[..., half_size]
+
+
+@lru_cache(maxsize=64)
+def get_frequencies(window: int, frequency: float) -> np.ndarray:
+    """
+    Cached frequencies axis of window spectrum
+    :param window: window size (discreets)
+    :param frequency: signal frequency
+    :return: read-only 1D array of frequencies
+    """
+    frequencies = rfftfreq(window, 1 / frequency)
+    frequencies.flags.writeable = False
+    return frequencies
+
+
+@lru_cache(maxsize=64)
+def get_taper(taper: Union[str, tuple, None], window: int) -> np.ndarray:
+    """
+    Cached taper window (periodic, as in welch method)
+    :param taper: taper name (hann, kaiser...) or tuple (name, parameter)
+    for scipy.signal.get_window, None - rectangular window
+    :param window: window size (discreets)
+    :return: read-only 1D array of taper
+    """
+    if taper is None:
+        taper_array = np.ones(window)
+    else:
+        if taper == 'kaiser':
+            taper = ('kaiser', DEFAULT_KAISER_BETA)
+        taper_array = get_window(taper, window)
+    taper_array.flags.writeable = False
+    return taper_array
+
+
+@lru_cache(maxsize=64)
+def get_power_scale(window: int, frequency: float,
+                    taper: Union[str, tuple, None],
+                    scaling: str) -> np.ndarray:
+    """
+    Cached multipliers of squared spectrum modules
+    :param window: window size (discreets)
+    :param frequency: signal frequency
+    :param taper: taper (see get_taper)
+    :param scaling: amplitude (squared one-sided amplitudes) or density
+    (one-sided power spectral density)
+    :return: read-only 1D array of multipliers
+    """
+    taper_array = get_taper(taper, window)
+    if scaling == AMPLITUDE_SCALING:
+        scale = np.full(window // 2 + 1, (2 / np.sum(taper_array)) ** 2)
+    elif scaling == DENSITY_SCALING:
+        scale = np.full(window // 2 + 1,
+                        2 / (frequency * np.sum(taper_array ** 2)))
+        # zero and nyquist frequencies are not doubled
+        scale[0] /= 2
+        if window % 2 == 0:
+            scale[-1] /= 2
+    else:
+        raise ValueError(f'Unknown scaling - {scaling}')
+    scale.flags.writeable = False
+    return scale
+
+
+def detrend_windows(windows: np.ndarray, detrend: str) -> np.ndarray:
+    """
+    Detrending of signal windows
+    :param windows: 2D array (windows x discretes)
+    :param detrend: constant (average subtraction) or linear
+    :return: 2D float array of windows
+    """
+    if detrend == CONSTANT_DETREND:
+        return windows - np.mean(windows, axis=1, keepdims=True)
+    if detrend == LINEAR_DETREND:
+        return detrend_signal(windows.astype(float), axis=1, type='linear',
+                              overwrite_data=True)
+    raise ValueError(f'Unknown detrend type - {detrend}')
+
+
+def windows_power(windows: np.ndarray, median_filter=-1, frequency=1,
+                  taper=None, detrend=CONSTANT_DETREND,
+                  scaling=AMPLITUDE_SCALING, workers=None) -> np.ndarray:
+    """
+    Power spectra of signal windows
+    :param windows: 2D array (windows x discretes)
+    :param median_filter: median filtration parameter
+    :param frequency: signal frequency (for density scaling)
+    :param taper: taper (see get_taper)
+    :param detrend: detrend type (constant or linear)
+    :param scaling: amplitude (squared amplitudes of spectrum) or density
+    :param workers: fft threads count
+    :return: 2D array (windows x frequencies)
+    """
+    window = windows.shape[1]
+    detrended_windows = detrend_windows(windows, detrend)
+    if taper is not None:
+        detrended_windows *= get_taper(taper, window)
+    spectrum_data = sp_fft.rfft(detrended_windows, axis=1, workers=workers,
+                                overwrite_x=True)
+    power = np.abs(spectrum_data, out=np.empty(spectrum_data.shape))
+    np.square(power, out=power)
+    power *= get_power_scale(window, frequency, taper, scaling)
+    if median_filter > 0:
+        power = median_filter_rows(power, median_filter)
+    return power
+
+
+class AverageSpectrumAccumulator:
+    """
+    Average spectrum of signal processed by chunks. Unprocessed part of
+    signal (incomplete window) is kept between chunks, so result is equal
+    to average_spectrum of joined chunks. Windows start at multiples of
+    offset counted from stream start, so accumulators of consecutive parts
+    of signal (with start_index of part) can be merged: windows crossing
+    parts border are calculated from tail of first part and head (first
+    window - 1 discretes) of second one. Other parameters are the same as
+    for average_spectrum
+    """
+    def __init__(self, frequency: int, window: int, offset: int,
+                 median_filter=-1, marmett_filter=-1,
+                 block_size=DEFAULT_BLOCK_SIZE, taper=None,
+                 detrend=CONSTANT_DETREND, scaling=AMPLITUDE_SCALING,
+                 workers=None, start_index=0):
+        if median_filter % 2 == 0 or marmett_filter % 2 == 0:
+            raise Exception('Marmett and median filters must be odd')
+        self.__frequency = frequency
+        self.__window = window
+        self.__offset = offset
+        self.__median_filter = median_filter
+        self.__marmett_filter = marmett_filter
+        self.__block_size = block_size
+        self.__taper = taper
+        self.__detrend = detrend
+        self.__scaling = scaling
+        self.__workers = workers
+        self.__start_index = start_index
+
+        self.__power_sum = np.zeros(window // 2 + 1)
+        self.__windows_count = 0
+        self.__discretes_count = 0
+        # first discretes of signal (for windows crossing previous part)
+        self.__head = np.zeros(0)
+        # signal discretes after last processed window start
+        self.__tail = np.zeros(0)
+        # discretes count to skip before next window (if offset > window
+        # or part is started between windows)
+        self.__skip_count = -start_index % offset
+
+    @property
+    def windows_count(self) -> int:
+        return self.__windows_count
+
+    @property
+    def start_index(self) -> int:
+        return self.__start_index
+
+    @property
+    def stop_index(self) -> int:
+        # index of discrete after last processed one
+        return self.__start_index + self.__discretes_count
+
+    @property
+    def parameters(self) -> tuple:
+        return (self.__frequency, self.__window, self.__offset,
+                self.__median_filter, self.__marmett_filter, self.__taper,
+                self.__detrend, self.__scaling)
+
+    def __add_windows(self, signal: np.ndarray, windows_count: int):
+        window, offset = self.__window, self.__offset
+        windows = sliding_window_view(signal, window)[::offset]
+        block_windows_count = max(1, self.__block_size // window)
+        for left_edge in range(0, windows_count, block_windows_count):
+            block = windows[left_edge:min(left_edge + block_windows_count,
+                                          windows_count)]
+            self.__power_sum += np.sum(
+                windows_power(block, self.__median_filter,
+                              self.__frequency, self.__taper,
+                              self.__detrend, self.__scaling,
+                              self.__workers), axis=0)
+        self.__windows_count += windows_count
+
+    def update(self, chunk: np.ndarray):
+        """
+        Adding next signal chunk
+        :param chunk: 1D array of signal
+        """
+        head_size = self.__head.shape[0]
+        if head_size < self.__window - 1:
+            self.__head = np.concatenate(
+                [self.__head, chunk[:self.__window - 1 - head_size]])
+        self.__discretes_count += chunk.shape[0]
+
+        if self.__skip_count >= chunk.shape[0]:
+            self.__skip_count -= chunk.shape[0]
+            return
+        chunk = chunk[self.__skip_count:]
+        self.__skip_count = 0
+        if self.__tail.shape[0]:
+            signal = np.concatenate([self.__tail, chunk])
+        else:
+            signal = chunk
+
+        window, offset = self.__window, self.__offset
+        windows_count = max(0, (signal.shape[0] - window) // offset + 1)
+        if windows_count:
+            self.__add_windows(signal, windows_count)
+
+        next_window_start = windows_count * offset
+        self.__skip_count = max(0, next_window_start - signal.shape[0])
+        self.__tail = signal[next_window_start:].copy()
+
+    def merge(self, other: 'AverageSpectrumAccumulator'):
+        """
+        Adding windows of accumulator of next part of signal. Result is
+        equal to accumulator updated by both parts
+        :param other: accumulator with the same parameters and start_index
+        equal to stop_index of this accumulator
+        """
+        if other.parameters != self.parameters:
+            raise ValueError('Accumulators have different parameters')
+        if other.start_index != self.stop_index:
+            raise ValueError('Accumulator is not started at end of this one')
+
+        window = self.__window
+        if other.__discretes_count < window:
+            # all discretes of short part are in head
+            self.update(other.__head)
+            return
+
+        # windows crossing parts border (started in tail of this part)
+        tail_size = self.__tail.shape[0]
+        if tail_size:
+            signal = np.concatenate([self.__tail, other.__head])
+            windows_count = (tail_size - 1) // self.__offset + 1
+            self.__add_windows(signal, windows_count)
+
+        head_size = self.__head.shape[0]
+        if head_size < window - 1:
+            self.__head = np.concatenate(
+                [self.__head, other.__head[:window - 1 - head_size]])
+        self.__power_sum += other.__power_sum
+        self.__windows_count += other.__windows_count
+        self.__discretes_count += other.__discretes_count
+        self.__tail = other.__tail.copy()
+        self.__skip_count = other.__skip_count
+
+    def result(self) -> np.ndarray:
+        """
+        Average spectrum of processed windows
+        :return: 2D array of spectrum data
+        """
+        if self.__windows_count == 0:
+            raise ValueError('No processed windows')
+        sum_amplitudes = np.empty((self.__window // 2 + 1, 2), dtype=float)
+        sum_amplitudes[:, 0] = get_frequencies(self.__window,
+                                               self.__frequency)
+        # getting average spectrum for all windows
+        sum_amplitudes[:, 1] = self.__power_sum / self.__windows_count
+
+        # marmett filtration
+        if self.__marmett_filter > 0:
+            sum_amplitudes[:, 1] = marmett(sum_amplitudes[:, 1],
+                                           self.__marmett_filter)
+        return sum_amplitudes
+
+
 def average_spectrum(signal: np.ndarray, frequency: int, window: int,
                      offset: int, median_filter=-1,
-                     marmett_filter=-1) -> np.ndarray:
+                     marmett_filter=-1,
+                     block_size=DEFAULT_BLOCK_SIZE, taper=None,
+                     detrend=CONSTANT_DETREND, scaling=AMPLITUDE_SCALING,
+                     workers=None) -> np.ndarray:
     """
     Method for calculating average (cumulative) spectrum
     :param signal: input signal
@@ -32,37 +326,20 @@ def average_spectrum(signal: np.ndarray, frequency: int, window: int,
     :param offset: window offset (discreets)
     :param median_filter: median filtration parameter
     :param marmett_filter: marmett filtration parameter
+    :param block_size: discretes count of windows processed at once
+    :param taper: window taper (hann, kaiser, tuple for
+    scipy.signal.get_window or None - rectangular window)
+    :param detrend: detrend type of windows (constant or linear)
+    :param scaling: amplitude (squared amplitudes of spectrum) or density
+    (power spectral density, welch method normalisation)
+    :param workers: fft threads count
     :return: 2D array of spectrum data
     """
-    if median_filter % 2 == 0 or marmett_filter % 2 == 0:
-        raise Exception('Marmett and median filters must be odd')
-
-    windows_count = (signal.shape[0] - window) // offset + 1
-    # First window position
-    left_edge, right_edge = 0, window
-    selection_signal = signal[left_edge:right_edge]
-    sum_amplitudes = spectrum(selection_signal, frequency)
-    sum_amplitudes[:, 1] = np.power(sum_amplitudes[:, 1], 2)
-    # median filtration
-    if median_filter > 0:
-        sum_amplitudes[:, 1] = medfilt(sum_amplitudes[:, 1], median_filter)
-
-    # Other window positions
-    for i in range(1, windows_count):
-        left_edge, right_edge = i * offset, i * offset + window
-        selection_signal = signal[left_edge:right_edge]
-        sp_data = np.power(spectrum(selection_signal, frequency)[:, 1], 2)
-        if median_filter > 0:
-            sp_data = medfilt(sp_data, median_filter)
-        sum_amplitudes[:, 1] = sum_amplitudes[:, 1] + sp_data
-
-    # getting average spectrum for all windows
-    sum_amplitudes[:, 1] = sum_amplitudes[:, 1] / windows_count
-
-    # marmett filtration
-    if marmett_filter > 0:
-        sum_amplitudes[:, 1] = marmett(sum_amplitudes[:, 1], marmett_filter)
-    return sum_amplitudes
+    accumulator = AverageSpectrumAccumulator(
+        frequency, window, offset, median_filter, marmett_filter, block_size,
+        taper, detrend, scaling, workers)
+    accumulator.update(signal)
+    return accumulator.result()
 
 
 def cepstral_spectrum(spectrum_data, using_log=False) -> np.ndarray:
@@ -98,21 +375,35 @@ def nakamura_spectrum(components_spectrum_data, components_order='XYZ',
 
     result = np.zeros(shape=(components_spectrum_data.shape[0], 2))
     result[:, 0] = components_spectrum_data[:, 0]
-    horizontal_vector = (components_spectrum_data[:, x_index + 1] ** 2 +
-                         components_spectrum_data[:, y_index + 1] ** 2) ** 0.5
-    vertical_vector = components_spectrum_data[:, z_index + 1]
+    result[:, 1] = hv_ratio(components_spectrum_data[:, x_index + 1],
+                            components_spectrum_data[:, y_index + 1],
+                            components_spectrum_data[:, z_index + 1],
+                            spectrum_type)
+    return result
+
 
+def hv_ratio(x_spectrum: np.ndarray, y_spectrum: np.ndarray,
+             z_spectrum: np.ndarray, spectrum_type='HV') -> np.ndarray:
+    """
+    Ratio of horizontal and vertical spectra (zero if divisor is zero).
+    Input arrays are not changed
+    :param x_spectrum: array of X-component spectral amplitudes
+    :param y_spectrum: array of Y-component spectral amplitudes
+    :param z_spectrum: array of Z-component spectral amplitudes
+    :param spectrum_type: spectrum type:
+        HV - horizontal/vertical ratio
+        VH - vertical/horizontal ratio
+    :return: array of ratios (the same shape as input arrays)
+    """
+    horizontal_vector = np.hypot(x_spectrum, y_spectrum)
     if spectrum_type == 'HV':
-        bad_indexes = np.argwhere(vertical_vector == 0)
-        horizontal_vector[bad_indexes] = 0
-        vertical_vector[bad_indexes] = 1
-        result[:, 1] = horizontal_vector / vertical_vector
+        dividend, divisor = horizontal_vector, z_spectrum
     elif spectrum_type == 'VH':
-        bad_indexes = np.argwhere(horizontal_vector == 0)
-        vertical_vector[bad_indexes] = 0
-        horizontal_vector[bad_indexes] = 1
-        result[:, 1] = vertical_vector / horizontal_vector
-    return result
+        dividend, divisor = z_spectrum, horizontal_vector
+    else:
+        return np.zeros_like(horizontal_vector)
+    return np.divide(dividend, divisor, out=np.zeros_like(horizontal_vector),
+                     where=divisor != 0)
 
 
 def cepstral_spectrum_from_signal(signal: np.ndarray, frequency: int,
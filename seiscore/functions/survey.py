@@ -0,0 +1,151 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.catalog.catalog import walk_binary_files
+from seiscore.functions.spectrum import get_frequencies
+from seiscore.functions.hvsr import hvsr_by_chunks
+
+
+# stations of survey
+SURVEY_STATIONS_DTYPE = np.dtype([
+    ('longitude', np.float64), ('latitude', np.float64),
+    ('is_valid', np.bool_), ('error', 'U64')])
+
+
+class StationResult(NamedTuple):
+    path: str
+    longitude: float
+    latitude: float
+    # average H/V ratio (None if processing failed)
+    ratio: Union[np.ndarray, None]
+    error: str
+
+
+class SurveyResult(NamedTuple):
+    paths: List[str]
+    # 1D array of frequencies
+    frequencies: np.ndarray
+    # structured array of SURVEY_STATIONS_DTYPE
+    stations: np.ndarray
+    # 2D array (stations x frequencies), NaN for failed stations
+    ratios: np.ndarray
+
+
+def get_survey_paths(source: Union[str, List[str]]) -> List[str]:
+    if isinstance(source, str):
+        return sorted(x.path for x in walk_binary_files(source))
+    return list(source)
+
+
+def process_station(path: str, resample_frequency: int, window: int,
+                    offset: int, hvsr_parameters: dict) -> StationResult:
+    """
+    H/V ratio of one recording (recording is read by chunks, see
+    hvsr_by_chunks). Errors (bad header, short recording...) are returned
+    in result instead of raising
+    """
+    longitude, latitude = np.nan, np.nan
+    try:
+        binary_file = BinaryFile(path, resample_frequency,
+                                 is_use_avg_values=True)
+        longitude, latitude = binary_file.longitude, binary_file.latitude
+        result = hvsr_by_chunks(binary_file, window, offset,
+                                **hvsr_parameters)
+    except Exception as error:
+        return StationResult(path, longitude, latitude, None,
+                             f'{type(error).__name__}: {error}')
+    return StationResult(path, longitude, latitude, result.average_ratio, '')
+
+
+def hvsr_survey(source: Union[str, List[str]], resample_frequency: int,
+                window: int, offset: int, workers=None,
+                progress: Union[Callable[[int, int, StationResult], None],
+                                None] = None,
+                **hvsr_parameters) -> SurveyResult:
+    """
+    H/V ratios of survey recordings processed in process pool (every
+    worker keeps one chunk of recording in memory at a time). Failed
+    recordings are marked in stations array and do not stop processing.
+    If worker process is terminated (for example, by out of memory killer),
+    pool is recreated, recordings processed at that moment are checked
+    one by one and recording terminating worker again is marked as failed
+    :param source: folder with recordings or list of file paths
+    :param resample_frequency: frequency of all recordings
+    :param window: window size (discreets)
+    :param offset: window offset (discreets)
+    :param workers: processes count (by default - CPU count, 1 - processing
+    in current process)
+    :param progress: function called after every recording with arguments
+    (processed count, recordings count, StationResult)
+    :param hvsr_parameters: other parameters of hvsr_by_chunks function
+    :return: SurveyResult
+    """
+    paths = get_survey_paths(source)
+    frequencies = get_frequencies(window, resample_frequency).copy()
+    stations = np.zeros(len(paths), dtype=SURVEY_STATIONS_DTYPE)
+    ratios = np.full((len(paths), frequencies.shape[0]), np.nan)
+    processed_count = 0
+
+    def add_result(index: int, station_result: StationResult):
+        nonlocal processed_count
+        processed_count += 1
+        stations[index] = (station_result.longitude, station_result.latitude,
+                           station_result.ratio is not None,
+                           station_result.error)
+        if station_result.ratio is not None:
+            ratios[index] = station_result.ratio
+        if progress is not None:
+            progress(processed_count, len(paths), station_result)
+
+    def run_pool(indexes: List[int],
+                 max_workers: int) -> Tuple[List[int], List[int]]:
+        # only max_workers recordings are submitted at once, so recordings
+        # processed at the moment of pool breaking are known. Returns these
+        # recordings and not submitted ones
+        not_submitted = indexes[::-1]
+        futures = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            while not_submitted or futures:
+                while not_submitted and len(futures) < max_workers:
+                    index = not_submitted.pop()
+                    future = executor.submit(
+                        process_station, paths[index], resample_frequency,
+                        window, offset, hvsr_parameters)
+                    futures[future] = index
+                done_futures, _ = wait(futures, return_when=FIRST_COMPLETED)
+                is_broken = False
+                for future in done_futures:
+                    index = futures.pop(future)
+                    try:
+                        station_result = future.result()
+                    except BrokenProcessPool:
+                        futures[future] = index
+                        is_broken = True
+                        continue
+                    add_result(index, station_result)
+                if is_broken:
+                    return list(futures.values()), not_submitted[::-1]
+        return [], []
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        for i, path in enumerate(paths):
+            add_result(i, process_station(path, resample_frequency, window,
+                                          offset, hvsr_parameters))
+        return SurveyResult(paths, frequencies, stations, ratios)
+
+    not_processed = list(range(len(paths)))
+    while not_processed:
+        suspected, not_processed = run_pool(not_processed, workers)
+        for index in suspected:
+            if run_pool([index], 1)[0]:
+                add_result(index, StationResult(
+                    paths[index], np.nan, np.nan, None,
+                    'BrokenProcessPool: worker process was terminated'))
+    return SurveyResult(paths, frequencies, stations, ratios)
@@ -0,0 +1,13 @@
+import os
+from datetime import datetime
+
+import pytest
+
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+
+
+@pytest.fixture
+def recording_path(tmp_path) -> str:
+    path = os.path.join(tmp_path, 'st1.00')
+    create_baikal7_file(path, datetime(2026, 3, 1, 12, 0), 600, 49.1, 55.7)
+    return path
@@ -0,0 +1,315 @@
+import numpy as np
+import pytest
+from scipy.signal import firwin
+
+from seiscore.functions.filter import FIR_METHOD, IIR_METHOD
+from seiscore.functions.filter import get_filter_design
+from seiscore.functions.filter import overlap_save_filter
+from seiscore.functions.filter import FirFilterStream
+from seiscore.functions.filter import band_pass_filter
+
+from seiscore.functions.filter import marmett
+from seiscore.functions.filter import sl_function
+from seiscore.functions.filter import get_sl_coefficients
+from seiscore.functions.filter import StaLtaStream, TriggerEvent
+
+
+def marmett_loop(signal: np.ndarray, order: int) -> np.ndarray:
+    # previous implementation (one pass per loop, 1D signal only)
+    for i in range(order):
+        j = 1
+        recalculation_array = signal.copy()
+        while j < signal.shape[0] - 1:
+            recalculation_array[j] = \
+                (signal[j - 1] + signal[j + 1]) / 4 + signal[j] / 2
+            j += 1
+        recalculation_array[0] = (signal[0] + signal[1]) / 2
+        recalculation_array[-1] = (signal[-1] + signal[-2]) / 2
+        signal = recalculation_array.copy()
+    return signal
+
+
+def sl_function_loop(signal: np.ndarray, frequency: int, long_window=1.0,
+                     short_window=0.1, order=1) -> np.ndarray:
+    # previous implementation (running sums in python loop)
+    long_window = int(frequency * long_window)
+    short_window = int(frequency * short_window)
+
+    signal = np.abs(signal - np.mean(signal))
+
+    result = np.zeros_like(signal)
+    lta_sum, sta_sum = 0, 0
+    left_lim = order * long_window
+    for i in range(left_lim, signal.shape[0]):
+        if i == left_lim:
+            lta_sum = np.sum(signal[i - long_window:i])
+            sta_sum = np.sum(signal[i - short_window:i])
+        else:
+            lta_sum = lta_sum - signal[i - long_window - 1] + signal[i - 1]
+            sta_sum = sta_sum - signal[i - short_window - 1] + signal[i - 1]
+        lta = lta_sum / long_window
+        sta = sta_sum / short_window
+
+        if lta == 0:
+            val = 0
+        else:
+            val = sta / lta
+        result[i] = val
+    return result
+
+
+def create_signal(size: int) -> np.ndarray:
+    signal = np.random.randint(-1000, 1000, size=size).astype(np.int32)
+    # event
+    signal[size // 2:size // 2 + 200] *= 20
+    return signal
+
+
+@pytest.mark.parametrize('order', [1, 2, 3])
+def test_sl_function(order):
+    signal = create_signal(5000)
+    coefficients = sl_function(signal, 100, order=order)
+    expected = sl_function_loop(signal, 100, order=order)
+
+    assert coefficients.dtype == expected.dtype
+    assert np.allclose(coefficients, expected, rtol=1e-9, atol=1e-12)
+    # warm-up discretes
+    assert np.all(coefficients[:order * 100] == 0)
+    assert np.all(coefficients[order * 100:] > 0)
+
+
+def test_sl_function_zero_lta():
+    # constant part gives zero windows after mean subtraction
+    signal = np.zeros(3000)
+    signal[:1000] = np.random.uniform(-1, 1, size=1000)
+    signal[1000:] = np.mean(signal[:1000]) * 3
+    coefficients = sl_function(signal, 100)
+    expected = sl_function_loop(signal, 100)
+
+    assert np.allclose(coefficients, expected, rtol=1e-9, atol=1e-12)
+    zero_part = coefficients[1100:]
+    assert np.array_equal(zero_part == 0, expected[1100:] == 0)
+
+
+def test_sl_function_all_zero_stretch():
+    signal = create_signal(4000)
+    signal[1000:2500] = 0
+    # zero mean, so zero stretch stays zero after mean subtraction
+    signal[2500] -= np.sum(signal)
+    coefficients = sl_function(signal, 100)
+    expected = sl_function_loop(signal, 100)
+
+    assert np.allclose(coefficients, expected, rtol=1e-9, atol=1e-12)
+    # windows of zero values give zero coefficients
+    assert np.all(coefficients[1100:2501] == 0)
+    assert np.array_equal(coefficients == 0, expected == 0)
+
+
+@pytest.mark.parametrize('size', [50, 100, 101])
+def test_sl_function_short_signal(size):
+    signal = create_signal(size)
+    assert np.allclose(sl_function(signal, 100),
+                       sl_function_loop(signal, 100))
+
+
+def test_sl_coefficients_rounding_residuals():
+    # cumulative sums of large values leave residuals in windows of tiny
+    # values
+    signal = np.concatenate([np.random.uniform(0, 1e9, size=1000),
+                             np.random.uniform(0, 1e-9, size=1000)])
+    coefficients = get_sl_coefficients(signal, 100, 10, 100)
+    assert np.all(np.isfinite(coefficients))
+    assert np.all(coefficients >= 0)
+
+
+def find_events_loop(coefficients: np.ndarray, trigger_on: float,
+                     trigger_off: float):
+    events, is_triggered = [], False
+    for i, value in enumerate(coefficients):
+        if not is_triggered and value >= trigger_on:
+            is_triggered = True
+            events.append(TriggerEvent(i, True))
+        elif is_triggered and value < trigger_off:
+            is_triggered = False
+            events.append(TriggerEvent(i, False))
+    return events
+
+
+def process_by_chunks(stream: StaLtaStream, signal: np.ndarray,
+                      chunk_size: int):
+    coefficients, events = [], []
+    for left_edge in range(0, signal.shape[0], chunk_size):
+        chunk_result = stream.process(signal[left_edge:left_edge + chunk_size])
+        coefficients.append(chunk_result.coefficients)
+        events += chunk_result.events
+    return np.concatenate(coefficients), events
+
+
+@pytest.mark.parametrize('order', [1, 3])
+@pytest.mark.parametrize('chunk_size', [1, 7, 99, 1000, 10_000])
+def test_sta_lta_stream(order, chunk_size):
+    signal = create_signal(5000)
+    stream = StaLtaStream(100, order=order, mean=np.mean(signal))
+    coefficients, _ = process_by_chunks(stream, signal, chunk_size)
+
+    expected = sl_function(signal, 100, order=order)
+    assert np.allclose(coefficients, expected, rtol=1e-9, atol=1e-12)
+    assert np.all(coefficients[:order * 100] == 0)
+    assert stream.processed_discretes == signal.shape[0]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 64, 10_000, None])
+def test_sta_lta_stream_events(chunk_size):
+    signal = np.random.default_rng(0).integers(-1000, 1000, size=5000)
+    signal[2500:2700] *= 20
+    expected = find_events_loop(sl_function(signal, 100), 4, 1.5)
+    assert [x.is_on for x in expected] == [True, False]
+    assert 2500 <= expected[0].index < expected[1].index < 2700
+    if chunk_size is None:
+        # trigger is on in first chunk and off in second one
+        chunk_size = (expected[0].index + expected[1].index) // 2
+
+    stream = StaLtaStream(100, mean=np.mean(signal), trigger_on=4,
+                          trigger_off=1.5)
+    _, events = process_by_chunks(stream, signal, chunk_size)
+    assert events == expected
+    assert not stream.is_triggered
+
+
+def test_sta_lta_stream_reset():
+    signal = create_signal(3000)
+    stream = StaLtaStream(100, mean=np.mean(signal))
+    first_result = stream.process(signal).coefficients
+    stream.reset()
+    assert np.array_equal(stream.process(signal).coefficients, first_result)
+
+
+def test_sta_lta_stream_invalid_thresholds():
+    with pytest.raises(ValueError):
+        StaLtaStream(100, trigger_on=2, trigger_off=3)
+
+
+@pytest.mark.parametrize('order', [1, 3, 7])
+def test_marmett_float(order):
+    signal = np.random.default_rng(order).normal(size=500)
+    assert np.allclose(marmett(signal, order), marmett_loop(signal, order),
+                       rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('dtype', [np.int16, np.int32, np.int64])
+@pytest.mark.parametrize('order', [1, 3, 7])
+def test_marmett_integer(dtype, order):
+    # every pass is truncated to integer values
+    signal = np.random.default_rng(order).integers(-1000, 1000, size=500)
+    signal = signal.astype(dtype)
+    result = marmett(signal, order)
+    assert result.dtype == dtype
+    assert np.array_equal(result, marmett_loop(signal, order))
+
+
+@pytest.mark.parametrize('axis', [0, 1, -1])
+def test_marmett_axis(axis):
+    signals = np.random.default_rng(0).normal(size=(20, 30))
+    result = marmett(signals, 3, axis=axis)
+    expected = np.apply_along_axis(marmett_loop, axis, signals, 3)
+    assert np.allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('size', [2, 3, 4])
+@pytest.mark.parametrize('dtype', [np.float64, np.int32])
+def test_marmett_short_signal(size, dtype):
+    # kernel of all passes is longer than signal
+    signal = np.array([100, -300, 700, 50][:size], dtype=dtype)
+    result = marmett(signal, 9)
+    assert np.allclose(result, marmett_loop(signal, 9), rtol=1e-12)
+
+
+def test_marmett_invalid_order():
+    with pytest.raises(Exception):
+        marmett(np.ones(10), 2)
+
+
+def test_filter_design_cache():
+    get_filter_design.cache_clear()
+    first_design = get_filter_design(1000, 1, 10, IIR_METHOD, 4)
+    second_design = get_filter_design(1000, 1, 10, IIR_METHOD, 4)
+    assert second_design is first_design
+    cache_info = get_filter_design.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize('f_min, f_max, pass_zero', [
+    (0, 10, True), (-1, 10, True), (10, 500, False), (10, 600, False)])
+def test_filter_design_fallback(f_min, f_max, pass_zero):
+    taps = get_filter_design(1000, f_min, f_max, FIR_METHOD, 100)
+    # even taps count is increased
+    assert taps.shape == (101,)
+    cutoff = f_max if pass_zero else f_min
+    expected = firwin(101, cutoff, pass_zero=pass_zero, fs=1000)
+    assert np.allclose(taps, expected)
+
+    sos = get_filter_design(1000, f_min, f_max, IIR_METHOD, 4)
+    assert sos.shape == (2, 6)
+
+
+def test_filter_design_without_limits():
+    assert get_filter_design(1000, 0, 500, FIR_METHOD, 101) is None
+    signal = np.arange(10, dtype=np.int32)
+    result = band_pass_filter(signal, 1000, 0, 500, FIR_METHOD)
+    assert result.dtype == np.float64
+    assert np.array_equal(result, signal)
+
+
+def test_filter_design_invalid_type():
+    with pytest.raises(ValueError):
+        get_filter_design(1000, 1, 10, 'fft', 4)
+
+
+@pytest.mark.parametrize('size', [500, 4096, 10_007])
+@pytest.mark.parametrize('taps_count', [1, 31, 1025])
+def test_overlap_save_filter(size, taps_count):
+    rng = np.random.default_rng(size)
+    signal = rng.normal(size=size)
+    taps = rng.normal(size=taps_count)
+    # 'same' mode of np.convolve returns max(size, taps_count) discretes
+    delay = (taps_count - 1) // 2
+    expected = np.convolve(signal, taps)[delay:delay + size]
+    assert np.allclose(overlap_save_filter(signal, taps), expected)
+
+
+def test_overlap_save_filter_small_fft_size():
+    signal = np.random.default_rng(0).normal(size=1000)
+    taps = firwin(31, 0.1)
+    assert np.allclose(overlap_save_filter(signal, taps, fft_size=32),
+                       np.convolve(signal, taps, 'same'))
+    with pytest.raises(ValueError):
+        overlap_save_filter(signal, taps, fft_size=16)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 50, 1000, 20_000])
+def test_fir_filter_stream(chunk_size):
+    signal = np.random.default_rng(chunk_size).normal(size=10_000)
+    taps = get_filter_design(1000, 1, 10, FIR_METHOD, 1025)
+    stream = FirFilterStream(taps)
+
+    filtered_chunks = []
+    for left_edge in range(0, signal.shape[0], chunk_size):
+        filtered_chunks.append(
+            stream.process(signal[left_edge:left_edge + chunk_size]))
+    # output is delayed by half of taps count
+    assert stream.processed_discretes == signal.shape[0] - stream.delay
+    filtered_chunks.append(stream.flush())
+
+    assert np.allclose(np.concatenate(filtered_chunks),
+                       band_pass_filter(signal, 1000, 1, 10, FIR_METHOD))
+    assert stream.processed_discretes == 0
+
+
+def test_fir_filter_stream_short_signal():
+    # signal is shorter than filter delay
+    signal = np.arange(5, dtype=float)
+    taps = firwin(31, 0.1)
+    stream = FirFilterStream(taps)
+    assert stream.process(signal).shape == (0,)
+    expected = np.convolve(signal, taps)[stream.delay:stream.delay + 5]
+    assert np.allclose(stream.flush(), expected)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.functions.filter import marmett
+from seiscore.functions.hvsr import hvsr
+from seiscore.functions.spectrum import average_spectrum
+from seiscore.functions.spectrum import nakamura_spectrum
+from seiscore.functions.spectrum import spectrum
+
+
+@pytest.mark.parametrize('spectrum_type', ['HV', 'VH'])
+@pytest.mark.parametrize('median_filter, marmett_filter', [
+    (-1, -1), (7, 5)])
+@pytest.mark.parametrize('block_size', [1000, 10 ** 9])
+def test_hvsr(recording_path, spectrum_type, median_filter, marmett_filter,
+              block_size):
+    binary_file = BinaryFile(recording_path, 100, True)
+    result = hvsr(binary_file, 4000, 1000, median_filter, marmett_filter,
+                  spectrum_type, block_size)
+
+    # manual chain: average spectra of components and nakamura spectrum
+    signals = binary_file.read_signals('XYZ')
+    components_spectrum_data = np.empty((2001, 4))
+    for i in range(3):
+        spectrum_data = average_spectrum(signals[:, i], 100, 4000, 1000,
+                                         median_filter, marmett_filter)
+        components_spectrum_data[:, 0] = spectrum_data[:, 0]
+        components_spectrum_data[:, i + 1] = spectrum_data[:, 1]
+    expected = nakamura_spectrum(components_spectrum_data, 'XYZ',
+                                 spectrum_type)
+
+    assert np.array_equal(result.frequencies, expected[:, 0])
+    assert np.allclose(result.average_spectra,
+                       components_spectrum_data[:, 1:].T, rtol=1e-12)
+    assert np.allclose(result.average_ratio, expected[:, 1], rtol=1e-12)
+    assert result.windows_ratios.shape == ((60_000 - 4000) // 1000 + 1,
+                                           2001)
+
+
+def test_hvsr_windows_ratios(recording_path):
+    binary_file = BinaryFile(recording_path, 100, True)
+    result = hvsr(binary_file, 4000, 1000, marmett_filter=3)
+    signals = binary_file.read_signals('XYZ')
+    for window_index in (0, 17, 56):
+        left_edge = window_index * 1000
+        window_spectra = np.column_stack([
+            spectrum(signals[left_edge:left_edge + 4000, i], 100)[:, 1] ** 2
+            for i in range(3)])
+        window_spectra = marmett(window_spectra, 3, axis=0)
+        horizontal_spectrum = np.hypot(window_spectra[:, 0],
+                                       window_spectra[:, 1])
+        assert np.allclose(result.windows_ratios[window_index],
+                           horizontal_spectrum / window_spectra[:, 2],
+                           rtol=1e-9)
+
+
+def test_hvsr_short_recording(recording_path):
+    binary_file = BinaryFile(recording_path, 100, True)
+    with pytest.raises(ValueError):
+        hvsr(binary_file, 60_001, 1000)
+
+
+def test_nakamura_spectrum_input_unchanged():
+    components_spectrum_data = np.random.default_rng(0).random((100, 4))
+    components_spectrum_data[10, 3] = 0
+    source_data = components_spectrum_data.copy()
+    result = nakamura_spectrum(components_spectrum_data, 'XYZ', 'HV')
+    assert np.array_equal(components_spectrum_data, source_data)
+    # zero divisor gives zero ratio
+    assert result[10, 1] == 0
+    assert np.allclose(result[:, 1],
+                       np.hypot(source_data[:, 1], source_data[:, 2]) /
+                       np.where(source_data[:, 3] == 0, np.inf,
+                                source_data[:, 3]))
@@ -0,0 +1,214 @@
+import numpy as np
+import pytest
+from scipy.signal import medfilt, welch
+
+from seiscore.functions.filter import marmett
+from seiscore.functions.spectrum import spectrum
+from seiscore.functions.spectrum import median_filter_rows
+from seiscore.functions.spectrum import get_frequencies, get_taper
+from seiscore.functions.spectrum import get_power_scale
+from seiscore.functions.spectrum import DENSITY_SCALING
+from seiscore.functions.spectrum import average_spectrum
+from seiscore.functions.spectrum import AverageSpectrumAccumulator
+
+
+def average_spectrum_loop(signal: np.ndarray, frequency: int, window: int,
+                          offset: int, median_filter=-1,
+                          marmett_filter=-1) -> np.ndarray:
+    # previous implementation (spectrum of every window in python loop)
+    windows_count = (signal.shape[0] - window) // offset + 1
+    sum_amplitudes = spectrum(signal[:window], frequency)
+    sum_amplitudes[:, 1] = np.power(sum_amplitudes[:, 1], 2)
+    if median_filter > 0:
+        sum_amplitudes[:, 1] = medfilt(sum_amplitudes[:, 1], median_filter)
+
+    for i in range(1, windows_count):
+        selection_signal = signal[i * offset:i * offset + window]
+        sp_data = np.power(spectrum(selection_signal, frequency)[:, 1], 2)
+        if median_filter > 0:
+            sp_data = medfilt(sp_data, median_filter)
+        sum_amplitudes[:, 1] = sum_amplitudes[:, 1] + sp_data
+
+    sum_amplitudes[:, 1] = sum_amplitudes[:, 1] / windows_count
+    if marmett_filter > 0:
+        sum_amplitudes[:, 1] = marmett(sum_amplitudes[:, 1], marmett_filter)
+    return sum_amplitudes
+
+
+def create_signal(size: int, seed=0) -> np.ndarray:
+    return np.random.default_rng(seed).integers(-1000, 1000, size=size)
+
+
+@pytest.mark.parametrize('window, offset', [
+    (1000, 1000), (1000, 300), (1001, 500), (512, 700)])
+@pytest.mark.parametrize('median_filter, marmett_filter', [
+    (-1, -1), (7, -1), (-1, 5), (7, 5)])
+def test_average_spectrum(window, offset, median_filter, marmett_filter):
+    signal = create_signal(20_000)
+    result = average_spectrum(signal, 100, window, offset, median_filter,
+                              marmett_filter)
+    expected = average_spectrum_loop(signal, 100, window, offset,
+                                     median_filter, marmett_filter)
+    assert result.shape == expected.shape
+    assert np.array_equal(result[:, 0], expected[:, 0])
+    assert np.allclose(result[:, 1], expected[:, 1], rtol=1e-9)
+
+
+@pytest.mark.parametrize('block_size', [1, 1000, 3500, 10 ** 9])
+def test_average_spectrum_block_size(block_size):
+    # blocks of one window, several windows and all windows
+    signal = create_signal(20_000)
+    result = average_spectrum(signal, 100, 1000, 300, median_filter=5,
+                              block_size=block_size)
+    expected = average_spectrum_loop(signal, 100, 1000, 300, median_filter=5)
+    assert np.allclose(result, expected, rtol=1e-9)
+
+
+def test_average_spectrum_float_signal():
+    signal = np.random.default_rng(0).normal(size=10_000)
+    assert np.allclose(average_spectrum(signal, 100, 1000, 500),
+                       average_spectrum_loop(signal, 100, 1000, 500),
+                       rtol=1e-9)
+
+
+def test_average_spectrum_short_signal():
+    with pytest.raises(ValueError):
+        average_spectrum(create_signal(999), 100, 1000, 500)
+
+
+def test_average_spectrum_even_filters():
+    with pytest.raises(Exception):
+        average_spectrum(create_signal(2000), 100, 1000, 500,
+                         median_filter=4)
+
+
+@pytest.mark.parametrize('kernel_size', [1, 3, 7, 31])
+def test_median_filter_rows(kernel_size):
+    data = np.random.default_rng(kernel_size).normal(size=(5, 40))
+    result = median_filter_rows(data, kernel_size)
+    expected = np.array([medfilt(x, kernel_size) for x in data])
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize('taper, welch_taper', [
+    ('hann', 'hann'), ('kaiser', ('kaiser', 14)), (None, 'boxcar')])
+@pytest.mark.parametrize('detrend', ['constant', 'linear'])
+@pytest.mark.parametrize('window', [1000, 1001])
+def test_average_spectrum_density(taper, welch_taper, detrend, window):
+    signal = create_signal(20_000).astype(float)
+    offset = window // 2
+    result = average_spectrum(signal, 100, window, offset, taper=taper,
+                              detrend=detrend, scaling=DENSITY_SCALING)
+
+    frequencies, expected = welch(
+        signal, 100, welch_taper, nperseg=window, noverlap=window - offset,
+        detrend=detrend, scaling='density')
+    assert np.allclose(result[:, 0], frequencies)
+    assert np.allclose(result[:, 1], expected, rtol=1e-9)
+
+
+def test_average_spectrum_workers():
+    signal = create_signal(20_000)
+    assert np.allclose(
+        average_spectrum(signal, 100, 1000, 300, taper='hann', workers=2),
+        average_spectrum(signal, 100, 1000, 300, taper='hann'), rtol=1e-12)
+
+
+def test_average_spectrum_invalid_parameters():
+    signal = create_signal(2000)
+    with pytest.raises(ValueError):
+        average_spectrum(signal, 100, 1000, 500, detrend='quadratic')
+    with pytest.raises(ValueError):
+        average_spectrum(signal, 100, 1000, 500, scaling='spectrum')
+
+
+@pytest.mark.parametrize('cached_function, parameters', [
+    (get_frequencies, (1000, 100)), (get_taper, ('hann', 1000)),
+    (get_power_scale, (1000, 100, 'hann', DENSITY_SCALING))])
+def test_cached_arrays(cached_function, parameters):
+    cached_function.cache_clear()
+    first_array = cached_function(*parameters)
+    assert cached_function(*parameters) is first_array
+    assert cached_function.cache_info().hits == 1
+    # cached arrays are shared between calls
+    with pytest.raises(ValueError):
+        first_array[0] = 1
+
+
+def create_accumulator(signal: np.ndarray, left_edge: int, right_edge: int,
+                       chunk_size: int, window=1000,
+                       offset=300) -> AverageSpectrumAccumulator:
+    accumulator = AverageSpectrumAccumulator(100, window, offset,
+                                             median_filter=5,
+                                             start_index=left_edge)
+    for chunk_left_edge in range(left_edge, right_edge, chunk_size):
+        chunk_right_edge = min(chunk_left_edge + chunk_size, right_edge)
+        accumulator.update(signal[chunk_left_edge:chunk_right_edge])
+    return accumulator
+
+
+@pytest.mark.parametrize('chunk_size', [1, 299, 1000, 3001, 10_000])
+def test_accumulator_update(chunk_size):
+    signal = create_signal(10_000)
+    accumulator = create_accumulator(signal, 0, signal.shape[0], chunk_size)
+    assert accumulator.windows_count == 31
+    assert np.allclose(accumulator.result(),
+                       average_spectrum(signal, 100, 1000, 300,
+                                        median_filter=5), rtol=1e-12)
+
+
+def test_accumulator_merge_halves():
+    signal = create_signal(10_000)
+    first_half = create_accumulator(signal, 0, 5000, 5000)
+    second_half = create_accumulator(signal, 5000, 10_000, 5000)
+    assert first_half.windows_count + second_half.windows_count == 28
+    first_half.merge(second_half)
+    # windows crossing halves border are added by merge
+    assert first_half.windows_count == 31
+    assert first_half.stop_index == 10_000
+    assert np.allclose(first_half.result(),
+                       average_spectrum(signal, 100, 1000, 300,
+                                        median_filter=5), rtol=1e-12)
+
+
+@pytest.mark.parametrize('window, offset', [(1000, 300), (300, 1000),
+                                            (1000, 1), (1001, 1001)])
+@pytest.mark.parametrize('borders', [
+    (5000,), (100, 5000), (4999, 5000, 5001), (2000, 2600, 9500, 9999),
+    (1, 2, 3)])
+def test_accumulator_merge_parts(window, offset, borders):
+    # parts are shorter and longer than window
+    signal = create_signal(10_000, seed=len(borders))
+    edges = [0, *borders, signal.shape[0]]
+    accumulators = [
+        create_accumulator(signal, left_edge, right_edge, 777, window, offset)
+        for left_edge, right_edge in zip(edges[:-1], edges[1:])]
+    # last part is merged to previous one, so merged accumulators are merged
+    # again
+    while len(accumulators) > 1:
+        last_accumulator = accumulators.pop()
+        accumulators[-1].merge(last_accumulator)
+
+    accumulator = accumulators[0]
+    assert accumulator.windows_count == (10_000 - window) // offset + 1
+    assert np.allclose(accumulator.result(),
+                       average_spectrum(signal, 100, window, offset,
+                                        median_filter=5), rtol=1e-12)
+
+
+def test_accumulator_merge_invalid():
+    signal = create_signal(10_000)
+    first_half = create_accumulator(signal, 0, 5000, 5000)
+    with pytest.raises(ValueError):
+        first_half.merge(create_accumulator(signal, 6000, 10_000, 5000))
+    with pytest.raises(ValueError):
+        first_half.merge(AverageSpectrumAccumulator(100, 1000, 200,
+                                                    median_filter=5,
+                                                    start_index=5000))
+
+
+def test_accumulator_without_windows():
+    accumulator = AverageSpectrumAccumulator(100, 1000, 300)
+    accumulator.update(create_signal(999))
+    with pytest.raises(ValueError):
+        accumulator.result()
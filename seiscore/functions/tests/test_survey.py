@@ -0,0 +1,74 @@
+import os
+import multiprocessing
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from seiscore.binaryfile.binaryfile import BinaryFile
+from seiscore.binaryfile.tests.helpers import create_baikal7_file
+from seiscore.functions import survey
+from seiscore.functions.hvsr import hvsr
+from seiscore.functions.survey import hvsr_survey
+from seiscore.functions.survey import process_station
+
+
+@pytest.fixture
+def survey_folder(tmp_path) -> str:
+    for i, name in enumerate(('st1.00', 'st2.00', 'st3.00')):
+        create_baikal7_file(os.path.join(tmp_path, name),
+                            datetime(2026, 3, 1, 12, i), 300, 49 + i, 55 + i)
+    # recording shorter than window
+    create_baikal7_file(os.path.join(tmp_path, 'short.00'),
+                        datetime(2026, 3, 1, 12, 0), 10, 50, 56)
+    with open(os.path.join(tmp_path, 'broken.00'), 'wb') as f:
+        f.write(b'\x00' * 10)
+    return str(tmp_path)
+
+
+def process_station_with_crash(path: str, *args):
+    # worker process is terminated as by out of memory killer
+    if os.path.basename(path) == 'st2.00':
+        os._exit(1)
+    return process_station(path, *args)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_hvsr_survey(survey_folder, workers):
+    progress_calls = []
+    result = hvsr_survey(
+        survey_folder, 100, 4000, 2000, workers=workers,
+        progress=lambda *args: progress_calls.append(args[:2]),
+        median_filter=5, chunk_seconds=70)
+
+    names = [os.path.basename(x) for x in result.paths]
+    assert names == ['broken.00', 'short.00', 'st1.00', 'st2.00', 'st3.00']
+    assert list(result.stations['is_valid']) == [False, False, True, True,
+                                                 True]
+    assert result.stations['error'][1].startswith('ValueError')
+    assert np.all(np.isnan(result.ratios[:2]))
+    assert sorted(progress_calls) == [(i, 5) for i in range(1, 6)]
+
+    for i in range(2, 5):
+        binary_file = BinaryFile(result.paths[i], 100, True)
+        expected = hvsr(binary_file, 4000, 2000, median_filter=5)
+        assert np.allclose(result.ratios[i], expected.average_ratio,
+                           rtol=1e-10)
+        assert result.stations['longitude'][i] == binary_file.longitude
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='patched function is not available in workers')
+def test_hvsr_survey_broken_pool(survey_folder, monkeypatch):
+    expected = hvsr_survey(survey_folder, 100, 4000, 2000, workers=1)
+    monkeypatch.setattr(survey, 'process_station',
+                        process_station_with_crash)
+    result = hvsr_survey(survey_folder, 100, 4000, 2000, workers=2)
+
+    # only recording terminating worker is failed
+    assert list(result.stations['is_valid']) == [False, False, True, False,
+                                                 True]
+    assert result.stations['error'][3].startswith('BrokenProcessPool')
+    valid_rows = [2, 4]
+    assert np.array_equal(result.ratios[valid_rows],
+                          expected.ratios[valid_rows])
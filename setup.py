@@ -19,5 +19,8 @@ setup(
         'pywavelets==1.1.1',
         'matplotlib==3.4.2'
     ],
-    package_data={'seiscore': ['binaryfile/resampling/*.so']}
+    package_data={'seiscore': ['binaryfile/resampling/resampling*.so']},
+    # previous resampling kernel is built for benchmark only
+    exclude_package_data={
+        'seiscore': ['binaryfile/resampling/legacy_resampling*']}
 )